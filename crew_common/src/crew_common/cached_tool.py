@@ -0,0 +1,51 @@
+from typing import Any, Callable
+
+from crewai_tools import BaseTool
+
+from crew_common.tool_cache import ToolResultCache, cache_enabled, cache_key, get_tool_cache
+from crew_common.tracing import annotate
+
+
+class CachedTool(BaseTool):
+    """Wrap a crewai tool so equivalent calls are answered from a ToolResultCache.
+
+    The wrapper reuses the wrapped tool's name, description and argument
+    schema, so agents see exactly the same tool.
+    """
+    name: str = ""
+    description: str = ""
+    tool: Any
+    cache: Any
+
+    def __init__(self, tool: BaseTool, cache: ToolResultCache, **kwargs):
+        super().__init__(
+            tool=tool,
+            cache=cache,
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            **kwargs
+        )
+
+    def _generate_description(self):
+        # The wrapped tool's description has already been generated
+        pass
+
+    def _run(self, *args, **kwargs) -> Any:
+        if not cache_enabled():
+            return self.tool._run(*args, **kwargs)
+        key = cache_key(self.name, args, kwargs)
+        hit, value = self.cache.get(key)
+        annotate(**{'tool.cache_hit': hit})
+        if hit:
+            return value
+        value = self.tool._run(*args, **kwargs)
+        self.cache.set(key, value)
+        return value
+
+
+def cached_factory(tool_factory: Callable[[], BaseTool], cache_name: str, ttl: float) -> Callable[[], CachedTool]:
+    """Return a factory that builds ``tool_factory()`` wrapped in the named shared cache."""
+    def build() -> CachedTool:
+        return CachedTool(tool_factory(), cache=get_tool_cache(cache_name, ttl=ttl))
+    return build
@@ -0,0 +1,153 @@
+"""Checkpoint completed task outputs and resume failed crew runs.
+
+:func:`apply_checkpoints` saves every task's output as soon as the task
+finishes, in a checkpoint file keyed by crew name, a hash of the kickoff
+inputs and task name::
+
+    CREW_CHECKPOINT_DIR/<crew>/<inputs hash>/<task name>.json
+
+A kickoff in resume mode (``kickoff(inputs=..., resume=True)`` or
+``CREW_RESUME=1``) skips every task that has a checkpoint for the same
+inputs. It takes the saved output as the task's result instead, so later
+tasks get it as ``context`` exactly as if the task had just run. A late task
+that timed out can therefore be retried without paying again for the
+research and LLM calls before it.
+
+Once a task of a kickoff fails, that kickoff saves no more checkpoints.
+Background tasks still finishing, or tasks that ran without the failed
+task's output, would otherwise be reused as if their results were valid.
+
+A checkpoint is only used while the task's description, after the inputs
+are filled in, is unchanged. Editing a task in ``tasks.yaml`` makes it run
+again. Checkpoints are written through a temporary file and a rename, so a
+crash never leaves a truncated one behind.
+"""
+import functools
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, List, Mapping, Optional
+
+from crewai.tasks.task_output import TaskOutput
+
+DEFAULT_CHECKPOINT_DIR = '.checkpoints'
+
+
+def checkpoint_dir() -> str:
+    return os.getenv('CREW_CHECKPOINT_DIR', DEFAULT_CHECKPOINT_DIR)
+
+
+def resume_enabled() -> bool:
+    return os.getenv('CREW_RESUME', '') in ('1', 'true', 'True')
+
+
+def inputs_key(inputs: Optional[Mapping[str, Any]]) -> str:
+    """Hash kickoff inputs so equal inputs, in any key order, share checkpoints."""
+    payload = json.dumps(dict(inputs or {}), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class CheckpointStore:
+    """Task outputs on disk, one JSON file per crew, inputs hash and task.
+
+    Args:
+        directory: Root of the store, defaults to ``CREW_CHECKPOINT_DIR`` (``.checkpoints``).
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or checkpoint_dir()
+
+    def path(self, crew: str, key: str, task: str) -> str:
+        return os.path.join(self.directory, crew, key, f"{task}.json")
+
+    def load(self, crew: str, key: str, task: str) -> Optional[dict]:
+        """Return the checkpoint saved for ``task``, or ``None``."""
+        try:
+            with open(self.path(crew, key, task), encoding='utf-8') as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, crew: str, key: str, task: str, description: str, output: str) -> None:
+        path = self.path(crew, key, task)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        record = {'task': task, 'description': description, 'output': output, 'saved_at': time.time()}
+        # Write to a temporary file first so a crash never leaves a torn checkpoint
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(handle, 'w', encoding='utf-8') as temp_file:
+            json.dump(record, temp_file)
+        os.replace(temp_path, path)
+
+    def completed(self, crew: str, key: str) -> List[str]:
+        """Return the names of the tasks with a checkpoint for these inputs."""
+        directory = os.path.join(self.directory, crew, key)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(name[:-len('.json')] for name in os.listdir(directory) if name.endswith('.json'))
+
+    def clear(self, crew: str, key: Optional[str] = None) -> None:
+        """Delete the checkpoints of ``crew``, or only those for one inputs hash."""
+        shutil.rmtree(os.path.join(self.directory, crew, *([key] if key else [])), ignore_errors=True)
+
+
+def apply_checkpoints(crew: Any, name: str, task_names: List[str], store: Optional[CheckpointStore] = None) -> Any:
+    """Checkpoint every task of ``crew`` and let ``kickoff`` resume from the checkpoints.
+
+    The wrapped ``kickoff`` takes an extra ``resume`` argument, defaulting to
+    ``CREW_RESUME``. After each kickoff ``crew.resumed_tasks`` lists the tasks
+    that were skipped.
+
+    Args:
+        crew: The crewai ``Crew`` to configure, modified in place.
+        name: Crew name the checkpoints are filed under.
+        task_names: Names for the crew's tasks, in the order of ``crew.tasks``.
+        store: Where checkpoints go, defaults to a :class:`CheckpointStore` on ``CREW_CHECKPOINT_DIR``.
+
+    Returns:
+        The same crew, so ``crew()`` can ``return apply_checkpoints(Crew(...), name, names)``
+    """
+    store = store or CheckpointStore()
+    # A crew runs one kickoff at a time; its tasks read the run's key and mode from here
+    state = {'key': inputs_key(None), 'resume': False, 'failed': False}
+    object.__setattr__(crew, 'checkpoint_store', store)
+    object.__setattr__(crew, 'resumed_tasks', [])
+    kickoff = crew.kickoff
+
+    @functools.wraps(kickoff)
+    def checkpointed_kickoff(inputs: Optional[dict] = None, resume: Optional[bool] = None):
+        state['key'] = inputs_key(inputs)
+        state['resume'] = resume_enabled() if resume is None else resume
+        state['failed'] = False
+        crew.resumed_tasks.clear()
+        return kickoff(inputs=inputs)
+
+    def checkpoint_task(task, task_name):
+        execute = task._execute
+
+        @functools.wraps(execute)
+        def checkpointed_execute(agent, task, context, tools):
+            saved = store.load(name, state['key'], task_name) if state['resume'] else None
+            if saved is not None and saved['description'] == task.description:
+                task.output = TaskOutput(
+                    description=task.description, exported_output=saved['output'], raw_output=saved['output'])
+                crew.resumed_tasks.append(task_name)
+                if task.callback:
+                    task.callback(task.output)
+                return saved['output']
+            try:
+                result = execute(agent, task, context, tools)
+            except Exception:
+                state['failed'] = True
+                raise
+            if not state['failed']:
+                store.save(name, state['key'], task_name, task.description, task.output.raw_output)
+            return result
+        object.__setattr__(task, '_execute', checkpointed_execute)
+
+    for task, task_name in zip(crew.tasks, task_names):
+        checkpoint_task(task, task_name)
+    object.__setattr__(crew, 'kickoff', checkpointed_kickoff)
+    return crew
@@ -0,0 +1,177 @@
+"""Content-addressed, on-disk cache of LLM responses for recording and replaying crew runs.
+
+Every chat completion issued through LangChain (agent LLMs as well as the
+hierarchical ``manager_llm``) is keyed on a SHA-256 of the model string,
+which carries the model name and call parameters, and the serialised
+messages. Each response is stored as one JSON file under the cache
+directory.
+
+Modes, selected with ``LLM_CACHE_MODE`` or passed to :func:`enable_llm_cache`:
+
+- ``off``: no caching (default)
+- ``auto``: serve cached responses, call the LLM and record on a miss
+- ``record``: always call the LLM and overwrite the recording
+- ``replay``: only serve recordings; a miss raises :class:`LLMCacheMiss`,
+  so tests can run whole crews without network access
+
+LangChain skips the cache for streamed calls, and crewai agents stream by
+default. :func:`apply_llm_cache` makes a crew's agents, including a
+hierarchical manager, use plain calls while a cache is installed, so cached
+runs do not stream tokens. Agents outside such a crew are left alone.
+"""
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.globals import get_llm_cache, set_llm_cache
+from langchain_core.load import dumps, loads
+from langchain_core.outputs import Generation
+
+MODES = ('off', 'auto', 'record', 'replay')
+DEFAULT_CACHE_DIR = '.llm_cache'
+
+
+class LLMCacheMiss(RuntimeError):
+    """Raised in replay mode when a prompt has no recorded response."""
+
+
+class DiskLLMCache(BaseCache):
+    """LangChain cache storing one JSON file per (model, params, messages) hash.
+
+    Args:
+        directory: Directory holding the recordings.
+        mode: One of ``auto``, ``record`` or ``replay``.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, mode: str = 'auto'):
+        if mode not in MODES or mode == 'off':
+            raise ValueError(f"Unsupported LLM cache mode {mode!r}, expected one of auto, record, replay")
+        self.directory = directory
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(prompt: str, llm_string: str) -> str:
+        """Return the content address of a prompt for a given model configuration."""
+        return hashlib.sha256(json.dumps([llm_string, prompt]).encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        if self.mode == 'record':
+            return None
+        key = self.key(prompt, llm_string)
+        try:
+            with open(self._path(key), encoding='utf-8') as handle:
+                record = json.load(handle)
+        except FileNotFoundError:
+            self.misses += 1
+            if self.mode == 'replay':
+                raise LLMCacheMiss(
+                    f"No recorded LLM response for key {key}; run once with LLM_CACHE_MODE=record")
+            return None
+        self.hits += 1
+        return [loads(generation) for generation in record['generations']]
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        if self.mode == 'replay':
+            return
+        path = self._path(self.key(prompt, llm_string))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        record = {
+            'llm_string': llm_string,
+            'prompt': prompt,
+            'generations': [dumps(generation) for generation in return_val],
+        }
+        # Write to a temporary file first so concurrent runs never read a torn recording
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(handle, 'w', encoding='utf-8') as temp_file:
+            json.dump(record, temp_file)
+        os.replace(temp_path, path)
+
+    def clear(self, **kwargs: Any) -> None:
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith('.json'):
+                    os.remove(os.path.join(root, name))
+
+    def stats(self) -> dict:
+        return {'mode': self.mode, 'hits': self.hits, 'misses': self.misses}
+
+
+def enable_llm_cache(mode: Optional[str] = None, directory: Optional[str] = None) -> Optional[DiskLLMCache]:
+    """Install the disk cache as LangChain's global LLM cache.
+
+    Args:
+        mode: Cache mode, defaults to ``LLM_CACHE_MODE`` or ``off``.
+        directory: Recording directory, defaults to ``LLM_CACHE_DIR`` or ``.llm_cache``.
+
+    Returns:
+        DiskLLMCache: The installed cache, or None when the mode is ``off``
+
+    Raises:
+        ValueError: If the mode is not one of the supported modes
+    """
+    mode = mode or os.getenv('LLM_CACHE_MODE', 'off')
+    if mode not in MODES:
+        raise ValueError(f"LLM_CACHE_MODE must be one of {', '.join(MODES)}, got {mode!r}")
+    if mode == 'off':
+        set_llm_cache(None)
+        return None
+    cache = DiskLLMCache(directory or os.getenv('LLM_CACHE_DIR', DEFAULT_CACHE_DIR), mode)
+    set_llm_cache(cache)
+    return cache
+
+
+def _plain_calls(agent: Any) -> None:
+    """Make every executor ``agent`` builds call its LLM without streaming, once."""
+    if getattr(agent, '_plain_calls', False):
+        return
+    create = agent.create_agent_executor
+
+    @functools.wraps(create)
+    def create_plain_executor(tools=None):
+        create(tools=tools)
+        # crewai wraps the agent in a RunnableAgent without passing stream_runnable
+        agent.agent_executor.agent.stream_runnable = False
+    object.__setattr__(agent, 'create_agent_executor', create_plain_executor)
+    object.__setattr__(agent, '_plain_calls', True)
+
+
+def apply_llm_cache(crew: Any) -> Any:
+    """Route the LLM calls of ``crew``'s agents through the installed LLM cache.
+
+    Does nothing unless a cache is installed, for example by
+    :func:`enable_llm_cache`, when the crew is built. Agents then make plain
+    calls instead of streaming, since LangChain only caches plain calls.
+
+    Args:
+        crew: The crewai ``Crew`` to configure, modified in place.
+
+    Returns:
+        The same crew, so ``crew()`` can ``return apply_llm_cache(Crew(...))``
+    """
+    if get_llm_cache() is None:
+        return crew
+    for agent in crew.agents:
+        _plain_calls(agent)
+
+    def cache_task(task):
+        execute = task._execute
+
+        @functools.wraps(execute)
+        def cached_execute(agent, task, context, tools):
+            # Also reaches the manager agent crewai creates for hierarchical runs
+            _plain_calls(agent)
+            return execute(agent, task, context, tools)
+        object.__setattr__(task, '_execute', cached_execute)
+
+    for task in crew.tasks:
+        cache_task(task)
+    return crew
@@ -0,0 +1,62 @@
+"""Wrap a freshly built crew with the shared instrumentation in one call.
+
+Every crew's ``crew()`` method ends with :func:`prepare_crew`, so checkpoints,
+report streaming, the LLM cache, run-mode logging and tracing are layered in
+the same order for all of them::
+
+    return prepare_crew(Crew(...), 'financial_agent', task_names(self), checkpoints=True)
+
+Layers are applied innermost first: checkpoints, report streaming, the
+crew's own ``wrappers`` (such as the financial crew's budget), the LLM
+cache, run mode and finally tracing, so a traced kickoff covers everything
+below it.
+
+:func:`task_names` names the tasks the ``@crew`` decorator built, reading the
+crew class's own ``@task`` methods rather than crewai's global task list.
+"""
+from typing import Any, Callable, List, Sequence
+
+from crew_common.checkpoint import apply_checkpoints
+from crew_common.llm_cache import apply_llm_cache
+from crew_common.report_stream import stream_reports
+from crew_common.run_mode import apply_run_mode
+from crew_common.tracing import instrument_crew
+
+
+def task_names(instance: Any) -> List[str]:
+    """Return the names of the ``@task`` methods of ``instance``'s class, in definition order.
+
+    This is the order ``@crew`` builds ``self.tasks`` in, so the names line up
+    with the tasks. Methods of base classes come first; an override keeps the
+    base class's position.
+    """
+    names = {}
+    for cls in reversed(type(instance).__mro__):
+        for name, value in vars(cls).items():
+            if getattr(value, 'is_task', False):
+                names.setdefault(name, None)
+    return list(names)
+
+
+def prepare_crew(crew: Any, name: str, task_names: List[str], checkpoints: bool = False, reports: bool = False,
+                 wrappers: Sequence[Callable[[Any], Any]] = ()) -> Any:
+    """Apply the shared crew wrappers to ``crew``.
+
+    Args:
+        crew: The crewai ``Crew`` to configure, modified in place.
+        name: Crew name used for checkpoints, log records and the trace service.
+        task_names: Names for the crew's tasks, in the order of ``crew.tasks``.
+        checkpoints: Checkpoint each task so ``kickoff(resume=True)`` can skip finished ones.
+        reports: Stream each task's final answer to ``CREW_REPORT_DIR``.
+        wrappers: Crew-specific wrappers, each taking and returning the crew, applied in order.
+
+    Returns:
+        The same crew, ready to ``kickoff``
+    """
+    if checkpoints:
+        crew = apply_checkpoints(crew, name, task_names)
+    if reports:
+        crew = stream_reports(crew, task_names)
+    for wrapper in wrappers:
+        crew = wrapper(crew)
+    return instrument_crew(apply_run_mode(apply_llm_cache(crew), name), name=name)
@@ -0,0 +1,219 @@
+"""Stream task outputs to per-run files while the agents write them.
+
+:func:`stream_reports` gives every kickoff its own directory,
+``CREW_REPORT_DIR/<run id>/`` (default ``runs/``), and every task a file in
+it named after the task:
+
+- while the task runs, the agent's final answer is appended to
+  ``<task name>.md.part`` token by token as the LLM streams it, so a long
+  report can be read while it is still being written;
+- when the task finishes, the file holds the task's exact output and is
+  renamed to ``<task name>.md``, so a file without ``.part`` is always complete.
+
+Only the text after ``Final Answer:`` is streamed. Thoughts and tool calls
+from earlier agent steps never reach the file. A task that fails keeps its
+``.part`` file.
+
+A task's ``output_file`` is written atomically too: through a temporary file
+renamed over the target. Readers never see a half written report.
+"""
+import functools
+import os
+import secrets
+import tempfile
+import threading
+import time
+from typing import Any, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+DEFAULT_REPORT_DIR = 'runs'
+FINAL_ANSWER = 'Final Answer:'
+PART_SUFFIX = '.part'
+
+_local = threading.local()
+
+
+def report_dir() -> str:
+    return os.getenv('CREW_REPORT_DIR', DEFAULT_REPORT_DIR)
+
+
+def write_atomically(path: str, content: str) -> None:
+    """Replace ``path`` with ``content`` in one rename, creating its directory if needed."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'w', encoding='utf-8') as temp_file:
+            temp_file.write(content)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class ReportStream:
+    """One task's output file, appended to while the task runs.
+
+    Args:
+        path: Where the finished output ends up; it is written to ``path + '.part'`` until then.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.part_path = path + PART_SUFFIX
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(self.part_path, 'w', encoding='utf-8')
+        self._written: List[str] = []
+        self._seen = ''
+        self._answering = False
+
+    def begin(self) -> None:
+        """Start a new LLM generation; only its final answer belongs in the file."""
+        self._seen = ''
+        self._answering = False
+        if self._written:
+            # An earlier answer was rejected and the agent is trying again
+            self._file.seek(0)
+            self._file.truncate()
+            self._written.clear()
+
+    def feed(self, token: str) -> None:
+        """Append ``token`` if the generation has reached its final answer."""
+        if not self._answering:
+            self._seen += token
+            start = self._seen.find(FINAL_ANSWER)
+            if start < 0:
+                return
+            self._answering = True
+            token = self._seen[start + len(FINAL_ANSWER):]
+        if not self._written:
+            token = token.lstrip()
+        if token:
+            self._file.write(token)
+            self._file.flush()
+            self._written.append(token)
+
+    def finish(self, output: Any) -> str:
+        """Make the file hold ``output`` exactly, then rename it into place.
+
+        Returns:
+            str: The finished file's path
+        """
+        content = str(output)
+        if ''.join(self._written) != content:
+            self._file.seek(0)
+            self._file.truncate()
+            self._file.write(content)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self.part_path, self.path)
+        return self.path
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def current_stream() -> Optional[ReportStream]:
+    """The stream of the task running on this thread, if any."""
+    return getattr(_local, 'stream', None)
+
+
+class ReportStreamHandler(BaseCallbackHandler):
+    """LangChain callback handler feeding streamed tokens to the current thread's task stream."""
+
+    def on_llm_start(self, serialized, prompts, **kwargs) -> None:
+        stream = current_stream()
+        if stream is not None:
+            stream.begin()
+
+    def on_chat_model_start(self, serialized, messages, **kwargs) -> None:
+        self.on_llm_start(serialized, [], **kwargs)
+
+    def on_llm_new_token(self, token: str, **kwargs) -> None:
+        stream = current_stream()
+        if stream is not None:
+            stream.feed(token)
+
+
+_handler = ReportStreamHandler()
+
+
+def _add_handler(llm: Any) -> None:
+    callbacks = llm.callbacks if isinstance(llm.callbacks, list) else []
+    if _handler not in callbacks:
+        llm.callbacks = callbacks + [_handler]
+
+
+class ReportSink:
+    """Where a crew's kickoffs write their task files.
+
+    Args:
+        directory: Parent of the per-run directories, defaults to ``CREW_REPORT_DIR``.
+
+    Attributes:
+        run_dir: Directory of the current or latest kickoff, ``None`` before the first.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or report_dir()
+        self.run_dir: Optional[str] = None
+
+    def start_run(self) -> str:
+        run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(3)}"
+        self.run_dir = os.path.join(self.directory, run_id)
+        os.makedirs(self.run_dir, exist_ok=True)
+        return self.run_dir
+
+    def open(self, task_name: str) -> ReportStream:
+        return ReportStream(os.path.join(self.run_dir or self.start_run(), f"{task_name}.md"))
+
+
+def stream_reports(crew: Any, task_names: List[str], sink: Optional[ReportSink] = None) -> Any:
+    """Stream every task's output of ``crew`` to per-run files and write ``output_file`` atomically.
+
+    Args:
+        crew: The crewai ``Crew`` to configure, modified in place.
+        task_names: Names for the crew's tasks, in the order of ``crew.tasks``.
+        sink: Where the files go, defaults to a :class:`ReportSink` on ``CREW_REPORT_DIR``.
+
+    Returns:
+        The same crew, so ``crew()`` can ``return stream_reports(Crew(...), names)``
+    """
+    sink = sink or ReportSink()
+    object.__setattr__(crew, 'report_sink', sink)
+    kickoff = crew.kickoff
+
+    @functools.wraps(kickoff)
+    def streamed_kickoff(*args, **kwargs):
+        sink.start_run()
+        return kickoff(*args, **kwargs)
+
+    def stream_task(task, name):
+        execute = task._execute
+
+        @functools.wraps(execute)
+        def streamed_execute(agent, task, context, tools):
+            _add_handler(agent.llm)
+            stream = sink.open(name)
+            previous, _local.stream = current_stream(), stream
+            try:
+                result = execute(agent, task, context, tools)
+            except BaseException:
+                stream.close()
+                raise
+            finally:
+                _local.stream = previous
+            stream.finish(task.output.raw_output if task.output is not None else result)
+            return result
+        object.__setattr__(task, '_execute', streamed_execute)
+        object.__setattr__(task, '_save_file', lambda content: write_atomically(task.output_file, str(content)))
+
+    for task, name in zip(crew.tasks, task_names):
+        stream_task(task, name)
+    object.__setattr__(crew, 'kickoff', streamed_kickoff)
+    return crew
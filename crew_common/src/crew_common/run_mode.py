@@ -0,0 +1,267 @@
+"""Development and production run modes shared by the crews.
+
+``CREW_RUN_MODE`` selects how a crew reports what its agents are doing:
+
+- ``dev`` (default): the usual crewai console output, ``verbose=2`` on the
+  crew and ``verbose=True`` on every agent;
+- ``prod``: no console output from the crew. What crewai still prints
+  during a kickoff, such as tool results and errors, is routed to the log,
+  as are the crew's steps and task results. Other output of the process is
+  left alone.
+
+In both modes the crew logs to a structured, rotating file through the
+``crew`` logger, which crew packages log under as well. Records are
+handed to a background thread through a queue, so logging never waits on
+disk, and written in batches. Settings:
+
+- ``CREW_LOG_FILE``: log path, default ``logs/crew.log``;
+- ``CREW_LOG_LEVEL``: lowest level written, default ``DEBUG`` in dev and
+  ``INFO`` in prod. Agent steps and console output are logged at ``DEBUG``,
+  task results and kickoffs at ``INFO``;
+- ``CREW_LOG_MAX_BYTES`` and ``CREW_LOG_BACKUPS``: rotation size and number
+  of old files kept, default 10 MB and 5;
+- ``CREW_LOG_BUFFER``: records held before a write, default 100. Errors and
+  the end of every kickoff flush the buffer.
+"""
+import atexit
+import contextlib
+import functools
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Iterator, Optional
+
+MODES = ('dev', 'prod')
+LOGGER_NAME = 'crew'
+DEFAULT_LOG_FILE = os.path.join('logs', 'crew.log')
+PREVIEW_CHARS = 500
+
+logger = logging.getLogger(LOGGER_NAME)
+console_logger = logger.getChild('console')
+
+_ANSI = re.compile(r'\x1b\[[0-9;]*m')
+_lock = threading.Lock()
+_listener: Optional[logging.handlers.QueueListener] = None
+_buffer: Optional['BufferingHandler'] = None
+_redirects = 0
+_printer_print = None
+
+
+def run_mode() -> str:
+    """Return the run mode named by ``CREW_RUN_MODE``."""
+    mode = os.getenv('CREW_RUN_MODE', 'dev')
+    if mode not in MODES:
+        raise ValueError(f"CREW_RUN_MODE must be one of {', '.join(MODES)}, got {mode!r}")
+    return mode
+
+
+def crew_verbosity() -> int:
+    """``verbose`` for ``Crew``: 2 in dev, 0 in prod."""
+    return 2 if run_mode() == 'dev' else 0
+
+
+def agent_verbose() -> bool:
+    """``verbose`` for ``Agent``: on in dev, off in prod."""
+    return run_mode() == 'dev'
+
+
+def _preview(value: Any) -> str:
+    text = str(value)
+    return text if len(text) <= PREVIEW_CHARS else f"{text[:PREVIEW_CHARS]}..."
+
+
+class BufferingHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes when it receives a flush marker from :func:`flush_logging`."""
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        done = getattr(record, 'flushed', None)
+        if done is None:
+            return super().handle(record)
+        self.flush()
+        done.set()
+        return False
+
+
+class JsonFormatter(logging.Formatter):
+    """Format a record as one JSON object, merging in the ``fields`` passed as ``extra``."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        entry.update(getattr(record, 'fields', {}))
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging() -> logging.Logger:
+    """Attach the queued, buffered, rotating JSON file handler to the crew logger, once."""
+    global _listener, _buffer
+    with _lock:
+        if _listener is not None:
+            return logger
+        path = os.getenv('CREW_LOG_FILE', DEFAULT_LOG_FILE)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            path,
+            maxBytes=int(os.getenv('CREW_LOG_MAX_BYTES', str(10 * 1024 * 1024))),
+            backupCount=int(os.getenv('CREW_LOG_BACKUPS', '5')),
+            encoding='utf-8',
+        )
+        file_handler.setFormatter(JsonFormatter())
+        _buffer = BufferingHandler(
+            int(os.getenv('CREW_LOG_BUFFER', '100')), flushLevel=logging.ERROR, target=file_handler)
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(records, _buffer)
+        _listener.start()
+        logger.addHandler(logging.handlers.QueueHandler(records))
+        logger.setLevel(os.getenv('CREW_LOG_LEVEL', 'DEBUG' if run_mode() == 'dev' else 'INFO').upper())
+        logger.propagate = False
+        atexit.register(shutdown_logging)
+        return logger
+
+
+def flush_logging(timeout: float = 5.0) -> None:
+    """Write every record logged so far."""
+    with _lock:
+        listener = _listener
+    if listener is None:
+        return
+    # The marker queues behind every earlier record and the writer thread flushes when it gets there
+    done = threading.Event()
+    listener.queue.put_nowait(logging.makeLogRecord({'flushed': done}))
+    done.wait(timeout)
+
+
+def shutdown_logging() -> None:
+    """Stop the background writer, flush and close the log file."""
+    global _listener, _buffer
+    with _lock:
+        listener, buffer = _listener, _buffer
+        _listener = _buffer = None
+    if listener is None:
+        return
+    for handler in [handler for handler in logger.handlers if isinstance(handler, logging.handlers.QueueHandler)]:
+        logger.removeHandler(handler)
+    listener.stop()
+    target = buffer.target
+    buffer.close()
+    target.close()
+
+
+def _log_print(printer: Any, content: str, color: Optional[str] = None) -> None:
+    for line in _ANSI.sub('', str(content)).splitlines():
+        if line.strip():
+            console_logger.debug(line.rstrip())
+
+
+@contextlib.contextmanager
+def console_to_log() -> Iterator[None]:
+    """Route crewai's console printer to the log until every overlapping kickoff has finished.
+
+    Only crewai's ``Printer`` is rerouted, not ``sys.stdout``, so anything else
+    the process prints meanwhile, such as another thread's progress lines,
+    still reaches the console.
+    """
+    global _redirects, _printer_print
+    from crewai.utilities.printer import Printer
+    with _lock:
+        if _redirects == 0:
+            _printer_print, Printer.print = Printer.print, _log_print
+        _redirects += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _redirects -= 1
+            if _redirects == 0:
+                Printer.print, _printer_print = _printer_print, None
+
+
+def _log_step(output: Any) -> None:
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    # A finished step is an AgentFinish, otherwise a list of (action, observation) pairs
+    if not isinstance(output, list):
+        logger.debug('agent finished', extra={'fields': {
+            'event': 'agent_finish', 'output': _preview(getattr(output, 'return_values', {}).get('output', output))}})
+        return
+    for action, observation in output:
+        logger.debug('agent step', extra={'fields': {
+            'event': 'agent_step',
+            'tool': action.tool,
+            'tool_input': _preview(action.tool_input),
+            'thought': _preview(action.log),
+            'observation': _preview(observation),
+        }})
+
+
+def _log_task(output: Any) -> None:
+    logger.info('task completed', extra={'fields': {
+        'event': 'task_completed',
+        'task': output.description.strip().splitlines()[0] if output.description else '',
+        'output_chars': len(str(output.raw_output)),
+        'output': _preview(output.raw_output),
+    }})
+
+
+def _chain(first, second):
+    if second is None:
+        return first
+
+    def callback(output):
+        first(output)
+        second(output)
+    return callback
+
+
+def apply_run_mode(crew: Any, name: Optional[str] = None) -> Any:
+    """Log ``crew``'s steps, task results and kickoffs, and silence its console in prod.
+
+    Args:
+        crew: The crewai ``Crew`` to configure, modified in place.
+        name: Crew name recorded on the kickoff records.
+
+    Returns:
+        The same crew, so ``crew()`` can ``return apply_run_mode(Crew(...))``
+    """
+    configure_logging()
+    mode = run_mode()
+    crew.step_callback = _chain(_log_step, crew.step_callback)
+    crew.task_callback = _chain(_log_task, crew.task_callback)
+    kickoff = crew.kickoff
+    fields = {'mode': mode, 'crew': name} if name else {'mode': mode}
+
+    @functools.wraps(kickoff)
+    def logged_kickoff(*args, **kwargs):
+        logger.info('kickoff started', extra={'fields': dict(fields, event='kickoff_started')})
+        started = time.perf_counter()
+        status = 'error'
+        try:
+            with console_to_log() if mode == 'prod' else contextlib.nullcontext():
+                result = kickoff(*args, **kwargs)
+            status = 'ok'
+            return result
+        except BaseException:
+            logger.exception('kickoff failed', extra={'fields': dict(fields, event='kickoff_failed')})
+            raise
+        finally:
+            logger.info('kickoff finished', extra={'fields': dict(
+                fields, event='kickoff_finished', status=status, elapsed_s=round(time.perf_counter() - started, 3))})
+            flush_logging()
+
+    object.__setattr__(crew, 'kickoff', logged_kickoff)
+    return crew
@@ -0,0 +1,218 @@
+"""TTL + LRU cache for tool results, shared across agents and runs.
+
+Agents in a crew often repeat the same web search or scrape the same page,
+both within one run and across runs. :class:`ToolResultCache` stores tool
+outputs keyed on the tool name and its normalised arguments, expires them
+after a per-cache TTL and evicts the least recently used in-memory entry
+once ``max_entries`` is reached. It can also persist every entry as its own
+content-addressed JSON file, which lets later runs start warm and lets
+several worker processes share one cache directory. Expired files are
+deleted as new entries are written, at most once per TTL.
+
+Arguments are normalised by collapsing whitespace and canonicalising URLs.
+Only the arguments named in ``CASE_INSENSITIVE_ARGS``, such as search
+queries, are also casefolded; paths, IDs and URL paths keep their case.
+
+Caches are shared per process through :func:`get_tool_cache`. Set
+``TOOL_CACHE_DIR`` to persist them on disk and ``TOOL_CACHE_DISABLED=1`` to
+bypass caching entirely.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_TTL = 3600.0
+DEFAULT_MAX_ENTRIES = 256
+# Keyword arguments whose case does not change the tool's result
+CASE_INSENSITIVE_ARGS = frozenset({'search_query'})
+
+_caches: Dict[str, 'ToolResultCache'] = {}
+_caches_lock = threading.Lock()
+
+
+def normalize_url(url: str) -> str:
+    """Canonicalise a URL: lowercase scheme and host, sorted query, no fragment or trailing slash."""
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+
+def normalize_value(value: Any, casefold: bool = False) -> Any:
+    """Normalise one tool argument so trivially different calls share a cache entry.
+
+    Strings have their whitespace collapsed and URLs are canonicalised;
+    ``casefold`` also ignores case, for arguments where it does not matter.
+    """
+    if isinstance(value, str):
+        stripped = value.strip()
+        if re.match(r'^https?://', stripped, re.IGNORECASE):
+            return normalize_url(stripped)
+        normalized = ' '.join(stripped.split())
+        return normalized.casefold() if casefold else normalized
+    return value
+
+
+def cache_key(tool_name: str, args: tuple, kwargs: dict) -> str:
+    """Build a stable cache key from a tool name and its call arguments."""
+    payload = {
+        'args': [normalize_value(arg) for arg in args],
+        'kwargs': {key: normalize_value(value, key in CASE_INSENSITIVE_ARGS) for key, value in kwargs.items()},
+    }
+    return f"{tool_name}:{json.dumps(payload, sort_keys=True, default=str)}"
+
+
+class ToolResultCache:
+    """Thread-safe, size-bounded LRU cache whose entries expire after ``ttl`` seconds.
+
+    Args:
+        ttl: Seconds an entry stays valid.
+        max_entries: Maximum number of in-memory entries before the least recently used is evicted.
+        directory: Optional directory holding one JSON file per entry. Memory
+            misses fall through to it, so processes sharing the directory
+            share results.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES, directory: Optional[str] = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_prune = 0.0
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return ``(True, value)`` on a fresh hit, ``(False, None)`` otherwise."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self.directory:
+                entry = self._read(key)
+                if entry is not None:
+                    self._remember(key, entry)
+            if entry is not None and entry[0] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry if full."""
+        entry = (time.time() + self.ttl, value)
+        with self._lock:
+            self._remember(key, entry)
+            if self.directory:
+                self._write(key, entry)
+                if time.time() >= self._next_prune:
+                    self._prune()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self.directory and os.path.isdir(self.directory):
+                for name in os.listdir(self.directory):
+                    if name.endswith('.json'):
+                        os.remove(os.path.join(self.directory, name))
+
+    def prune(self) -> int:
+        """Delete the expired entries persisted in ``directory`` and return how many were removed."""
+        with self._lock:
+            return self._prune()
+
+    def stats(self) -> dict:
+        """Return hit, miss and eviction counters plus the current in-memory size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def _remember(self, key: str, entry: Tuple[float, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json")
+
+    def _read(self, key: str) -> Optional[Tuple[float, Any]]:
+        try:
+            with open(self._path(key), encoding='utf-8') as handle:
+                record = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        return record['expires_at'], record['value']
+
+    def _prune(self) -> int:
+        # Nothing written since the last prune can expire before another TTL has passed
+        self._next_prune = time.time() + self.ttl
+        if not self.directory or not os.path.isdir(self.directory):
+            return 0
+        removed = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, encoding='utf-8') as handle:
+                    expires_at = json.load(handle)['expires_at']
+                if expires_at <= time.time():
+                    os.remove(path)
+                    removed += 1
+            except (OSError, ValueError, KeyError, TypeError):
+                # Another process removed or is replacing it
+                continue
+        return removed
+
+    def _write(self, key: str, entry: Tuple[float, Any]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        record = {'key': key, 'expires_at': entry[0], 'value': entry[1]}
+        # Write to a temporary file first so readers in other processes never see a torn entry
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(handle, 'w', encoding='utf-8') as temp_file:
+            json.dump(record, temp_file)
+        os.replace(temp_path, self._path(key))
+
+
+def get_tool_cache(name: str, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES) -> ToolResultCache:
+    """Return the process-wide cache called ``name``, creating it on first use.
+
+    ``TOOL_CACHE_<NAME>_TTL`` overrides ``ttl`` and ``TOOL_CACHE_DIR`` turns on
+    persistence under ``<dir>/<name>/``.
+    """
+    with _caches_lock:
+        if name not in _caches:
+            ttl = float(os.getenv(f"TOOL_CACHE_{name.upper()}_TTL", ttl))
+            cache_dir = os.getenv('TOOL_CACHE_DIR', '')
+            directory = os.path.join(cache_dir, name) if cache_dir else None
+            _caches[name] = ToolResultCache(ttl=ttl, max_entries=max_entries, directory=directory)
+        return _caches[name]
+
+
+def cache_enabled() -> bool:
+    return os.getenv('TOOL_CACHE_DISABLED', '') not in ('1', 'true', 'True')
+
+
+def cache_stats() -> Dict[str, dict]:
+    """Return the stats of every cache created in this process, keyed by name."""
+    with _caches_lock:
+        caches = dict(_caches)
+    return {name: cache.stats() for name, cache in caches.items()}
@@ -0,0 +1,61 @@
+"""Per-process registry of lazily constructed tools.
+
+Crew modules register a factory per tool name at import time, which is
+cheap, and the tool itself is only built the first time an agent asks for
+it. Every crew instance in the process then shares that one tool.
+
+Example:
+
+    register_tool('search', cached_factory(SerperDevTool, 'search', ttl=3600))
+
+    class MyCrew():
+        search_tool = lazy_tool('search')
+"""
+import functools
+import threading
+from typing import Any, Callable, Dict, List
+
+_factories: Dict[str, Callable[[], Any]] = {}
+_tools: Dict[str, Any] = {}
+_lock = threading.RLock()
+
+
+def register_tool(name: str, factory: Callable[[], Any]) -> None:
+    """Register how to build the tool called ``name``, replacing any earlier factory and instance."""
+    with _lock:
+        _factories[name] = factory
+        _tools.pop(name, None)
+
+
+def get_tool(name: str) -> Any:
+    """Return the process-wide tool called ``name``, building it on first use."""
+    with _lock:
+        if name not in _tools:
+            if name not in _factories:
+                raise KeyError(f"No tool registered as {name!r}")
+            _tools[name] = _factories[name]()
+        return _tools[name]
+
+
+def built_tools() -> List[str]:
+    """Return the names of the tools built so far in this process."""
+    with _lock:
+        return list(_tools)
+
+
+def reset_tools() -> None:
+    """Forget every built tool so the next access builds it again."""
+    with _lock:
+        _tools.clear()
+
+
+def lazy_tool(name: str) -> functools.cached_property:
+    """Class attribute resolving to the registered tool ``name`` on first access.
+
+    Assigning the attribute on an instance still overrides the tool, which is
+    how tests swap in stand-ins.
+    """
+    def resolve(self) -> Any:
+        return get_tool(name)
+    resolve.__doc__ = f"The shared {name!r} tool, built on first access."
+    return functools.cached_property(resolve)
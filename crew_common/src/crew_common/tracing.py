@@ -0,0 +1,386 @@
+"""Structured tracing of crew kickoffs, exported as JSONL or OTLP/JSON files.
+
+:func:`instrument_crew` is the one hook a crew needs: wrap the ``Crew`` built
+in ``crew()`` with it and every kickoff records a tree of spans::
+
+    crew.kickoff
+      task                      one per task execution, on its own thread if async
+        agent.step              one thought/action/observation iteration
+          llm                   model, prompt/response bytes, tokens, cache hit
+          tool                  tool name, input/output bytes, cache hit
+
+Spans are written when the kickoff ends, to the file named by
+``CREW_TRACE_FILE`` in the format named by ``CREW_TRACE_FORMAT``:
+
+- ``jsonl`` (default): one span per line with its parent, timings and attributes;
+- ``otlp``: one OTLP/JSON ``ExportTraceServiceRequest`` per line, the format
+  read by the OpenTelemetry collector's ``otlpjsonfile`` receiver.
+
+Without ``CREW_TRACE_FILE`` the crew is returned untouched. Token counts
+come from the provider's usage report. Agents stream their calls, which
+carry no report, so their ``llm`` spans count the streamed chunks (one
+token each for OpenAI) as completion tokens instead. Responses served from
+LangChain's cache come back without the provider's report, which is how
+``llm`` spans tell cache hits apart; tools can flag their own hits with
+:func:`annotate`.
+"""
+import functools
+import json
+import os
+import secrets
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+FORMATS = ('jsonl', 'otlp')
+SERVICE_NAME = 'crew'
+
+# OTLP span kinds and status codes
+_KIND_INTERNAL = 1
+_KIND_CLIENT = 3
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+_local = threading.local()
+
+
+def _stack() -> List['Span']:
+    if not hasattr(_local, 'spans'):
+        _local.spans = []
+    return _local.spans
+
+
+def _size(value: Any) -> int:
+    return len(str(value).encode('utf-8'))
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str] = None, attributes: Optional[dict] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.attributes: Dict[str, Any] = {}
+        self.set(**(attributes or {}))
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update((key, value) for key, value in attributes.items() if value is not None)
+
+    def to_dict(self) -> dict:
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'start_ns': self.start_ns,
+            'end_ns': self.end_ns,
+            'duration_ms': round((self.end_ns - self.start_ns) / 1e6, 3),
+            'status': 'error' if self.error else 'ok',
+            'error': self.error,
+            'attributes': self.attributes,
+        }
+
+
+def _otlp_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+def _otlp_span(span: Span) -> dict:
+    otlp = {
+        'traceId': span.trace_id,
+        'spanId': span.span_id,
+        'name': span.name,
+        'kind': _KIND_CLIENT if span.name in ('llm', 'tool') else _KIND_INTERNAL,
+        'startTimeUnixNano': str(span.start_ns),
+        'endTimeUnixNano': str(span.end_ns),
+        'attributes': [{'key': key, 'value': _otlp_value(value)} for key, value in span.attributes.items()],
+        'status': {'code': _STATUS_ERROR, 'message': span.error} if span.error else {'code': _STATUS_OK},
+    }
+    if span.parent_id:
+        otlp['parentSpanId'] = span.parent_id
+    return otlp
+
+
+class Tracer:
+    """Collect finished spans and append them to a trace file.
+
+    Args:
+        path: File the spans are appended to.
+        format: ``jsonl`` or ``otlp``.
+        service: Service name recorded in OTLP resources.
+    """
+
+    def __init__(self, path: str, format: str = 'jsonl', service: str = SERVICE_NAME):
+        if format not in FORMATS:
+            raise ValueError(f"CREW_TRACE_FORMAT must be one of {', '.join(FORMATS)}, got {format!r}")
+        self.path = path
+        self.format = format
+        self.service = service
+        self._finished: List[Span] = []
+        self._lock = threading.Lock()
+
+    def start_span(self, name: str, parent: Optional[Span] = None, **attributes: Any) -> Span:
+        """Start a span under ``parent``, or under this thread's current span."""
+        stack = _stack()
+        parent = parent or (stack[-1] if stack else None)
+        trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        span = Span(name, trace_id, parent.span_id if parent else None, attributes)
+        stack.append(span)
+        return span
+
+    def end_span(self, span: Span, error: Optional[BaseException] = None) -> None:
+        """End ``span`` and any span this thread left open inside it."""
+        stack = _stack()
+        if span in stack:
+            for child in reversed(stack[stack.index(span) + 1:]):
+                self._finish(child, error)
+            del stack[stack.index(span):]
+        self._finish(span, error)
+
+    def _finish(self, span: Span, error: Optional[BaseException]) -> None:
+        if span.end_ns is not None:
+            return
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        with self._lock:
+            self._finished.append(span)
+
+    def flush(self) -> None:
+        """Append every finished span to the trace file."""
+        with self._lock:
+            spans, self._finished = self._finished, []
+        if not spans:
+            return
+        if self.format == 'jsonl':
+            lines = [json.dumps(span.to_dict()) for span in spans]
+        else:
+            lines = [json.dumps({'resourceSpans': [{
+                'resource': {'attributes': [{'key': 'service.name', 'value': {'stringValue': self.service}}]},
+                'scopeSpans': [{'scope': {'name': __name__}, 'spans': [_otlp_span(span) for span in spans]}],
+            }]})]
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock, open(self.path, 'a', encoding='utf-8') as handle:
+            handle.write(''.join(f"{line}\n" for line in lines))
+
+
+_tracers: Dict[tuple, Tracer] = {}
+_tracers_lock = threading.Lock()
+
+
+def tracer_from_env(service: str = SERVICE_NAME) -> Optional[Tracer]:
+    """Return the process-wide tracer of ``service`` configured by ``CREW_TRACE_FILE``, or None."""
+    path = os.getenv('CREW_TRACE_FILE', '')
+    if not path:
+        return None
+    key = (path, os.getenv('CREW_TRACE_FORMAT', 'jsonl'), service)
+    with _tracers_lock:
+        if key not in _tracers:
+            _tracers[key] = Tracer(*key)
+        return _tracers[key]
+
+
+def current_span() -> Optional[Span]:
+    """Return the innermost span open on this thread."""
+    stack = _stack()
+    return stack[-1] if stack else None
+
+
+def annotate(**attributes: Any) -> None:
+    """Add attributes to the innermost span on this thread, if tracing is on."""
+    span = current_span()
+    if span is not None:
+        span.set(**attributes)
+
+
+class TraceCallbackHandler(BaseCallbackHandler):
+    """LangChain callback handler turning LLM calls and agent actions into spans."""
+
+    def __init__(self, tracer: Tracer):
+        self.tracer = tracer
+        self._llm_spans: Dict[UUID, Span] = {}
+        self._chunks: Dict[UUID, int] = {}
+
+    def _step(self) -> Span:
+        # A step opens with its first LLM call; an LLM call inside a tool
+        # (a delegated co-worker) opens a nested step under that tool
+        span = current_span()
+        if span is not None and span.name == 'agent.step':
+            return span
+        return self.tracer.start_span('agent.step')
+
+    def _start_llm(self, serialized: dict, prompt_bytes: int, run_id: UUID, kwargs: dict) -> None:
+        self._step()
+        params = kwargs.get('invocation_params') or {}
+        model = params.get('model_name') or params.get('model') or (serialized.get('id') or ['unknown'])[-1]
+        self._llm_spans[run_id] = self.tracer.start_span('llm', **{'llm.model': model, 'llm.prompt_bytes': prompt_bytes})
+
+    def on_chat_model_start(self, serialized: dict, messages: list, *, run_id: UUID, **kwargs: Any) -> None:
+        prompt_bytes = sum(_size(message.content) for batch in messages for message in batch)
+        self._start_llm(serialized, prompt_bytes, run_id, kwargs)
+
+    def on_llm_start(self, serialized: dict, prompts: List[str], *, run_id: UUID, **kwargs: Any) -> None:
+        self._start_llm(serialized, sum(_size(prompt) for prompt in prompts), run_id, kwargs)
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        self._chunks[run_id] = self._chunks.get(run_id, 0) + 1
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        span = self._llm_spans.pop(run_id, None)
+        chunks = self._chunks.pop(run_id, None)
+        if span is None:
+            return
+        span.set(**{'llm.response_bytes': sum(_size(generation.text) for batch in response.generations for generation in batch)})
+        if chunks is not None:
+            # Agents stream their calls, which report no usage and skip LangChain's
+            # cache; OpenAI streams one token per chunk
+            span.set(**{'llm.completion_tokens': chunks, 'llm.streamed': True, 'llm.cache_hit': False})
+        elif response.llm_output is None:
+            # LangChain returns cached responses without the provider's llm_output
+            span.set(**{'llm.cache_hit': True})
+        else:
+            usage = response.llm_output.get('token_usage') or {}
+            span.set(**{
+                'llm.prompt_tokens': usage.get('prompt_tokens'),
+                'llm.completion_tokens': usage.get('completion_tokens'),
+                'llm.total_tokens': usage.get('total_tokens'),
+                'llm.cache_hit': False,
+            })
+        self.tracer.end_span(span)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._chunks.pop(run_id, None)
+        span = self._llm_spans.pop(run_id, None)
+        if span is not None:
+            self.tracer.end_span(span, error)
+
+    def on_agent_action(self, action: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self.tracer.start_span('tool', parent=self._step(), **{
+            'tool.name': action.tool,
+            'tool.input_bytes': _size(action.tool_input),
+        })
+
+
+def _end_step(tracer: Tracer, output: Any, role: str) -> None:
+    """Close the current agent step, recording each tool's observation size."""
+    stack = _stack()
+    steps = [span for span in stack if span.name == 'agent.step']
+    if not steps:
+        return
+    tools = [span for span in stack[stack.index(steps[-1]):] if span.name == 'tool']
+    # A finished step is an AgentFinish, otherwise a list of (action, observation) pairs
+    observations = [observation for _, observation in output] if isinstance(output, list) else []
+    for span, observation in zip(tools, observations):
+        span.set(**{'tool.output_bytes': _size(observation)})
+    steps[-1].set(**{'agent.role': role, 'agent.finished': not isinstance(output, list)})
+    tracer.end_span(steps[-1])
+
+
+def _add_handler(target: Any, handler: TraceCallbackHandler) -> None:
+    callbacks = target.callbacks if isinstance(target.callbacks, list) else []
+    if handler not in callbacks:
+        target.callbacks = callbacks + [handler]
+
+
+def _instrument_agent(agent: Any, tracer: Tracer, handler: TraceCallbackHandler, crew: Any) -> None:
+    """Attach the callback handler and step callback to an agent, once."""
+    if getattr(agent, '_trace_handler', None) is handler:
+        return
+    object.__setattr__(agent, '_trace_handler', handler)
+    _add_handler(agent.llm, handler)
+    _add_handler(agent, handler)
+    original = agent.step_callback
+
+    def step_callback(output):
+        _end_step(tracer, output, agent.role)
+        callback = original or crew.step_callback
+        if callback:
+            callback(output)
+    agent.step_callback = step_callback
+
+
+def instrument_crew(crew: Any, name: Optional[str] = None, tracer: Optional[Tracer] = None) -> Any:
+    """Record spans for every kickoff of ``crew``.
+
+    Args:
+        crew: The crewai ``Crew`` to instrument, modified in place.
+        name: Crew name recorded on the kickoff span and as the OTLP service name.
+        tracer: Where spans go, defaults to :func:`tracer_from_env`.
+
+    Returns:
+        The same crew, so ``crew()`` can ``return instrument_crew(Crew(...))``
+    """
+    tracer = tracer or tracer_from_env(name or SERVICE_NAME)
+    if tracer is None:
+        return crew
+    handler = TraceCallbackHandler(tracer)
+    # A crew runs one kickoff at a time; tasks on their own threads hang off its span
+    state: Dict[str, Optional[Span]] = {'root': None}
+    kickoff = crew.kickoff
+
+    for agent in crew.agents:
+        _instrument_agent(agent, tracer, handler, crew)
+    if crew.manager_llm is not None:
+        _add_handler(crew.manager_llm, handler)
+
+    @functools.wraps(kickoff)
+    def traced_kickoff(*args, **kwargs):
+        root = tracer.start_span('crew.kickoff', **{'crew.name': name or 'crew', 'crew.process': str(crew.process.value)})
+        state['root'] = root
+        error = None
+        try:
+            result = kickoff(*args, **kwargs)
+            usage = getattr(crew, 'usage_metrics', None) or {}
+            root.set(**{f"crew.{key}": value for key, value in usage.items()})
+            return result
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            tracer.end_span(root, error)
+            state['root'] = None
+            tracer.flush()
+
+    def trace_task(task):
+        execute = task._execute
+
+        @functools.wraps(execute)
+        def traced_execute(agent, task, context, tools):
+            _instrument_agent(agent, tracer, handler, crew)
+            span = tracer.start_span('task', parent=current_span() or state['root'], **{
+                'task.description': task.description.strip().splitlines()[0][:120] if task.description else '',
+                'agent.role': agent.role,
+                'task.async': bool(task.async_execution),
+            })
+            error = None
+            try:
+                result = execute(agent, task, context, tools)
+                span.set(**{'task.output_bytes': _size(result)})
+                return result
+            except BaseException as exc:
+                error = exc
+                raise
+            finally:
+                tracer.end_span(span, error)
+        object.__setattr__(task, '_execute', traced_execute)
+
+    for task in crew.tasks:
+        trace_task(task)
+    object.__setattr__(crew, 'kickoff', traced_kickoff)
+    return crew
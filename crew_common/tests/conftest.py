@@ -0,0 +1,11 @@
+import pytest
+
+from crew_common import run_mode
+
+
+@pytest.fixture(autouse=True)
+def crew_log_file(tmp_path, monkeypatch):
+    """Write the run-mode log under tmp_path instead of logs/ in the working directory"""
+    monkeypatch.setenv('CREW_LOG_FILE', str(tmp_path / 'crew.log'))
+    yield
+    run_mode.shutdown_logging()
@@ -0,0 +1,80 @@
+import pytest
+from crewai import Agent, Crew, Process, Task
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from crew_common.checkpoint import CheckpointStore, apply_checkpoints, inputs_key
+
+
+class FailingChatModel(FakeListChatModel):
+    """Fake chat model keeping every prompt it was sent, optionally failing instead of answering"""
+
+    prompts: list = []
+    fail: bool = False
+
+    def _call(self, messages, stop=None, run_manager=None, **kwargs):
+        if self.fail:
+            raise TimeoutError('LLM request timed out')
+        self.prompts.append(messages[-1].content)
+        return super()._call(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    def stream(self, input, config=None, *, stop=None, **kwargs):
+        yield self.invoke(input, config=config, stop=stop, **kwargs)
+
+
+def build_crew(store, prompts, failing=None):
+    tasks = []
+    for name in ['research_task', 'report_task']:
+        llm = FailingChatModel(responses=[f"Thought: done\nFinal Answer: {name} output"], prompts=prompts,
+                               fail=name == failing)
+        agent = Agent(role=name, goal='Work', backstory='Works', llm=llm, allow_delegation=False, verbose=False)
+        tasks.append(Task(description=f"Do the {name} for {{topic}}", expected_output='Output', agent=agent))
+    crew = Crew(agents=[task.agent for task in tasks], tasks=tasks, process=Process.sequential)
+    return apply_checkpoints(crew, 'test_crew', ['research_task', 'report_task'], store)
+
+
+class TestCheckpointStore:
+    """Test suite for the on-disk checkpoint store"""
+
+    def test_inputs_key_ignores_key_order(self):
+        """Test that equal inputs in any order share a key and different inputs do not"""
+        assert inputs_key({'a': 1, 'b': 2}) == inputs_key({'b': 2, 'a': 1})
+        assert inputs_key({'a': 1}) != inputs_key({'a': 2})
+
+    def test_saves_and_clears_checkpoints(self, tmp_path):
+        """Test that checkpoints are filed per crew and inputs and can be cleared"""
+        store = CheckpointStore(str(tmp_path))
+        store.save('crew', 'key', 'first_task', 'Do it', 'done')
+
+        assert store.load('crew', 'key', 'first_task')['output'] == 'done'
+        assert store.load('crew', 'other', 'first_task') is None
+        assert store.completed('crew', 'key') == ['first_task']
+        store.clear('crew')
+        assert store.completed('crew', 'key') == []
+
+
+class TestApplyCheckpoints:
+    """Test suite for checkpointing and resuming a crew's tasks"""
+
+    def test_resume_skips_checkpointed_tasks(self, tmp_path):
+        """Test that a failed run keeps the finished task and a resumed run only runs the rest"""
+        store = CheckpointStore(str(tmp_path))
+        with pytest.raises(TimeoutError):
+            build_crew(store, [], failing='report_task').kickoff(inputs={'topic': 'AI'})
+        assert store.completed('test_crew', inputs_key({'topic': 'AI'})) == ['research_task']
+
+        prompts = []
+        crew = build_crew(store, prompts)
+        assert crew.kickoff(inputs={'topic': 'AI'}, resume=True) == 'report_task output'
+        assert crew.resumed_tasks == ['research_task']
+        assert len(prompts) == 1 and 'research_task output' in prompts[0]
+
+    def test_checkpoints_are_ignored_without_resume_or_for_other_inputs(self, tmp_path):
+        """Test that tasks run again unless resuming the same inputs"""
+        store = CheckpointStore(str(tmp_path))
+        build_crew(store, []).kickoff(inputs={'topic': 'AI'})
+
+        for inputs, resume in [({'topic': 'AI'}, False), ({'topic': 'ML'}, True)]:
+            prompts = []
+            crew = build_crew(store, prompts)
+            crew.kickoff(inputs=inputs, resume=resume)
+            assert crew.resumed_tasks == [] and len(prompts) == 2
@@ -0,0 +1,134 @@
+import os
+
+import pytest
+from crewai import Agent, Crew, Process, Task
+from langchain.agents.agent import RunnableAgent
+from langchain_core.globals import get_llm_cache
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from crew_common.llm_cache import DiskLLMCache, LLMCacheMiss, apply_llm_cache, enable_llm_cache
+
+
+class TestLLMCache:
+    """Test suite for the record/replay LLM response cache"""
+
+    @pytest.fixture(autouse=True)
+    def reset_global_cache(self):
+        yield
+        enable_llm_cache('off')
+
+    def test_auto_mode_records_then_serves(self, tmp_path):
+        """Test that a repeated prompt is answered from disk"""
+        cache = enable_llm_cache('auto', str(tmp_path))
+        llm = FakeListChatModel(responses=['first', 'second'])
+
+        assert llm.invoke('Research AI LLMs').content == 'first'
+        assert llm.invoke('Research AI LLMs').content == 'first'
+        assert llm.invoke('Research robotics').content == 'second'
+        assert cache.stats() == {'mode': 'auto', 'hits': 1, 'misses': 2}
+
+    def test_replay_serves_recordings_without_calling(self, tmp_path):
+        """Test that a replay run reuses an earlier recording"""
+        enable_llm_cache('record', str(tmp_path))
+        FakeListChatModel(responses=['recorded']).invoke('Research AI LLMs')
+
+        enable_llm_cache('replay', str(tmp_path))
+        llm = FakeListChatModel(responses=['recorded'])
+
+        assert llm.invoke('Research AI LLMs').content == 'recorded'
+        assert llm.i == 0
+
+    def test_replay_miss_raises(self, tmp_path):
+        """Test that replay mode never falls through to the LLM"""
+        enable_llm_cache('replay', str(tmp_path))
+
+        with pytest.raises(LLMCacheMiss):
+            FakeListChatModel(responses=['live']).invoke('Research AI LLMs')
+
+    def test_record_mode_overwrites(self, tmp_path):
+        """Test that record mode always calls the LLM and refreshes the recording"""
+        enable_llm_cache('record', str(tmp_path))
+        llm = FakeListChatModel(responses=['old', 'new'])
+        llm.invoke('Research AI LLMs')
+        llm.invoke('Research AI LLMs')
+
+        enable_llm_cache('replay', str(tmp_path))
+        assert FakeListChatModel(responses=['old', 'new']).invoke('Research AI LLMs').content == 'new'
+
+    def test_key_depends_on_model_params(self):
+        """Test that the same prompt under different parameters gets its own entry"""
+        assert DiskLLMCache.key('prompt', 'model=a') != DiskLLMCache.key('prompt', 'model=b')
+        assert DiskLLMCache.key('prompt', 'model=a') == DiskLLMCache.key('prompt', 'model=a')
+
+    def test_mode_from_environment(self, tmp_path, monkeypatch):
+        """Test that LLM_CACHE_MODE and LLM_CACHE_DIR configure the cache"""
+        monkeypatch.setenv('LLM_CACHE_MODE', 'replay')
+        monkeypatch.setenv('LLM_CACHE_DIR', str(tmp_path))
+
+        cache = enable_llm_cache()
+
+        assert get_llm_cache() is cache
+        assert cache.directory == str(tmp_path)
+
+    def test_off_mode_and_invalid_mode(self, monkeypatch):
+        """Test that caching is off by default and unknown modes are rejected"""
+        monkeypatch.delenv('LLM_CACHE_MODE', raising=False)
+        assert enable_llm_cache() is None
+        assert get_llm_cache() is None
+
+        with pytest.raises(ValueError):
+            enable_llm_cache('sometimes')
+
+    def test_clear_removes_recordings(self, tmp_path):
+        """Test that clear deletes every recording"""
+        cache = enable_llm_cache('auto', str(tmp_path))
+        FakeListChatModel(responses=['first']).invoke('Research AI LLMs')
+
+        cache.clear()
+
+        assert not any(name.endswith('.json') for _, _, files in os.walk(tmp_path) for name in files)
+
+    def test_agent_calls_are_replayed(self, tmp_path):
+        """Test that a crew's agent calls, which crewai streams by default, are recorded and replayed"""
+        def kickoff():
+            llm = FakeListChatModel(responses=['Final Answer: recorded', 'Final Answer: live'])
+            agent = Agent(role='Analyst', goal='g', backstory='b', llm=llm)
+            crew = Crew(agents=[agent], tasks=[Task(description='d', expected_output='e', agent=agent)])
+            return apply_llm_cache(crew).kickoff(), llm.i
+
+        enable_llm_cache('record', str(tmp_path))
+        assert kickoff() == ('recorded', 1)
+
+        enable_llm_cache('replay', str(tmp_path))
+        assert kickoff() == ('recorded', 0)
+
+    def test_manager_calls_are_replayed(self, tmp_path):
+        """Test that the manager crewai creates for a hierarchical run also answers from the recordings"""
+        def kickoff():
+            manager = FakeListChatModel(responses=['Final Answer: recorded', 'Final Answer: live'])
+            agent = Agent(role='Analyst', goal='g', backstory='b', llm=FakeListChatModel(responses=['unused']))
+            crew = Crew(agents=[agent], tasks=[Task(description='d', expected_output='e')],
+                        process=Process.hierarchical, manager_llm=manager)
+            return apply_llm_cache(crew).kickoff(), manager.i
+
+        enable_llm_cache('record', str(tmp_path))
+        assert kickoff() == ('recorded', 1)
+
+        enable_llm_cache('replay', str(tmp_path))
+        assert kickoff() == ('recorded', 0)
+
+    def test_only_the_crew_stops_streaming(self, tmp_path):
+        """Test that the cache leaves agents outside the crew, and crews built without a cache, streaming"""
+        def build():
+            agent = Agent(role='Analyst', goal='g', backstory='b', llm=FakeListChatModel(responses=['Final Answer: x']))
+            return apply_llm_cache(Crew(agents=[agent], tasks=[Task(description='d', expected_output='e', agent=agent)]))
+
+        uncached = build()
+        enable_llm_cache('auto', str(tmp_path))
+        cached = build()
+        for crew in (uncached, cached):
+            crew.agents[0].create_agent_executor()
+
+        assert cached.agents[0].agent_executor.agent.stream_runnable is False
+        assert uncached.agents[0].agent_executor.agent.stream_runnable is True
+        assert RunnableAgent(runnable=FakeListChatModel(responses=['x'])).stream_runnable is True
@@ -0,0 +1,93 @@
+import json
+
+from crewai import Agent, Crew, Task
+from crewai.project import task
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from crew_common import run_mode
+from crew_common.checkpoint import CheckpointStore, inputs_key
+from crew_common.prepare import prepare_crew, task_names
+
+FINISH = 'Thought: done\nFinal Answer: all done'
+
+
+def read_lines(path):
+    with open(path, encoding='utf-8') as handle:
+        return [json.loads(line) for line in handle]
+
+
+class BaseCrew:
+
+    @task
+    def research_task(self):
+        pass
+
+    def helper(self):
+        pass
+
+    @task
+    def report_task(self):
+        pass
+
+
+class ReviewedCrew(BaseCrew):
+
+    @task
+    def review_task(self):
+        pass
+
+    @task
+    def research_task(self):
+        pass
+
+
+class TestTaskNames:
+    """Test suite for naming a crew's tasks"""
+
+    def test_names_follow_the_class_definitions(self):
+        """Test that only @task methods are named, base class first, and overrides keep their place"""
+        assert task_names(BaseCrew()) == ['research_task', 'report_task']
+        assert task_names(ReviewedCrew()) == ['research_task', 'report_task', 'review_task']
+
+
+class TestPrepareCrew:
+    """Test suite for wrapping a crew with the shared instrumentation"""
+
+    def test_layers_every_wrapper(self, tmp_path, monkeypatch):
+        """Test that one call checkpoints, streams, applies the crew's wrappers, logs and traces a kickoff"""
+        for name, value in [('CREW_CHECKPOINT_DIR', 'checkpoints'), ('CREW_REPORT_DIR', 'runs'),
+                            ('CREW_LOG_FILE', 'crew.log'), ('CREW_TRACE_FILE', 'trace.jsonl')]:
+            monkeypatch.setenv(name, str(tmp_path / value))
+        monkeypatch.setenv('CREW_RUN_MODE', 'prod')
+        run_mode.shutdown_logging()
+        agent = Agent(role='Researcher', goal='g', backstory='b', llm=FakeListChatModel(responses=[FINISH]))
+        crew = Crew(agents=[agent], tasks=[Task(description='Research the topic', expected_output='notes', agent=agent)])
+        wrapped = []
+
+        def wrapper(crew):
+            # Crew-specific wrappers see the checkpointed kickoff and run inside the log and trace
+            wrapped.append('checkpoint_store' in vars(crew))
+            return crew
+
+        try:
+            assert prepare_crew(crew, 'test_crew', ['research_task'], checkpoints=True, reports=True,
+                                wrappers=[wrapper]).kickoff() == 'all done'
+            run_mode.flush_logging()
+        finally:
+            run_mode.shutdown_logging()
+
+        assert wrapped == [True]
+        assert CheckpointStore(str(tmp_path / 'checkpoints')).completed('test_crew', inputs_key(None)) == ['research_task']
+        assert [path.name for path in (tmp_path / 'runs').glob('*/*')] == ['research_task.md']
+        assert read_lines(tmp_path / 'crew.log')[-1]['crew'] == 'test_crew'
+        assert 'crew.kickoff' in [span['name'] for span in read_lines(tmp_path / 'trace.jsonl')]
+
+    def test_only_requested_layers(self, tmp_path, monkeypatch):
+        """Test that checkpoints and report streaming are off unless asked for"""
+        monkeypatch.delenv('CREW_TRACE_FILE', raising=False)
+        agent = Agent(role='Researcher', goal='g', backstory='b', llm=FakeListChatModel(responses=[FINISH]))
+        crew = Crew(agents=[agent], tasks=[Task(description='d', expected_output='e', agent=agent)])
+
+        prepare_crew(crew, 'test_crew', ['research_task'])
+
+        assert 'checkpoint_store' not in vars(crew) and 'report_sink' not in vars(crew)
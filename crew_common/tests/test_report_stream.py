@@ -0,0 +1,113 @@
+import os
+
+import pytest
+from crewai import Agent, Crew, Process, Task
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from crew_common.report_stream import ReportSink, ReportStream, stream_reports
+
+REPORT = '# AI LLMs\n\nOpen weight models keep closing the gap.'
+
+
+class PartFileWatcher(BaseCallbackHandler):
+    """Callback handler recording what the .part file held as each token arrived"""
+
+    def __init__(self, sink):
+        self.sink = sink
+        self.seen = []
+
+    def on_llm_new_token(self, token, **kwargs):
+        for name in os.listdir(self.sink.run_dir):
+            if name.endswith('.part'):
+                with open(os.path.join(self.sink.run_dir, name), encoding='utf-8') as handle:
+                    self.seen.append(handle.read())
+
+
+def build_crew(tmp_path, answers, output_file=None):
+    sink = ReportSink(str(tmp_path / 'runs'))
+    watcher = PartFileWatcher(sink)
+    llm = GenericFakeChatModel(messages=iter(AIMessage(content=answer) for answer in answers), callbacks=[watcher])
+    agent = Agent(role='Analyst', goal='Report', backstory='Writes reports', llm=llm, allow_delegation=False, verbose=False)
+    task = Task(description='Write the report', expected_output='A report', agent=agent, output_file=output_file)
+    crew = stream_reports(Crew(agents=[agent], tasks=[task], process=Process.sequential), ['report_task'], sink)
+    return crew, sink, watcher
+
+
+class TestReportStream:
+    """Test suite for a single streamed task file"""
+
+    def test_streams_only_the_final_answer(self, tmp_path):
+        """Test that thoughts are skipped, the marker may span tokens and the file is renamed when done"""
+        stream = ReportStream(str(tmp_path / 'task.md'))
+        stream.begin()
+        for token in ['Thought: I know', ' it\nFinal ', 'Answer', ': # Title', '\nBody']:
+            stream.feed(token)
+
+        with open(stream.part_path, encoding='utf-8') as handle:
+            assert handle.read() == '# Title\nBody'
+        assert stream.finish('# Title\nBody') == str(tmp_path / 'task.md')
+        assert os.listdir(tmp_path) == ['task.md']
+
+    def test_a_retried_answer_replaces_the_earlier_one(self, tmp_path):
+        """Test that a new generation starts the file again and finish writes the real output"""
+        stream = ReportStream(str(tmp_path / 'task.md'))
+        stream.begin()
+        stream.feed('Final Answer: first attempt')
+        stream.begin()
+        stream.feed('Final Answer: second')
+        stream.finish('second, cleaned up')
+
+        assert (tmp_path / 'task.md').read_text() == 'second, cleaned up'
+
+
+class TestStreamReports:
+    """Test suite for streaming a crew's task outputs"""
+
+    def test_report_is_readable_before_the_task_finishes(self, tmp_path):
+        """Test that the .part file grows token by token and ends up as the task's output"""
+        crew, sink, watcher = build_crew(tmp_path, [f"Thought: I have it\nFinal Answer: {REPORT}"])
+
+        result = crew.kickoff()
+
+        assert result == REPORT
+        assert os.listdir(sink.run_dir) == ['report_task.md']
+        with open(os.path.join(sink.run_dir, 'report_task.md'), encoding='utf-8') as handle:
+            assert handle.read() == REPORT
+        partial = [content for content in watcher.seen if content]
+        assert partial[0] == '#' and len(set(partial)) > 5
+        assert all(REPORT.startswith(content) for content in partial)
+
+    def test_each_kickoff_gets_its_own_run_directory(self, tmp_path):
+        """Test that runs never overwrite each other's files"""
+        crew, sink, _ = build_crew(tmp_path, ['Final Answer: first', 'Final Answer: second'])
+
+        crew.kickoff()
+        first = sink.run_dir
+        crew.kickoff()
+
+        assert first != sink.run_dir
+        assert (tmp_path / 'runs' / os.path.basename(first) / 'report_task.md').read_text() == 'first'
+
+    def test_output_file_is_written_atomically(self, tmp_path):
+        """Test that output_file is replaced in one rename and no temporary file is left behind"""
+        output_file = tmp_path / 'out' / 'report.md'
+        crew, _, _ = build_crew(tmp_path, [f"Final Answer: {REPORT}"], output_file=str(output_file))
+
+        crew.kickoff()
+
+        assert output_file.read_text() == REPORT
+        assert os.listdir(output_file.parent) == ['report.md']
+
+    def test_failed_task_keeps_its_part_file(self, tmp_path):
+        """Test that a task that raises leaves its partial output as .part only"""
+        crew, sink, _ = build_crew(tmp_path, ['Final Answer: half'])
+
+        def explode(*args, **kwargs):
+            raise RuntimeError('provider down')
+        object.__setattr__(crew.agents[0], 'execute_task', explode)
+
+        with pytest.raises(RuntimeError):
+            crew.kickoff()
+        assert os.listdir(sink.run_dir) == ['report_task.md.part']
@@ -0,0 +1,152 @@
+import json
+import threading
+
+import pytest
+from crewai import Agent, Crew, Task
+from crewai.utilities.printer import Printer
+from crewai_tools import BaseTool
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from crew_common import run_mode
+from crew_common.run_mode import agent_verbose, apply_run_mode, console_to_log, crew_verbosity
+
+TOOL_CALL = 'Thought: look it up\nAction: Echo\nAction Input: {"text": "hi"}'
+FINISH = 'Thought: done\nFinal Answer: all done'
+
+
+class Echo(BaseTool):
+    name: str = "Echo"
+    description: str = "Echo the text back"
+
+    def _run(self, text: str) -> str:
+        return f"echo {text}"
+
+
+class BusyEcho(Echo):
+    """Echo while another thread of the process prints a progress line"""
+
+    def _run(self, text: str) -> str:
+        thread = threading.Thread(target=print, args=('batch progress',))
+        thread.start()
+        thread.join()
+        return super()._run(text)
+
+
+def build_crew(tool=None):
+    agent = Agent(role='Researcher', goal='g', backstory='b', verbose=agent_verbose(),
+                  llm=FakeListChatModel(responses=[TOOL_CALL, FINISH]), tools=[tool or Echo()])
+    task = Task(description='Research the topic', expected_output='notes', agent=agent)
+    return apply_run_mode(Crew(agents=[agent], tasks=[task], verbose=crew_verbosity()), name='test_crew')
+
+
+def read_log(path):
+    with open(path, encoding='utf-8') as handle:
+        return [json.loads(line) for line in handle]
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    """Log to a temporary file with a fresh writer"""
+    path = tmp_path / 'logs' / 'crew.log'
+    monkeypatch.setenv('CREW_LOG_FILE', str(path))
+    for name in ('CREW_RUN_MODE', 'CREW_LOG_LEVEL', 'CREW_LOG_BUFFER', 'CREW_LOG_MAX_BYTES', 'CREW_LOG_BACKUPS'):
+        monkeypatch.delenv(name, raising=False)
+    run_mode.shutdown_logging()
+    yield path
+    run_mode.shutdown_logging()
+
+
+class TestRunMode:
+    """Test suite for the dev/prod run modes"""
+
+    def test_mode_sets_verbosity(self, monkeypatch):
+        """Test that dev keeps crewai's console output and prod turns it off"""
+        monkeypatch.delenv('CREW_RUN_MODE', raising=False)
+        assert (crew_verbosity(), agent_verbose()) == (2, True)
+
+        monkeypatch.setenv('CREW_RUN_MODE', 'prod')
+        assert (crew_verbosity(), agent_verbose()) == (0, False)
+
+        monkeypatch.setenv('CREW_RUN_MODE', 'staging')
+        with pytest.raises(ValueError):
+            run_mode.run_mode()
+
+    def test_prod_kickoff_is_silent_and_logged(self, log_file, monkeypatch, capsys):
+        """Test that a prod kickoff prints nothing and logs its tasks and timing"""
+        monkeypatch.setenv('CREW_RUN_MODE', 'prod')
+
+        assert build_crew().kickoff() == 'all done'
+
+        records = read_log(log_file)
+        assert capsys.readouterr().out == ''
+        assert [record['event'] for record in records] == ['kickoff_started', 'task_completed', 'kickoff_finished']
+        assert records[1]['output'] == 'all done'
+        assert records[2]['status'] == 'ok' and records[2]['mode'] == 'prod' and records[2]['crew'] == 'test_crew'
+
+    def test_prod_debug_level_keeps_the_chatter(self, log_file, monkeypatch, capsys):
+        """Test that at DEBUG the agent steps and printed output land in the log instead of the console"""
+        monkeypatch.setenv('CREW_RUN_MODE', 'prod')
+        monkeypatch.setenv('CREW_LOG_LEVEL', 'DEBUG')
+
+        build_crew().kickoff()
+
+        records = read_log(log_file)
+        steps = [record for record in records if record.get('event') == 'agent_step']
+        console = [record['message'] for record in records if record['logger'] == 'crew.console']
+        assert capsys.readouterr().out == ''
+        assert steps[0]['tool'] == 'Echo' and steps[0]['observation'] == 'echo hi'
+        assert 'echo hi' in console
+
+    def test_dev_kickoff_keeps_the_console(self, log_file, capsys):
+        """Test that dev mode prints as before and logs the agent steps"""
+        build_crew().kickoff()
+
+        records = read_log(log_file)
+        assert 'Final Answer' in capsys.readouterr().out
+        assert 'agent_step' in [record.get('event') for record in records]
+
+    def test_records_are_buffered_until_flushed(self, log_file):
+        """Test that records below ERROR wait in the buffer and an error writes them out"""
+        logger = run_mode.configure_logging()
+        logger.info('first')
+        logger.info('second')
+        for handler in logger.handlers:
+            handler.flush()
+
+        assert not log_file.exists() or log_file.read_text() == ''
+
+        logger.error('failed')
+        run_mode.flush_logging()
+        assert [record['message'] for record in read_log(log_file)] == ['first', 'second', 'failed']
+
+    def test_log_rotates(self, log_file, monkeypatch):
+        """Test that the log rolls over to numbered backups"""
+        monkeypatch.setenv('CREW_LOG_MAX_BYTES', '2000')
+        monkeypatch.setenv('CREW_LOG_BACKUPS', '2')
+        logger = run_mode.configure_logging()
+        for index in range(200):
+            logger.info('record %d', index)
+        run_mode.flush_logging()
+
+        assert sorted(path.name for path in log_file.parent.iterdir()) == ['crew.log', 'crew.log.1', 'crew.log.2']
+
+    def test_prod_leaves_other_output_on_the_console(self, log_file, monkeypatch, capsys):
+        """Test that a prod kickoff logs crewai's printing but not what another thread prints meanwhile"""
+        monkeypatch.setenv('CREW_RUN_MODE', 'prod')
+        monkeypatch.setenv('CREW_LOG_LEVEL', 'DEBUG')
+
+        build_crew(BusyEcho()).kickoff()
+
+        console = [record['message'] for record in read_log(log_file) if record['logger'] == 'crew.console']
+        assert capsys.readouterr().out == 'batch progress\n'
+        assert 'echo hi' in console and 'batch progress' not in console
+
+    def test_overlapping_redirects_restore_the_printer(self, log_file):
+        """Test that crewai's printer comes back only after the last overlapping kickoff ends"""
+        run_mode.configure_logging()
+        original = Printer.print
+        with console_to_log():
+            with console_to_log():
+                Printer().print('inner', color='purple')
+            assert Printer.print is not original
+        assert Printer.print is original
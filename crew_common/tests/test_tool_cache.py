@@ -0,0 +1,174 @@
+import os
+from unittest.mock import patch
+
+import pytest
+from crewai_tools import BaseTool
+
+from crew_common import tool_cache
+from crew_common.cached_tool import CachedTool
+from crew_common.tool_cache import ToolResultCache, cache_key, normalize_url
+
+
+class CountingSearchTool(BaseTool):
+    name: str = "Search the internet"
+    description: str = "Searches the internet for a query."
+    calls: int = 0
+
+    def _run(self, search_query: str) -> str:
+        self.calls += 1
+        return f"results for {search_query}"
+
+
+class TestToolResultCache:
+    """Test suite for the TTL + LRU tool result cache"""
+
+    def test_equivalent_arguments_share_a_key(self):
+        """Test that whitespace, URL noise and the case of a search query do not split cache entries"""
+        assert cache_key('search', (), {'search_query': 'AAPL  News'}) == cache_key('search', (), {'search_query': ' aapl news'})
+        assert cache_key('search', ('AAPL  News',), {}) == cache_key('search', (' AAPL News ',), {})
+        assert cache_key('scrape', (), {'website_url': 'HTTPS://Example.com/a/?b=2&a=1#top'}) == \
+            cache_key('scrape', (), {'website_url': 'https://example.com/a?a=1&b=2'})
+        assert normalize_url('https://Example.com') == 'https://example.com/'
+
+    def test_case_sensitive_arguments_keep_their_own_keys(self):
+        """Test that paths, IDs and URL paths differing only in case are cached apart"""
+        assert cache_key('read', (), {'file_path': 'Resume.md'}) != cache_key('read', (), {'file_path': 'resume.md'})
+        assert cache_key('card', ('AbC1',), {}) != cache_key('card', ('abc1',), {})
+        assert cache_key('scrape', (), {'website_url': 'https://example.com/Jobs'}) != \
+            cache_key('scrape', (), {'website_url': 'https://example.com/jobs'})
+
+    def test_hit_and_miss_are_counted(self):
+        """Test that lookups report hits and misses"""
+        cache = ToolResultCache()
+        assert cache.get('k') == (False, None)
+        cache.set('k', 'v')
+
+        assert cache.get('k') == (True, 'v')
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_entries_expire_after_ttl(self):
+        """Test that an entry older than the TTL is a miss"""
+        cache = ToolResultCache(ttl=10)
+        with patch('crew_common.tool_cache.time.time', return_value=1000):
+            cache.set('k', 'v')
+        with patch('crew_common.tool_cache.time.time', return_value=1011):
+            assert cache.get('k') == (False, None)
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the cache stays within max_entries by evicting the LRU entry"""
+        cache = ToolResultCache(max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('b') == (False, None)
+        assert cache.get('a') == (True, 1)
+        assert cache.stats()['evictions'] == 1
+
+    def test_cache_persists_to_disk(self, tmp_path):
+        """Test that a persisted entry is found by a new instance sharing the directory"""
+        directory = str(tmp_path / 'search')
+        ToolResultCache(directory=directory).set('k', 'v')
+
+        assert len(os.listdir(directory)) == 1
+        assert ToolResultCache(directory=directory).get('k') == (True, 'v')
+
+    def test_expired_entry_on_disk_is_a_miss(self, tmp_path):
+        """Test that a persisted entry past its TTL is ignored"""
+        directory = str(tmp_path / 'search')
+        with patch('crew_common.tool_cache.time.time', return_value=1000):
+            ToolResultCache(ttl=10, directory=directory).set('k', 'v')
+
+        with patch('crew_common.tool_cache.time.time', return_value=1011):
+            assert ToolResultCache(ttl=10, directory=directory).get('k') == (False, None)
+
+    def test_expired_files_are_pruned_on_write(self, tmp_path):
+        """Test that writing deletes expired entries from disk, at most once per TTL"""
+        directory = tmp_path / 'search'
+        with patch('crew_common.tool_cache.time.time', return_value=1000):
+            ToolResultCache(ttl=10, directory=str(directory)).set('old', 'v')
+        cache = ToolResultCache(ttl=10, directory=str(directory))
+
+        with patch('crew_common.tool_cache.time.time', return_value=1011):
+            cache.set('new', 'v')
+            cache.set('newer', 'v')
+        with patch('crew_common.tool_cache.time.time', return_value=1015):
+            assert cache.prune() == 0
+            assert ToolResultCache(ttl=10, directory=str(directory)).get('new') == (True, 'v')
+
+        assert len(os.listdir(directory)) == 2
+
+    def test_prune_counts_removed_entries(self, tmp_path):
+        """Test that prune removes only entries past their TTL"""
+        directory = str(tmp_path / 'search')
+        cache = ToolResultCache(ttl=10, directory=directory)
+        with patch('crew_common.tool_cache.time.time', return_value=1000):
+            cache.set('a', 1)
+        with patch('crew_common.tool_cache.time.time', return_value=1005):
+            cache.set('b', 2)
+
+        with patch('crew_common.tool_cache.time.time', return_value=1012):
+            assert cache.prune() == 1
+
+        assert len(os.listdir(directory)) == 1
+
+    def test_clear_removes_persisted_entries(self, tmp_path):
+        """Test that clear empties memory and disk"""
+        directory = str(tmp_path / 'search')
+        cache = ToolResultCache(directory=directory)
+        cache.set('k', 'v')
+
+        cache.clear()
+
+        assert os.listdir(directory) == []
+        assert ToolResultCache(directory=directory).get('k') == (False, None)
+
+    def test_shared_cache_per_name(self, monkeypatch, tmp_path):
+        """Test that get_tool_cache returns one cache per name and honours TOOL_CACHE_DIR"""
+        monkeypatch.setattr(tool_cache, '_caches', {})
+        monkeypatch.setenv('TOOL_CACHE_DIR', str(tmp_path))
+        monkeypatch.setenv('TOOL_CACHE_SEARCH_TTL', '5')
+
+        cache = tool_cache.get_tool_cache('search')
+
+        assert cache is tool_cache.get_tool_cache('search')
+        assert cache.ttl == 5
+        assert cache.directory == str(tmp_path / 'search')
+        assert set(tool_cache.cache_stats()) == {'search'}
+
+
+class TestCachedTool:
+    """Test suite for the caching tool wrapper"""
+
+    @pytest.fixture
+    def search_tool(self):
+        return CountingSearchTool()
+
+    def test_wrapper_mirrors_wrapped_tool(self, search_tool):
+        """Test that agents see the wrapped tool's name, description and arguments"""
+        cached = CachedTool(search_tool, cache=ToolResultCache())
+
+        assert cached.name == search_tool.name
+        assert cached.description == search_tool.description
+        assert cached.args_schema is search_tool.args_schema
+
+    def test_repeated_calls_hit_the_cache(self, search_tool):
+        """Test that equivalent calls only reach the wrapped tool once"""
+        cached = CachedTool(search_tool, cache=ToolResultCache())
+
+        assert cached._run(search_query='AAPL news') == 'results for AAPL news'
+        assert cached._run(search_query='aapl  NEWS') == 'results for AAPL news'
+        assert search_tool.calls == 1
+
+    def test_cache_can_be_disabled(self, search_tool, monkeypatch):
+        """Test that TOOL_CACHE_DISABLED bypasses the cache"""
+        monkeypatch.setenv('TOOL_CACHE_DISABLED', '1')
+        cached = CachedTool(search_tool, cache=ToolResultCache())
+
+        cached._run(search_query='AAPL news')
+        cached._run(search_query='AAPL news')
+
+        assert search_tool.calls == 2
+
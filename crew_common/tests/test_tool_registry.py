@@ -0,0 +1,39 @@
+from crewai_tools import BaseTool
+
+from crew_common import tool_registry
+
+
+class CountingSearchTool(BaseTool):
+    name: str = "Search the internet"
+    description: str = "Searches the internet for a query."
+
+    def _run(self, search_query: str) -> str:
+        return f"results for {search_query}"
+
+
+class TestToolRegistry:
+    """Test suite for lazily built, process-wide tools"""
+
+    def test_tool_is_built_once_on_first_access(self, monkeypatch):
+        """Test that a lazy tool is built on first access and shared between instances"""
+        monkeypatch.setattr(tool_registry, '_tools', {})
+        builds = []
+        tool_registry.register_tool('counting', lambda: builds.append(1) or CountingSearchTool())
+
+        class Holder:
+            tool = tool_registry.lazy_tool('counting')
+
+        first, second = Holder(), Holder()
+        assert builds == []
+        assert first.tool is second.tool
+        assert builds == [1]
+
+    def test_instance_can_override_a_lazy_tool(self):
+        """Test that assigning the attribute replaces the shared tool for that instance"""
+        class Holder:
+            tool = tool_registry.lazy_tool('unregistered')
+
+        holder = Holder()
+        holder.tool = 'stand-in'
+
+        assert holder.tool == 'stand-in'
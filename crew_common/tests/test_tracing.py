@@ -0,0 +1,179 @@
+import json
+
+import pytest
+from crewai import Agent, Crew, Process, Task
+from crewai_tools import BaseTool
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from crew_common.tracing import Tracer, annotate, instrument_crew
+
+TOOL_CALL = 'Thought: look it up\nAction: Echo\nAction Input: {"text": "hi"}'
+FINISH = 'Thought: done\nFinal Answer: all done'
+
+
+class UsageChatModel(FakeListChatModel):
+    """Fake chat model reporting token usage the way ChatOpenAI does"""
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        result = super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        result.llm_output = {'token_usage': {'prompt_tokens': 10, 'completion_tokens': 5, 'total_tokens': 15}}
+        return result
+
+    def _combine_llm_outputs(self, llm_outputs):
+        usage = {}
+        for output in llm_outputs:
+            for key, value in ((output or {}).get('token_usage') or {}).items():
+                usage[key] = usage.get(key, 0) + value
+        return {'token_usage': usage}
+
+
+class BlockingChatModel(UsageChatModel):
+    """Usage-reporting model that does not stream, so agent calls go through the LLM cache"""
+
+    def stream(self, input, config=None, *, stop=None, **kwargs):
+        yield self.invoke(input, config=config, stop=stop, **kwargs)
+
+
+class Echo(BaseTool):
+    name: str = "Echo"
+    description: str = "Echo the text back"
+
+    def _run(self, text: str) -> str:
+        annotate(**{'tool.cache_hit': False})
+        return f"echo {text}"
+
+
+class Broken(BaseTool):
+    name: str = "Echo"
+    description: str = "Echo the text back"
+
+    def _run(self, text: str) -> str:
+        raise KeyboardInterrupt
+
+
+def build_crew(tmp_path, responses, tools=(), format='jsonl', llm_class=UsageChatModel, **crew_kwargs):
+    agent = Agent(role='Researcher', goal='g', backstory='b', llm=llm_class(responses=responses), tools=list(tools))
+    task = Task(description='Research the topic', expected_output='notes', agent=agent)
+    tracer = Tracer(str(tmp_path / 'trace.jsonl'), format)
+    return instrument_crew(Crew(agents=[agent], tasks=[task], **crew_kwargs), name='test_crew', tracer=tracer)
+
+
+def read_spans(tmp_path):
+    with open(tmp_path / 'trace.jsonl', encoding='utf-8') as handle:
+        return [json.loads(line) for line in handle]
+
+
+class TestTracing:
+    """Test suite for kickoff tracing"""
+
+    @pytest.fixture(autouse=True)
+    def reset_global_cache(self):
+        yield
+        set_llm_cache(None)
+
+    def test_kickoff_records_a_span_tree(self, tmp_path):
+        """Test that task, step, LLM and tool spans nest under the kickoff"""
+        build_crew(tmp_path, [TOOL_CALL, FINISH], tools=[Echo()]).kickoff()
+
+        spans = read_spans(tmp_path)
+        by_id = {span['span_id']: span for span in spans}
+        parent = {span['name'] if span['name'] != 'agent.step' else 'step': by_id.get(span['parent_id'], {}).get('name')
+                  for span in spans}
+
+        assert sorted(span['name'] for span in spans) == ['agent.step', 'agent.step', 'crew.kickoff', 'llm', 'llm', 'task', 'tool']
+        assert parent == {'crew.kickoff': None, 'task': 'crew.kickoff', 'step': 'task', 'llm': 'agent.step', 'tool': 'agent.step'}
+        assert len({span['trace_id'] for span in spans}) == 1
+        assert all(span['end_ns'] >= span['start_ns'] for span in spans)
+
+    def test_spans_carry_tokens_bytes_and_cache_hits(self, tmp_path):
+        """Test that LLM and tool spans record usage, payload sizes and cache hits"""
+        build_crew(tmp_path, [TOOL_CALL, FINISH], tools=[Echo()]).kickoff()
+
+        spans = read_spans(tmp_path)
+        llm = next(span['attributes'] for span in spans if span['name'] == 'llm')
+        tool = next(span['attributes'] for span in spans if span['name'] == 'tool')
+        kickoff = next(span['attributes'] for span in spans if span['name'] == 'crew.kickoff')
+
+        # The fake model streams one character per chunk
+        assert llm['llm.completion_tokens'] == len(TOOL_CALL)
+        assert llm['llm.streamed'] is True
+        assert llm['llm.prompt_bytes'] > 0 and llm['llm.response_bytes'] == len(TOOL_CALL)
+        assert tool == {'tool.name': 'Echo', 'tool.input_bytes': len('{"text": "hi"}'),
+                        'tool.cache_hit': False, 'tool.output_bytes': len('echo hi')}
+        assert kickoff['crew.name'] == 'test_crew'
+
+    def test_cached_llm_responses_are_flagged(self, tmp_path):
+        """Test that reported usage is recorded and a rerun answered by the LLM cache is flagged"""
+        set_llm_cache(InMemoryCache())
+        crew = build_crew(tmp_path, [FINISH], llm_class=BlockingChatModel)
+        crew.kickoff()
+        crew.kickoff()
+
+        llm_spans = [span['attributes'] for span in read_spans(tmp_path) if span['name'] == 'llm']
+
+        assert [span['llm.cache_hit'] for span in llm_spans] == [False, True]
+        assert llm_spans[0]['llm.total_tokens'] == 15
+        assert 'llm.total_tokens' not in llm_spans[1]
+
+    def test_failed_kickoff_is_still_exported(self, tmp_path):
+        """Test that spans are written with an error status when a kickoff fails"""
+        with pytest.raises(KeyboardInterrupt):
+            build_crew(tmp_path, [TOOL_CALL, FINISH], tools=[Broken()]).kickoff()
+
+        spans = read_spans(tmp_path)
+
+        assert {span['name'] for span in spans if span['status'] == 'error'} == {'crew.kickoff', 'task', 'agent.step', 'tool'}
+
+    def test_delegation_nests_under_the_manager_tool_call(self, tmp_path):
+        """Test that a co-worker's steps appear inside the manager's delegation span"""
+        delegate = ('Thought: delegate\nAction: Delegate work to co-worker\n'
+                    'Action Input: {"task": "research", "context": "none", "coworker": "Researcher"}')
+        manager_llm = UsageChatModel(responses=[delegate, FINISH])
+        build_crew(tmp_path, [FINISH], process=Process.hierarchical, manager_llm=manager_llm).kickoff()
+
+        spans = read_spans(tmp_path)
+        by_id = {span['span_id']: span for span in spans}
+        tool = next(span for span in spans if span['name'] == 'tool')
+        nested = [span for span in spans if by_id.get(span['parent_id']) is tool]
+
+        assert tool['attributes']['tool.name'] == 'Delegate work to co-worker'
+        assert [span['name'] for span in nested] == ['agent.step']
+
+    def test_otlp_export(self, tmp_path):
+        """Test that the OTLP format writes one ExportTraceServiceRequest per kickoff"""
+        build_crew(tmp_path, [FINISH], format='otlp').kickoff()
+
+        requests = read_spans(tmp_path)
+        resource_spans = requests[0]['resourceSpans'][0]
+        spans = resource_spans['scopeSpans'][0]['spans']
+        root = next(span for span in spans if span['name'] == 'crew.kickoff')
+
+        assert len(requests) == 1
+        assert resource_spans['resource']['attributes'][0]['key'] == 'service.name'
+        assert 'parentSpanId' not in root
+        assert {'key': 'crew.name', 'value': {'stringValue': 'test_crew'}} in root['attributes']
+        assert int(root['endTimeUnixNano']) >= int(root['startTimeUnixNano'])
+
+    def test_trace_file_from_environment(self, tmp_path, monkeypatch):
+        """Test that CREW_TRACE_FILE turns tracing on and names the OTLP service after the crew"""
+        monkeypatch.setenv('CREW_TRACE_FILE', str(tmp_path / 'trace.jsonl'))
+        monkeypatch.setenv('CREW_TRACE_FORMAT', 'otlp')
+        agent = Agent(role='Researcher', goal='g', backstory='b', llm=UsageChatModel(responses=[FINISH]))
+        crew = Crew(agents=[agent], tasks=[Task(description='d', expected_output='e', agent=agent)])
+
+        instrument_crew(crew, name='sales_pipeline_crew').kickoff()
+
+        resource = read_spans(tmp_path)[0]['resourceSpans'][0]['resource']
+        assert resource['attributes'] == [{'key': 'service.name', 'value': {'stringValue': 'sales_pipeline_crew'}}]
+
+    def test_tracing_is_off_without_a_trace_file(self, monkeypatch):
+        """Test that the crew is returned untouched when CREW_TRACE_FILE is unset"""
+        monkeypatch.delenv('CREW_TRACE_FILE', raising=False)
+        agent = Agent(role='Researcher', goal='g', backstory='b', llm=FakeListChatModel(responses=[FINISH]))
+        crew = Crew(agents=[agent], tasks=[Task(description='d', expected_output='e', agent=agent)])
+
+        assert instrument_crew(crew) is crew
+        assert 'kickoff' not in vars(crew)
+        assert agent.callbacks is None
@@ -0,0 +1,475 @@
+#!/usr/bin/env python
+"""Long-lived execution service for the crews in this repository.
+
+Every crew package's ``run()`` entry point starts Python, imports crewai and
+builds its tools before any work happens. The service pays that once. It
+keeps warm worker processes per crew (see ``worker.py``), queues run requests
+by priority, and hands each job to an idle worker. Results are collected
+asynchronously: submit a job, then poll it or wait on it.
+
+Each crew runs in its own processes because crewai records the tasks of every
+``@CrewBase`` class in one global list. Two crew packages cannot build their
+crews in the same interpreter, and neither can two kickoffs of one crew run
+side by side in it.
+
+Scheduling:
+
+- queued jobs run highest ``priority`` first, in submission order within a priority;
+- at most ``--max-concurrency`` jobs run at once across all crews, and at
+  most ``--workers <crew>=<n>`` (default 1) for one crew;
+- a job held back by its crew's limit does not block jobs for other crews;
+- workers are reused across jobs. A worker that crashes or runs past
+  ``--job-timeout`` is replaced and its job fails.
+
+API, JSON over HTTP on ``--port`` or on a Unix socket with ``--socket``::
+
+    POST   /jobs               {"crew": "sales_pipeline_crew", "inputs": {...}, "priority": 0}  -> 202 job
+                               add "resume": true to skip checkpointed tasks (financial_agent, jobsearch_crew)
+    GET    /jobs/<id>?wait=30  the job, after waiting up to 30 s for it to finish
+    GET    /jobs               every job the service remembers
+    DELETE /jobs/<id>          cancel a queued job
+    GET    /health             queue length and workers per crew
+
+Run it from the repository root with an environment that has the crews'
+dependencies (``requirements.txt``)::
+
+    python crew_service/service.py --port 8765 --max-concurrency 4 --workers jobsearch_crew=2 --warm all
+"""
+import argparse
+import bisect
+import itertools
+import json
+import os
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'worker.py')
+DEFAULT_PORT = 8765
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_WORKER_START_TIMEOUT = 120.0
+MAX_FINISHED_JOBS = 1000
+MAX_WAIT = 300.0
+
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+
+@dataclass(frozen=True)
+class CrewSpec:
+    """How to start workers for one crew.
+
+    Attributes:
+        name: Name jobs use to ask for the crew.
+        directory: Package directory, the workers' working directory.
+        module: Module holding the ``@CrewBase`` class.
+        attribute: Name of that class.
+        python: Interpreter for the workers, e.g. the package's own virtualenv.
+        max_workers: Jobs of this crew running at once.
+        resumable: Whether the crew checkpoints its tasks, so jobs may ask to ``resume``.
+    """
+
+    name: str
+    directory: str
+    module: str
+    attribute: str
+    python: str = sys.executable
+    max_workers: int = 1
+    resumable: bool = False
+
+
+CREWS: Dict[str, CrewSpec] = {
+    spec.name: spec for spec in (
+        CrewSpec('financial_agent', os.path.join(ROOT, 'financial_agent'), 'financial_agent.crew', 'FinancialAgentCrew',
+                 resumable=True),
+        CrewSpec('jobsearch_crew', os.path.join(ROOT, 'jobsearch_crew'), 'jobsearch_crew.crew', 'JobsearchCrewCrew',
+                 resumable=True),
+        CrewSpec('project_planning_crew', os.path.join(ROOT, 'project_planning_crew'),
+                 'project_planning_crew.crew', 'ProjectPlanningCrewCrew'),
+        CrewSpec('sales_pipeline_crew', os.path.join(ROOT, 'sales_pipeline_crew'),
+                 'sales_pipeline_crew.crew', 'SalesPipelineCrewCrew'),
+    )
+}
+
+
+class WorkerError(RuntimeError):
+    """Raised when a worker process fails to start or dies during a job."""
+
+
+@dataclass
+class Job:
+    """One run request and, once it finishes, its outcome."""
+
+    crew: str
+    inputs: Dict[str, Any]
+    priority: int = 0
+    resume: bool = False
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    status: str = QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[str] = None
+    error: Optional[str] = None
+    usage: Optional[dict] = None
+    worker_pid: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        fields = dict(self.__dict__)
+        fields['queued_s'] = round((self.started_at or time.time()) - self.submitted_at, 3)
+        if self.started_at is not None:
+            fields['run_s'] = round((self.finished_at or time.time()) - self.started_at, 3)
+        return fields
+
+
+class Worker:
+    """One warm worker process for a crew, running one job at a time."""
+
+    def __init__(self, spec: CrewSpec, start_timeout: float = DEFAULT_WORKER_START_TIMEOUT):
+        self.spec = spec
+        env = dict(os.environ, PYTHONUNBUFFERED='1')
+        self.process = subprocess.Popen(
+            [spec.python, WORKER, spec.module, spec.attribute], cwd=spec.directory, env=env,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, encoding='utf-8')
+        self.pid = self.process.pid
+        timer = threading.Timer(start_timeout, self.stop)
+        timer.start()
+        try:
+            ready = self._receive()
+        except Exception:
+            self.stop()
+            raise
+        finally:
+            timer.cancel()
+        if ready.get('event') != 'ready':
+            self.stop()
+            raise WorkerError(f"{spec.name} worker failed to start: {ready.get('error', 'no ready message')}")
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def _receive(self) -> Dict[str, Any]:
+        line = self.process.stdout.readline()
+        if not line:
+            self.process.wait()
+            raise WorkerError(f"{self.spec.name} worker exited with code {self.process.returncode}")
+        return json.loads(line)
+
+    def run(self, job: Job, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Send ``job`` to the worker and wait for its response.
+
+        Raises:
+            WorkerError: If the worker dies, or is stopped after ``timeout`` seconds
+        """
+        request = {'id': job.id, 'inputs': job.inputs, 'resume': job.resume}
+        timer = threading.Timer(timeout, self.stop) if timeout else None
+        if timer:
+            timer.start()
+        try:
+            self.process.stdin.write(json.dumps(request) + '\n')
+            self.process.stdin.flush()
+            return self._receive()
+        except (BrokenPipeError, WorkerError) as error:
+            if timer and not timer.is_alive():
+                raise WorkerError(f"timed out after {timeout:g}s") from error
+            raise WorkerError(str(error) if isinstance(error, WorkerError) else f"{self.spec.name} worker exited") from error
+        finally:
+            if timer:
+                timer.cancel()
+
+    def stop(self) -> None:
+        if self.alive:
+            self.process.kill()
+        self.process.wait()
+
+
+class CrewService:
+    """Priority queue of crew runs executed on warm, per-crew worker processes.
+
+    Args:
+        crews: The crews jobs may ask for, by name.
+        max_concurrency: Jobs running at once across all crews.
+        job_timeout: Seconds a job may run before its worker is killed, or ``None``.
+    """
+
+    def __init__(self, crews: Optional[Dict[str, CrewSpec]] = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 job_timeout: Optional[float] = None):
+        self.crews = dict(crews or CREWS)
+        self.max_concurrency = max_concurrency
+        self.job_timeout = job_timeout
+        self.jobs: Dict[str, Job] = {}
+        self._queue: List[tuple] = []
+        self._order = itertools.count()
+        self._idle: Dict[str, List[Worker]] = {name: [] for name in self.crews}
+        self._running: Dict[str, int] = {name: 0 for name in self.crews}
+        self._changed = threading.Condition()
+        self._stopping = False
+        self._dispatcher = threading.Thread(target=self._dispatch, name='crew-service-dispatcher', daemon=True)
+
+    def start(self) -> 'CrewService':
+        self._dispatcher.start()
+        return self
+
+    def warm(self, names: Iterable[str]) -> None:
+        """Start one idle worker for each crew in ``names`` now rather than on its first job."""
+        for name in names:
+            worker = Worker(self.crews[name])
+            with self._changed:
+                self._idle[name].append(worker)
+
+    def submit(self, crew: str, inputs: Optional[Dict[str, Any]] = None, priority: int = 0, resume: bool = False) -> Job:
+        """Queue a run of ``crew`` and return its job at once.
+
+        Raises:
+            KeyError: If ``crew`` is not one of the service's crews
+            ValueError: If ``resume`` is asked of a crew without checkpoints
+        """
+        if crew not in self.crews:
+            raise KeyError(f"unknown crew {crew!r}, expected one of {', '.join(sorted(self.crews))}")
+        if resume and not self.crews[crew].resumable:
+            raise ValueError(f"crew {crew!r} does not checkpoint its tasks and cannot resume")
+        job = Job(crew=crew, inputs=dict(inputs or {}), priority=int(priority), resume=bool(resume))
+        with self._changed:
+            self.jobs[job.id] = job
+            bisect.insort(self._queue, (-job.priority, next(self._order), job.id))
+            self._changed.notify_all()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._changed:
+            return self.jobs.get(job_id)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """Return the job once it has finished or ``timeout`` seconds have passed."""
+        with self._changed:
+            self._changed.wait_for(lambda: job_id not in self.jobs or self.jobs[job_id].status in FINISHED, timeout)
+            return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job; running and finished jobs are left alone."""
+        with self._changed:
+            job = self.jobs.get(job_id)
+            if job is None or job.status != QUEUED:
+                return False
+            self._queue = [entry for entry in self._queue if entry[2] != job_id]
+            job.status, job.finished_at = CANCELLED, time.time()
+            self._changed.notify_all()
+            return True
+
+    def health(self) -> Dict[str, Any]:
+        with self._changed:
+            return {
+                'queued': len(self._queue),
+                'running': sum(self._running.values()),
+                'max_concurrency': self.max_concurrency,
+                'crews': {name: {'running': self._running[name], 'idle_workers': len(self._idle[name]),
+                                 'max_workers': spec.max_workers} for name, spec in self.crews.items()},
+            }
+
+    def stop(self) -> None:
+        with self._changed:
+            self._stopping = True
+            workers = [worker for idle in self._idle.values() for worker in idle]
+            self._changed.notify_all()
+        for worker in workers:
+            worker.stop()
+
+    def _next_job(self) -> Optional[Job]:
+        # Called with the lock held; skips jobs whose crew is at its own limit
+        if sum(self._running.values()) >= self.max_concurrency:
+            return None
+        for index, (_, _, job_id) in enumerate(self._queue):
+            job = self.jobs[job_id]
+            if self._running[job.crew] < self.crews[job.crew].max_workers:
+                del self._queue[index]
+                return job
+        return None
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._changed:
+                job = None
+                while not self._stopping and (job := self._next_job()) is None:
+                    self._changed.wait()
+                if self._stopping:
+                    return
+                job.status, job.started_at = RUNNING, time.time()
+                self._running[job.crew] += 1
+            threading.Thread(target=self._execute, args=(job,), name=f"crew-job-{job.id}", daemon=True).start()
+
+    def _execute(self, job: Job) -> None:
+        with self._changed:
+            worker = self._idle[job.crew].pop() if self._idle[job.crew] else None
+        outcome: Dict[str, Any] = {'status': FAILED, 'error': 'job was interrupted'}
+        reusable = False
+        try:
+            # Starting a worker takes seconds, so it happens here rather than on the dispatcher
+            worker = worker or Worker(self.crews[job.crew])
+            job.worker_pid = worker.pid
+            outcome = worker.run(job, self.job_timeout)
+            reusable = True
+        except WorkerError as error:
+            outcome = {'status': FAILED, 'error': str(error)}
+        except Exception as error:
+            # A worker that could not start or answered out of protocol is not reused
+            outcome = {'status': FAILED, 'error': f"{type(error).__name__}: {error}"}
+        finally:
+            with self._changed:
+                job.status = outcome.get('status', FAILED)
+                job.result, job.error, job.usage = outcome.get('result'), outcome.get('error'), outcome.get('usage')
+                job.finished_at = time.time()
+                self._running[job.crew] -= 1
+                if worker is not None and reusable and worker.alive and not self._stopping:
+                    self._idle[job.crew].append(worker)
+                elif worker is not None:
+                    worker.stop()
+                self._forget_old_jobs()
+                self._changed.notify_all()
+
+    def _forget_old_jobs(self) -> None:
+        finished = [job for job in self.jobs.values() if job.status in FINISHED]
+        for job in sorted(finished, key=lambda job: job.finished_at)[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[job.id]
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    """JSON API of a :class:`CrewService`, reached through ``self.server.service``."""
+
+    def _send(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _job_id(self, path: str) -> Optional[str]:
+        parts = path.strip('/').split('/')
+        return parts[1] if len(parts) == 2 and parts[0] == 'jobs' else None
+
+    def do_GET(self):
+        service = self.server.service
+        url = urlsplit(self.path)
+        if url.path == '/health':
+            return self._send(200, service.health())
+        if url.path.rstrip('/') == '/jobs':
+            with service._changed:
+                jobs = [job.to_dict() for job in service.jobs.values()]
+            return self._send(200, {'jobs': jobs})
+        job_id = self._job_id(url.path)
+        if job_id is None:
+            return self._send(404, {'error': 'not found'})
+        wait = float(parse_qs(url.query).get('wait', ['0'])[0] or 0)
+        job = service.wait(job_id, min(wait, MAX_WAIT)) if wait > 0 else service.get(job_id)
+        if job is None:
+            return self._send(404, {'error': f"no job {job_id}"})
+        self._send(200, job.to_dict())
+
+    def do_POST(self):
+        if urlsplit(self.path).path.rstrip('/') != '/jobs':
+            return self._send(404, {'error': 'not found'})
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length') or 0)) or b'{}')
+            job = self.server.service.submit(request['crew'], request.get('inputs'), request.get('priority', 0),
+                                             request.get('resume', False))
+        except KeyError as error:
+            return self._send(400, {'error': error.args[0] if error.args[0] != 'crew' else 'missing "crew"'})
+        except (ValueError, TypeError, AttributeError) as error:
+            return self._send(400, {'error': f"invalid request: {error}"})
+        self._send(202, job.to_dict())
+
+    def do_DELETE(self):
+        job_id = self._job_id(urlsplit(self.path).path)
+        service = self.server.service
+        if job_id is None or service.get(job_id) is None:
+            return self._send(404, {'error': 'not found'})
+        if not service.cancel(job_id):
+            return self._send(409, {'error': 'only queued jobs can be cancelled'})
+        self._send(200, service.get(job_id).to_dict())
+
+    def log_message(self, format, *args):
+        pass
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server on a Unix domain socket."""
+
+    daemon_threads = True
+
+
+def make_server(service: CrewService, host: str = '127.0.0.1', port: int = DEFAULT_PORT,
+                socket_path: Optional[str] = None) -> socketserver.BaseServer:
+    """Create the API server for ``service`` on ``host:port``, or on ``socket_path`` if given."""
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = UnixHTTPServer(socket_path, ServiceHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), ServiceHandler)
+    server.service = service
+    return server
+
+
+def _assignments(values: List[str], option: str) -> Dict[str, str]:
+    pairs = {}
+    for value in values:
+        name, _, setting = value.partition('=')
+        if name not in CREWS or not setting:
+            raise SystemExit(f"{option} expects <crew>=<value> with a crew in {', '.join(CREWS)}, got {value!r}")
+        pairs[name] = setting
+    return pairs
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Run the crews as a long-lived local service with a job queue.')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='TCP port to listen on')
+    parser.add_argument('--socket', help='Listen on this Unix socket instead of TCP')
+    parser.add_argument('--max-concurrency', type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help='Jobs running at once across all crews')
+    parser.add_argument('--workers', action='append', default=[], metavar='CREW=N',
+                        help='Jobs of one crew running at once (default 1)')
+    parser.add_argument('--python', action='append', default=[], metavar='CREW=PATH',
+                        help="Interpreter for a crew's workers, e.g. its Poetry virtualenv")
+    parser.add_argument('--warm', action='append', default=[], metavar='CREW',
+                        help="Start a crew's first worker at startup ('all' for every crew)")
+    parser.add_argument('--job-timeout', type=float, help='Seconds a job may run before its worker is killed')
+    args = parser.parse_args(argv)
+
+    workers = _assignments(args.workers, '--workers')
+    pythons = _assignments(args.python, '--python')
+    crews = {name: replace(spec, max_workers=int(workers.get(name, spec.max_workers)), python=pythons.get(name, spec.python))
+             for name, spec in CREWS.items()}
+    service = CrewService(crews, max_concurrency=args.max_concurrency, job_timeout=args.job_timeout)
+    warm = list(CREWS) if 'all' in args.warm else args.warm
+    unknown = [name for name in warm if name not in CREWS]
+    if unknown:
+        raise SystemExit(f"--warm expects crews in {', '.join(CREWS)} or 'all', got {', '.join(unknown)}")
+    service.warm(warm)
+    service.start()
+    server = make_server(service, args.host, args.port, args.socket)
+    print(f"Crew service listening on {args.socket or f'http://{args.host}:{args.port}'}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+
+
+if __name__ == '__main__':
+    main()
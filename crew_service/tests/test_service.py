@@ -0,0 +1,229 @@
+import http.client
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+import pytest
+
+from service import CREWS, FAILED, QUEUED, SUCCEEDED, CrewService, CrewSpec, make_server
+
+FAKE_CREW = '''
+import os
+import time
+
+
+class FakeCrew:
+    """Stands in for a @CrewBase class; kickoff behaves as the inputs say"""
+
+    def crew(self):
+        return self
+
+    def kickoff(self, inputs=None, resume=False):
+        inputs = inputs or {}
+        print('agent chatter that must not reach the service')
+        if inputs.get('crash'):
+            os._exit(3)
+        if inputs.get('fail'):
+            raise RuntimeError('provider down')
+        time.sleep(inputs.get('sleep', 0))
+        with open('order.log', 'a') as handle:
+            handle.write(f"{inputs.get('name')}\\n")
+        return f"{inputs.get('name')} resume={resume} pid={os.getpid()}"
+'''
+
+
+@pytest.fixture
+def crew_dir(tmp_path):
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'src' / 'fake_crew.py').write_text(FAKE_CREW)
+    return tmp_path
+
+
+@pytest.fixture
+def service(crew_dir):
+    services = []
+
+    def start(max_concurrency=4, job_timeout=None, python=sys.executable, resumable=True, **workers):
+        crews = {name: CrewSpec(name, str(crew_dir), 'fake_crew', 'FakeCrew', python=python, max_workers=count,
+                                resumable=resumable)
+                 for name, count in (workers or {'fake': 1}).items()}
+        instance = CrewService(crews, max_concurrency=max_concurrency, job_timeout=job_timeout).start()
+        services.append(instance)
+        return instance
+    yield start
+    for instance in services:
+        instance.stop()
+
+
+def finished(service, jobs, timeout=20):
+    return [service.wait(job.id, timeout) for job in jobs]
+
+
+def running(service, job, timeout=20):
+    deadline = time.monotonic() + timeout
+    while service.get(job.id).status == QUEUED and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return job
+
+
+class TestCrewService:
+    """Test suite for queueing jobs onto warm worker processes"""
+
+    def test_jobs_reuse_a_warm_worker(self, service):
+        """Test that consecutive jobs of a crew run in the same worker process and return their results"""
+        crews = service()
+        first = finished(crews, [crews.submit('fake', {'name': 'a'})])[0]
+        second = finished(crews, [crews.submit('fake', {'name': 'b'}, resume=True)])[0]
+
+        assert first.status == second.status == SUCCEEDED
+        assert first.result == f"a resume=False pid={first.worker_pid}"
+        assert second.result == f"b resume=True pid={first.worker_pid}"
+
+    def test_higher_priority_jobs_run_first(self, service, crew_dir):
+        """Test that queued jobs start by priority, then in submission order"""
+        crews = service()
+        crews.warm(['fake'])
+        blocker = running(crews, crews.submit('fake', {'name': 'blocker', 'sleep': 0.5}))
+        jobs = [crews.submit('fake', {'name': name}, priority=priority)
+                for name, priority in [('low', 0), ('high', 10), ('normal', 5), ('low-2', 0)]]
+
+        finished(crews, [blocker, *jobs])
+
+        assert (crew_dir / 'order.log').read_text().split() == ['blocker', 'high', 'normal', 'low', 'low-2']
+
+    def test_concurrency_limits(self, service):
+        """Test that a crew never runs more jobs than its workers and a busy crew does not hold up others"""
+        crews = service(max_concurrency=3, busy=2, other=1)
+        busy = [crews.submit('busy', {'name': f"busy-{index}", 'sleep': 0.6}) for index in range(4)]
+        other = crews.submit('other', {'name': 'other'})
+
+        jobs = finished(crews, [*busy, other])
+
+        assert all(job.status == SUCCEEDED for job in jobs)
+        assert len({job.worker_pid for job in busy}) == 2
+        assert other.finished_at < max(job.finished_at for job in busy[:2])
+        spans = [(job.started_at, job.finished_at) for job in busy]
+        assert max(sum(start <= moment < end for start, end in spans) for moment, _ in spans) == 2
+
+    def test_failures_are_reported_and_crashed_workers_replaced(self, service):
+        """Test that errors and worker crashes fail only their own job"""
+        crews = service()
+        failed, crashed, after = finished(crews, [
+            crews.submit('fake', {'fail': True}), crews.submit('fake', {'crash': True}), crews.submit('fake', {'name': 'after'})])
+
+        assert failed.status == FAILED and failed.error == 'RuntimeError: provider down'
+        assert crashed.status == FAILED and 'exited with code 3' in crashed.error
+        assert after.status == SUCCEEDED and after.worker_pid != crashed.worker_pid
+
+    def test_broken_workers_fail_the_job_and_free_the_slot(self, service, tmp_path):
+        """Test that a missing interpreter or a worker speaking garbage fails the job without losing its slot"""
+        garbled = tmp_path / 'garbled'
+        garbled.write_text('#!/bin/sh\necho \'{"event": "ready", "pid": 1}\'\nread request\necho not json\nsleep 30\n')
+        garbled.chmod(0o755)
+
+        for python, error in [(str(tmp_path / 'missing' / 'python'), 'FileNotFoundError'), (str(garbled), 'JSONDecodeError')]:
+            crews = service(python=python)
+            jobs = finished(crews, [crews.submit('fake', {'name': 'a'}), crews.submit('fake', {'name': 'b'})])
+
+            assert [job.status for job in jobs] == [FAILED, FAILED]
+            assert all(job.error.startswith(error) for job in jobs)
+            assert crews.health()['crews']['fake'] == {'running': 0, 'idle_workers': 0, 'max_workers': 1}
+
+    def test_job_timeout_kills_the_worker(self, service):
+        """Test that a job running past the timeout fails and the next job gets a fresh worker"""
+        crews = service(job_timeout=0.5)
+        slow, quick = finished(crews, [crews.submit('fake', {'sleep': 5}), crews.submit('fake', {'name': 'quick'})])
+
+        assert slow.status == FAILED and slow.error == 'timed out after 0.5s'
+        assert quick.status == SUCCEEDED
+
+    def test_cancel_only_queued_jobs(self, service):
+        """Test that a queued job can be cancelled and never runs"""
+        crews = service()
+        busy = running(crews, crews.submit('fake', {'name': 'busy', 'sleep': 0.5}))
+        queued = crews.submit('fake', {'name': 'queued'})
+
+        assert crews.cancel(queued.id)
+        assert not crews.cancel(busy.id)
+        assert crews.wait(busy.id, 20).status == SUCCEEDED
+        assert crews.get(queued.id).status == 'cancelled'
+
+    def test_unknown_crews_are_rejected(self, service):
+        """Test that only configured crews can be submitted"""
+        with pytest.raises(KeyError):
+            service().submit('nope')
+
+    def test_resume_only_for_crews_with_checkpoints(self, service):
+        """Test that resume is refused at submit time for a crew that cannot resume"""
+        crews = service(resumable=False)
+
+        with pytest.raises(ValueError):
+            crews.submit('fake', resume=True)
+        assert crews.jobs == {}
+        assert sorted(name for name, spec in CREWS.items() if spec.resumable) == ['financial_agent', 'jobsearch_crew']
+
+    def test_repository_crews_are_registered(self):
+        """Test that the default crews point at the crew modules in this repository"""
+        assert sorted(CREWS) == ['financial_agent', 'jobsearch_crew', 'project_planning_crew', 'sales_pipeline_crew']
+        for spec in CREWS.values():
+            assert os.path.isfile(os.path.join(spec.directory, 'src', *spec.module.split('.')) + '.py')
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+
+    def __init__(self, path):
+        super().__init__('localhost')
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+
+
+def call(connection, method, path, body=None):
+    connection.request(method, path, body=json.dumps(body) if body is not None else None,
+                       headers={'Content-Type': 'application/json'})
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+class TestServiceAPI:
+    """Test suite for the JSON API over TCP and Unix sockets"""
+
+    @pytest.fixture(params=['tcp', 'unix'])
+    def connect(self, request, service, tmp_path):
+        crews = service()
+        socket_path = str(tmp_path / 'crews.sock') if request.param == 'unix' else None
+        server = make_server(crews, port=0, socket_path=socket_path)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        yield lambda: UnixHTTPConnection(socket_path) if socket_path else http.client.HTTPConnection(*server.server_address)
+        server.shutdown()
+        server.server_close()
+
+    def test_submit_and_wait_for_a_job(self, connect):
+        """Test that a submitted job is accepted at once and its result can be awaited"""
+        connection = connect()
+        status, job = call(connection, 'POST', '/jobs', {'crew': 'fake', 'inputs': {'name': 'api'}, 'priority': 3})
+
+        assert status == 202 and job['status'] == QUEUED and job['priority'] == 3
+        status, done = call(connection, 'GET', f"/jobs/{job['id']}?wait=20")
+        assert status == 200 and done['status'] == SUCCEEDED and done['result'].startswith('api resume=False')
+        status, listing = call(connection, 'GET', '/jobs')
+        assert [entry['id'] for entry in listing['jobs']] == [job['id']]
+        status, health = call(connection, 'GET', '/health')
+        assert health['queued'] == 0 and health['crews']['fake']['idle_workers'] == 1
+
+    def test_rejects_bad_requests(self, connect):
+        """Test that unknown crews, malformed bodies, unknown jobs and running cancellations are refused"""
+        connection = connect()
+
+        assert call(connection, 'POST', '/jobs', {'crew': 'nope'})[0] == 400
+        assert call(connection, 'POST', '/jobs', {'inputs': {}}) == (400, {'error': 'missing "crew"'})
+        assert call(connection, 'GET', '/jobs/missing')[0] == 404
+        _, job = call(connection, 'POST', '/jobs', {'crew': 'fake', 'inputs': {'sleep': 0.5}})
+        while call(connection, 'GET', f"/jobs/{job['id']}")[1]['status'] == QUEUED:
+            time.sleep(0.01)
+        assert call(connection, 'DELETE', f"/jobs/{job['id']}")[0] == 409
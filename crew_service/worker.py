@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""Worker process of the crew execution service.
+
+The service starts one of these per crew worker, in the crew package's
+directory, as ``python worker.py <module> <class>``. The worker imports the
+crew class once, builds a crew to warm up its tools, and then runs one job
+at a time for as long as it lives.
+
+It speaks JSON lines: requests arrive on stdin and responses go out on the
+original stdout. Anything crewai or the agents print goes to stderr
+instead::
+
+    <- {"event": "ready", "pid": 4242}
+    -> {"id": "1f2e3d", "inputs": {"topic": "AI LLMs"}}
+    <- {"id": "1f2e3d", "status": "succeeded", "result": "...", "usage": {...}, "elapsed_s": 12.3}
+"""
+import importlib
+import json
+import os
+import sys
+import time
+import traceback
+from typing import Any, Callable, Dict
+
+
+def warm_up(crew_class: type) -> None:
+    """Build a crew once so its modules, agents and shared tools are loaded before the first job."""
+    try:
+        crew_class().crew()
+    except Exception as error:
+        # The first job reports the real problem, if there is one
+        print(f"warm-up build failed: {type(error).__name__}: {error}", file=sys.stderr)
+
+
+def run_job(crew_class: type, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one kickoff of a fresh crew and describe the outcome."""
+    started = time.perf_counter()
+    response: Dict[str, Any] = {'id': request.get('id')}
+    try:
+        crew = crew_class().crew()
+        options = {'resume': True} if request.get('resume') else {}
+        result = crew.kickoff(inputs=request.get('inputs') or {}, **options)
+        response.update(status='succeeded', result=str(result), usage=getattr(crew, 'usage_metrics', None))
+    except Exception as error:
+        response.update(status='failed', error=f"{type(error).__name__}: {error}", traceback=traceback.format_exc())
+    response['elapsed_s'] = round(time.perf_counter() - started, 3)
+    return response
+
+
+def main(argv=None) -> int:
+    module_name, attribute = (argv or sys.argv)[1:3]
+    # Keep the real stdout for the protocol and send every other write to stderr
+    protocol = os.fdopen(os.dup(1), 'w', encoding='utf-8', buffering=1)
+    os.dup2(2, 1)
+
+    def send(message: Dict[str, Any]) -> None:
+        protocol.write(json.dumps(message, default=str) + '\n')
+        protocol.flush()
+
+    sys.path.insert(0, os.path.join(os.getcwd(), 'src'))
+    try:
+        crew_class: Callable = getattr(importlib.import_module(module_name), attribute)
+    except Exception as error:
+        send({'event': 'failed', 'error': f"{type(error).__name__}: {error}"})
+        return 1
+    warm_up(crew_class)
+    send({'event': 'ready', 'pid': os.getpid()})
+    for line in sys.stdin:
+        if line.strip():
+            send(run_job(crew_class, json.loads(line)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""LLM calls and latency of the hierarchical and pipeline processes.
+
+Both processes run the real crew (agents, tasks, prompts) against scripted
+chat models that answer with recorded responses after a fixed delay, so the
+comparison is repeatable and offline:
+
+- every agent answers its task in one call;
+- in hierarchical mode the manager delegates each task to its agent and then
+  gives the final answer, which is how a well-behaved manager run looks.
+
+Run from the project root:
+
+    python benchmarks/bench_process_modes.py [latency_seconds] [runs]
+"""
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+os.environ.setdefault('OTEL_SDK_DISABLED', 'true')
+os.environ.setdefault('OPENAI_API_KEY', 'benchmark')
+os.environ.setdefault('CREW_RUN_MODE', 'prod')
+os.environ.setdefault('CREW_LOG_FILE', os.path.join(tempfile.gettempdir(), 'bench_process_modes.log'))
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel  # noqa: E402
+
+from financial_agent.crew import HIERARCHICAL, PROCESSES, FinancialAgentCrew  # noqa: E402
+
+INPUTS = {
+    'stock_selection': 'AAPL',
+    'initial_capital': '100000',
+    'risk_tolerance': 'Medium',
+    'trading_strategy_preference': 'Day Trading',
+    'news_impact_consideration': True,
+}
+
+
+class ScriptedChatModel(FakeListChatModel):
+    """Chat model replaying its responses in order, each after ``latency`` seconds"""
+
+    latency: float = 0.0
+    calls: int = 0
+
+    def _call(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.latency)
+        self.calls += 1
+        return super()._call(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    def stream(self, input, config=None, *, stop=None, **kwargs):
+        yield self.invoke(input, config=config, stop=stop, **kwargs)
+
+
+def final(text: str) -> str:
+    return f"Thought: I now know the final answer\nFinal Answer: {text}"
+
+
+def delegate(role: str) -> str:
+    return ('Thought: this is a job for my co-worker\nAction: Delegate work to co-worker\n'
+            f'Action Input: {json.dumps({"task": "Complete the task", "context": "See the task", "coworker": role})}')
+
+
+def run_once(process: str, latency: float) -> dict:
+    crew_base = FinancialAgentCrew(process=process)
+    crew = crew_base.crew()
+    models = []
+    for agent in crew.agents:
+        agent.llm = ScriptedChatModel(responses=[final(f"{agent.role.strip()} findings")], latency=latency)
+        models.append(agent.llm)
+    manager_calls = 0
+    if process == HIERARCHICAL:
+        script = []
+        for task in crew.tasks:
+            script += [delegate(task.agent.role.strip()), final('Consolidated answer')]
+        crew.manager_llm = ScriptedChatModel(responses=script, latency=latency)
+    started = time.perf_counter()
+    crew.kickoff(inputs=INPUTS)
+    elapsed = time.perf_counter() - started
+    if process == HIERARCHICAL:
+        manager_calls = crew.manager_llm.calls
+    return {
+        'llm_calls': sum(model.calls for model in models) + manager_calls,
+        'manager_calls': manager_calls,
+        'seconds': elapsed,
+    }
+
+
+def main() -> None:
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.5
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    print(f"{runs} runs per process, {latency}s per LLM call")
+    for process in PROCESSES:
+        samples = [run_once(process, latency) for _ in range(runs)]
+        seconds = [sample['seconds'] for sample in samples]
+        print(f"{process:<13} llm calls {samples[-1]['llm_calls']:3d} (manager {samples[-1]['manager_calls']:2d})"
+              f"   median {statistics.median(seconds):6.2f} s   min {min(seconds):6.2f} s")
+
+
+if __name__ == '__main__':
+    main()
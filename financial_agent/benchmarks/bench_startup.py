@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""Startup latency of the Financial Agent Crew.
+
+Each run starts a fresh interpreter and times three stages:
+
+- ``import``: ``import financial_agent.crew``
+- ``construct``: ``FinancialAgentCrew()``
+- ``build``: ``.crew()``, which builds the agents and therefore their tools
+
+Run from the project root:
+
+    python benchmarks/bench_startup.py [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+COMMON_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'crew_common', 'src')
+
+PROBE = """
+import json, time
+started = time.perf_counter()
+import financial_agent.crew as crew_module
+imported = time.perf_counter()
+instance = crew_module.FinancialAgentCrew()
+constructed = time.perf_counter()
+try:
+    from crew_common.tool_registry import built_tools
+    tools_before_build = len(built_tools())
+except ImportError:
+    tools_before_build = None
+instance.crew()
+built = time.perf_counter()
+print(json.dumps({
+    'import': imported - started,
+    'construct': constructed - imported,
+    'build': built - constructed,
+    'tools_before_build': tools_before_build,
+}))
+"""
+
+
+def probe() -> dict:
+    # Telemetry export at interpreter exit would dominate the wall clock
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join([SRC, COMMON_SRC]), 'OTEL_SDK_DISABLED': 'true',
+           'OPENAI_API_KEY': os.getenv('OPENAI_API_KEY') or 'benchmark'}
+    output = subprocess.run([sys.executable, '-c', PROBE], env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    samples = [probe() for _ in range(runs)]
+    for stage in ('import', 'construct', 'build'):
+        times = [sample[stage] * 1000 for sample in samples]
+        print(f"{stage:<10} median {statistics.median(times):8.1f} ms   min {min(times):8.1f} ms")
+    print(f"tools built before crew(): {samples[-1]['tools_before_build']}")
+
+
+if __name__ == '__main__':
+    main()
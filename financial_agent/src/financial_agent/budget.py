@@ -0,0 +1,422 @@
+"""Token, LLM call, cost and wall-clock budgets for crew runs.
+
+A budget, read from ``config/budget.yaml``, sets ceilings for the whole
+kickoff (``run``) and for each agent, keyed as in ``agents.yaml`` with
+``manager`` for the hierarchical manager:
+
+- ``max_tokens``: prompt plus completion tokens;
+- ``max_llm_calls``: LLM requests; responses served by the LLM cache are free;
+- ``max_cost``: USD, priced per 1K tokens with the ``prices`` table;
+- ``max_seconds``: wall-clock time of the kickoff, for ``run`` only.
+
+Once a scope has used ``degrade_at`` of any of its limits it is degraded:
+its agents (every agent, for ``run``) stop delegating and switch to
+``fallback_model`` from their next task or delegation on. When a limit is
+reached the scope is exhausted and its next LLM call raises
+:class:`BudgetExceeded`. An exhausted agent fails the delegation it was
+running, which the manager sees as a tool error; an exhausted run aborts
+the kickoff. Degraded agents get their model and delegation back when the
+kickoff ends.
+
+Calls are counted by a LangChain callback handler on every agent's LLM.
+Provider-reported usage is used where there is any. Agents stream their
+calls unless the LLM cache is on, and streamed calls report no usage, so
+their completion is counted one token per chunk and their prompt is
+estimated at four characters per token.
+"""
+import functools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import yaml
+from langchain_core.callbacks import BaseCallbackHandler
+
+from crew_common.run_mode import LOGGER_NAME
+
+RUN = 'run'
+MANAGER = 'manager'
+DELEGATION_TOOLS = ('Delegate work to co-worker', 'Ask question to co-worker')
+CHARS_PER_TOKEN = 4
+DEFAULT_DEGRADE_AT = 0.8
+
+# Under the crew logger so budget events land in the crew's log file
+logger = logging.getLogger(f"{LOGGER_NAME}.budget")
+
+
+class BudgetExceeded(RuntimeError):
+    """Raised on the next LLM call of a run or agent that has reached a limit."""
+
+    def __init__(self, scope: str, limit: str, used: float, allowed: float):
+        super().__init__(f"{scope} budget exceeded: {limit} used {used:g} of {allowed:g}")
+        self.scope = scope
+        self.limit = limit
+        self.used = used
+        self.allowed = allowed
+
+
+@dataclass(frozen=True)
+class Limits:
+    """Ceilings for one scope; None means unlimited."""
+
+    max_tokens: Optional[int] = None
+    max_llm_calls: Optional[int] = None
+    max_cost: Optional[float] = None
+    max_seconds: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, values: Optional[dict], scope: str) -> 'Limits':
+        values = values or {}
+        known = {limit.name for limit in fields(cls)}
+        unknown = set(values) - known
+        if unknown:
+            raise ValueError(f"Unknown budget limits for {scope}: {', '.join(sorted(unknown))}")
+        if scope != RUN and values.get('max_seconds') is not None:
+            raise ValueError(f"max_seconds can only be set for the run, not {scope}")
+        for name, value in values.items():
+            if value is not None and value <= 0:
+                raise ValueError(f"Budget limit {scope}.{name} must be positive, got {value!r}")
+        return cls(**values)
+
+    def share_used(self, usage: 'Usage', elapsed: float = 0.0) -> Tuple[float, Optional[str], float, float]:
+        """Return the largest share of a limit used, with that limit's name, usage and ceiling."""
+        worst: Tuple[float, Optional[str], float, float] = (0.0, None, 0.0, 0.0)
+        for name, used in (('max_tokens', usage.tokens), ('max_llm_calls', usage.llm_calls),
+                           ('max_cost', usage.cost), ('max_seconds', elapsed)):
+            allowed = getattr(self, name)
+            if allowed is not None and used / allowed > worst[0]:
+                worst = (used / allowed, name, used, allowed)
+        return worst
+
+
+@dataclass
+class Usage:
+    """What one scope has spent so far in a kickoff."""
+
+    tokens: int = 0
+    llm_calls: int = 0
+    cached_calls: int = 0
+    cost: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {'tokens': self.tokens, 'llm_calls': self.llm_calls,
+                'cached_calls': self.cached_calls, 'cost': round(self.cost, 4)}
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Parsed ``budget.yaml``: limits per scope and what degrading does."""
+
+    run: Limits = Limits()
+    agents: Dict[str, Limits] = field(default_factory=dict)
+    degrade_at: Optional[float] = DEFAULT_DEGRADE_AT
+    disable_delegation: bool = True
+    fallback_model: Optional[str] = None
+    prices: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, config: Optional[dict], agent_names: Optional[List[str]] = None) -> 'Budget':
+        """Build a budget from its YAML mapping.
+
+        Args:
+            config: The mapping read from ``budget.yaml``.
+            agent_names: Agent keys of ``agents.yaml``; when given, budgets for other agents are rejected.
+
+        Raises:
+            ValueError: If a key, limit or threshold is not valid
+        """
+        config = dict(config or {})
+        agents = config.pop('agents', None) or {}
+        degrade = dict(config.pop('degrade', None) or {})
+        budget = cls(
+            run=Limits.from_dict(config.pop('run', None), RUN),
+            agents={name: Limits.from_dict(limits, name) for name, limits in agents.items()},
+            degrade_at=config.pop('degrade_at', DEFAULT_DEGRADE_AT),
+            disable_delegation=bool(degrade.pop('disable_delegation', True)),
+            fallback_model=degrade.pop('fallback_model', None),
+            prices={model: float(price) for model, price in (config.pop('prices', None) or {}).items()},
+        )
+        if config or degrade:
+            raise ValueError(f"Unknown budget settings: {', '.join(sorted([*config, *degrade]))}")
+        if agent_names is not None:
+            unknown = set(budget.agents) - set(agent_names) - {MANAGER}
+            if unknown:
+                raise ValueError(f"Budget for unknown agents: {', '.join(sorted(unknown))}")
+        if budget.degrade_at is not None and not 0 < budget.degrade_at <= 1:
+            raise ValueError(f"degrade_at must be between 0 and 1, got {budget.degrade_at!r}")
+        return budget
+
+    def price(self, model: Optional[str]) -> float:
+        """USD per 1K tokens for ``model``, by longest matching name prefix, 0 if unpriced."""
+        matches = [name for name in self.prices if model and model.startswith(name)]
+        return self.prices[max(matches, key=len)] if matches else 0.0
+
+
+def load_budget(path: str, agents_config: Optional[dict] = None) -> Budget:
+    """Read a budget YAML file, checking its agent keys against ``agents_config``."""
+    with open(path, encoding='utf-8') as handle:
+        config = yaml.safe_load(handle)
+    return Budget.from_dict(config, list(agents_config) if agents_config is not None else None)
+
+
+def _openai_llm(model: str, llm: Any) -> Any:
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI(model=model, temperature=getattr(llm, 'temperature', 0.7))
+
+
+@dataclass
+class _Call:
+    scope: Optional[str]
+    model: Optional[str]
+    prompt_tokens: int
+    chunks: Optional[int] = None
+
+
+class BudgetTracker(BaseCallbackHandler):
+    """Count every LLM call of a crew against a :class:`Budget` and enforce it.
+
+    Args:
+        budget: Limits and degrade settings.
+        roles: Agent role to budget key, so calls can be charged to the agent making them.
+        fallback_llm: Builds the degraded model from its name and the model it replaces.
+    """
+
+    # Let BudgetExceeded escape LangChain's callback manager
+    raise_error = True
+
+    def __init__(self, budget: Budget, roles: Optional[Dict[str, str]] = None,
+                 fallback_llm: Callable[[str, Any], Any] = _openai_llm):
+        self.budget = budget
+        self.roles = {role.strip(): scope for role, scope in (roles or {}).items()}
+        self.fallback_llm = fallback_llm
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._calls: Dict[UUID, _Call] = {}
+        self._agents: Dict[str, List[Any]] = {}
+        self._saved: Dict[int, Tuple[Any, Any, bool, list]] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Start a new kickoff: clear usage and the degraded and exhausted scopes."""
+        with self._lock:
+            self.started = time.perf_counter()
+            self.finished: Optional[float] = None
+            self.usage: Dict[str, Usage] = {RUN: Usage()}
+            self.degraded: set = set()
+            self.exceeded: Dict[str, BudgetExceeded] = {}
+            self._calls.clear()
+
+    def finish(self) -> None:
+        """Stop the kickoff's clock, so the summary reports its duration rather than the time since it started."""
+        with self._lock:
+            self.finished = time.perf_counter()
+
+    def elapsed(self) -> float:
+        return (self.finished if self.finished is not None else time.perf_counter()) - self.started
+
+    def summary(self) -> dict:
+        """Usage per scope plus the degraded and exhausted scopes of the last kickoff."""
+        with self._lock:
+            return {
+                RUN: dict(self.usage[RUN].as_dict(), elapsed_s=round(self.elapsed(), 3)),
+                'agents': {scope: usage.as_dict() for scope, usage in self.usage.items() if scope != RUN},
+                'degraded': sorted(self.degraded),
+                'exceeded': sorted(self.exceeded),
+            }
+
+    def limits(self, scope: str) -> Limits:
+        return self.budget.run if scope == RUN else self.budget.agents.get(scope, Limits())
+
+    def scope_of(self, agent: Any) -> str:
+        return self.roles.get(agent.role.strip(), MANAGER)
+
+    # Agents
+
+    def track(self, agent: Any) -> str:
+        """Charge ``agent``'s LLM calls to its scope and return the scope, once per agent."""
+        scope = self.scope_of(agent)
+        if getattr(agent, '_budget_tracker', None) is self:
+            return scope
+        object.__setattr__(agent, '_budget_tracker', self)
+        self._add_handler(agent.llm)
+        with self._lock:
+            self._agents.setdefault(scope, []).append(agent)
+            if scope in self.degraded or RUN in self.degraded:
+                self._degrade_agent(agent)
+        execute_task = agent.execute_task
+
+        @functools.wraps(execute_task)
+        def budgeted_execute_task(*args, **kwargs):
+            # Delegation runs the co-worker inside the caller's step, on the same thread
+            stack = self._stack()
+            stack.append(scope)
+            try:
+                return execute_task(*args, **kwargs)
+            finally:
+                stack.pop()
+        object.__setattr__(agent, 'execute_task', budgeted_execute_task)
+        return scope
+
+    def delegation_disabled(self, agent: Any) -> bool:
+        with self._lock:
+            return self.budget.disable_delegation and bool({RUN, self.scope_of(agent)} & self.degraded)
+
+    def restore(self) -> None:
+        """Give degraded agents back their model, tools and delegation."""
+        with self._lock:
+            for agents in self._agents.values():
+                for agent in agents:
+                    saved = self._saved.pop(id(agent), None)
+                    if saved is not None and saved[0] is agent:
+                        _, agent.llm, agent.allow_delegation, agent.tools = saved
+
+    def _add_handler(self, llm: Any) -> None:
+        callbacks = llm.callbacks if isinstance(llm.callbacks, list) else []
+        if self not in callbacks:
+            llm.callbacks = callbacks + [self]
+
+    def _stack(self) -> List[str]:
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def _degrade(self, scope: str) -> None:
+        self.degraded.add(scope)
+        agents = [agent for agents in self._agents.values() for agent in agents] if scope == RUN else self._agents.get(scope, [])
+        for agent in agents:
+            self._degrade_agent(agent)
+
+    def _degrade_agent(self, agent: Any) -> None:
+        if id(agent) not in self._saved:
+            self._saved[id(agent)] = (agent, agent.llm, agent.allow_delegation, list(agent.tools or []))
+        if self.budget.disable_delegation:
+            agent.allow_delegation = False
+            agent.tools = [tool for tool in agent.tools or [] if tool.name not in DELEGATION_TOOLS]
+        model = self.budget.fallback_model
+        if model and getattr(agent.llm, 'model_name', None) != model:
+            llm = self.fallback_llm(model, agent.llm)
+            # Keep the other handlers on the model, such as crewAI's token counter and tracing
+            llm.callbacks = [*(agent.llm.callbacks or [])]
+            self._add_handler(llm)
+            agent.llm = llm
+
+    # Accounting
+
+    def _check(self, scope: Optional[str]) -> None:
+        for name in (RUN, scope):
+            if name in self.exceeded:
+                raise self.exceeded[name]
+        self._evaluate(RUN)
+        if RUN in self.exceeded:
+            raise self.exceeded[RUN]
+
+    def _evaluate(self, scope: str) -> None:
+        if scope in self.exceeded:
+            return
+        share, limit, used, allowed = self.limits(scope).share_used(
+            self.usage.setdefault(scope, Usage()), self.elapsed() if scope == RUN else 0.0)
+        details = {'scope': scope, 'limit': limit, 'used': used, 'allowed': allowed}
+        if share >= 1:
+            self.exceeded[scope] = BudgetExceeded(scope, limit, used, allowed)
+            logger.warning('budget exceeded', extra={'fields': dict(details, event='budget_exceeded')})
+        elif self.budget.degrade_at is not None and share >= self.budget.degrade_at and scope not in self.degraded:
+            self._degrade(scope)
+            logger.warning('budget degraded', extra={'fields': dict(
+                details, event='budget_degraded', fallback_model=self.budget.fallback_model)})
+
+    def _start(self, run_id: UUID, prompt_chars: int, kwargs: dict) -> None:
+        stack = self._stack()
+        scope = stack[-1] if stack else None
+        params = kwargs.get('invocation_params') or {}
+        with self._lock:
+            self._check(scope)
+            self._calls[run_id] = _Call(scope, params.get('model_name') or params.get('model'),
+                                        -(-prompt_chars // CHARS_PER_TOKEN))
+
+    def on_chat_model_start(self, serialized: dict, messages: list, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start(run_id, sum(len(str(message.content)) for batch in messages for message in batch), kwargs)
+
+    def on_llm_start(self, serialized: dict, prompts: List[str], *, run_id: UUID, **kwargs: Any) -> None:
+        self._start(run_id, sum(len(prompt) for prompt in prompts), kwargs)
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        call = self._calls.get(run_id)
+        if call is not None:
+            call.chunks = (call.chunks or 0) + 1
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            self._calls.pop(run_id, None)
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            call = self._calls.pop(run_id, None)
+            if call is None:
+                return
+            scopes = [RUN] + ([call.scope] if call.scope else [])
+            reported = ((response.llm_output or {}).get('token_usage') or {}).get('total_tokens')
+            if call.chunks is None and response.llm_output is None:
+                # LangChain returns cached responses without the provider's llm_output
+                for scope in scopes:
+                    self.usage.setdefault(scope, Usage()).cached_calls += 1
+                return
+            if call.chunks is not None:
+                tokens = call.prompt_tokens + call.chunks
+            elif reported:
+                tokens = reported
+            else:
+                text = sum(len(generation.text) for batch in response.generations for generation in batch)
+                tokens = call.prompt_tokens + -(-text // CHARS_PER_TOKEN)
+            cost = tokens / 1000 * self.budget.price(call.model)
+            for scope in scopes:
+                usage = self.usage.setdefault(scope, Usage())
+                usage.tokens += tokens
+                usage.llm_calls += 1
+                usage.cost += cost
+            # A limit reached here stops the next call; this response is already paid for
+            for scope in reversed(scopes):
+                self._evaluate(scope)
+
+
+def apply_budget(crew: Any, tracker: BudgetTracker) -> Any:
+    """Enforce ``tracker``'s budget on every kickoff of ``crew``.
+
+    Args:
+        crew: The crewai ``Crew`` to limit, modified in place.
+        tracker: Budget tracker; its usage is reset at the start of each kickoff.
+
+    Returns:
+        The same crew, so ``crew()`` can ``return apply_budget(Crew(...), tracker)``
+    """
+    for agent in crew.agents:
+        tracker.track(agent)
+    kickoff = crew.kickoff
+
+    @functools.wraps(kickoff)
+    def budgeted_kickoff(*args, **kwargs):
+        tracker.reset()
+        try:
+            return kickoff(*args, **kwargs)
+        finally:
+            tracker.finish()
+            tracker.restore()
+
+    def budget_task(task):
+        execute = task._execute
+
+        @functools.wraps(execute)
+        def budgeted_execute(agent, task, context, tools):
+            # The hierarchical manager only exists once the kickoff has started
+            tracker.track(agent)
+            if tools and tracker.delegation_disabled(agent):
+                tools = [tool for tool in tools if tool.name not in DELEGATION_TOOLS]
+            return execute(agent, task, context, tools)
+        object.__setattr__(task, '_execute', budgeted_execute)
+
+    for task in crew.tasks:
+        budget_task(task)
+    object.__setattr__(crew, 'kickoff', budgeted_kickoff)
+    return crew
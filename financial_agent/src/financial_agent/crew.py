@@ -8,18 +8,45 @@ The crew consists of four specialized agents:
 - Trading Strategy Agent: Develops and tests trading strategies
 - Execution Agent: Plans optimal trade execution
 - Risk Management Agent: Evaluates and manages trading risks
+
+The crew runs in one of two processes, picked with ``CREW_PROCESS`` or the
+``process`` argument:
+
+- ``hierarchical`` (default): a manager LLM delegates every task to the agents
+- ``pipeline``: the tasks run one after another with no manager and no delegation
+
+Either way the tasks run in the dependency order declared with ``depends_on``
+in ``config/tasks.yaml``, each given the outputs of the tasks it depends on.
 """
 # Warning control
 import warnings
+import functools
 import os
+from typing import List, Optional
 
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai_tools import ScrapeWebsiteTool, SerperDevTool
 from langchain_openai import ChatOpenAI
 
+from crew_common.cached_tool import cached_factory
+from crew_common.prepare import prepare_crew, task_names
+from crew_common.run_mode import agent_verbose, crew_verbosity
+from crew_common.tool_registry import lazy_tool, register_tool
+from financial_agent.budget import BudgetTracker, apply_budget, load_budget
+from financial_agent.task_graph import wire_tasks
+
 warnings.filterwarnings('ignore')
 
+HIERARCHICAL = 'hierarchical'
+PIPELINE = 'pipeline'
+PROCESSES = (HIERARCHICAL, PIPELINE)
+
+# Agents delegate to each other and keep revisiting the same searches and
+# pages, so both tools answer repeated calls from a shared cache. They are
+# only built when the first agent needs them.
+register_tool('search', cached_factory(SerperDevTool, 'search', ttl=3600))
+register_tool('scrape', cached_factory(ScrapeWebsiteTool, 'scrape', ttl=6 * 3600))
 
 
 # Uncomment the following line to use an example of a custom tool
@@ -31,23 +58,45 @@ class FinancialAgentCrew():
 	
 	This crew provides a comprehensive trading analysis system with specialized agents
 	for market data analysis, strategy development, execution planning, and risk management.
-	The crew operates in a hierarchical structure with a manager LLM coordinating activities.
+	The crew operates in a hierarchical structure with a manager LLM coordinating activities,
+	or as a pipeline of the tasks in dependency order.
 	
 	Attributes:
 		agents_config (str): Path to agents configuration file
 		tasks_config (str): Path to tasks configuration file
-		search_tool (SerperDevTool): Web search tool for market research
-		scrape_tool (ScrapeWebsiteTool): Web scraping tool for data collection
+		search_tool (CachedTool): Cached web search tool for market research, built on first use
+		scrape_tool (CachedTool): Cached web scraping tool for data collection, built on first use
+		budget_config (str): Path to the token, call, cost and time budget file
+		budget (BudgetTracker): Usage of the last kickoff against the budget, set by crew()
+		process (str): ``hierarchical`` or ``pipeline``
+		task_names (list): Task method names in the order of the crew's tasks, set by crew()
 		
 	Raises:
-		ValueError: If OPENAI_API_KEY environment variable is not set
+		ValueError: If OPENAI_API_KEY environment variable is not set, or the process is unknown
 	"""
 	if os.getenv('OPENAI_API_KEY') == '':
 		raise ValueError("OPENAI_API_KEY is not set")
 	agents_config = 'config/agents.yaml'
 	tasks_config = 'config/tasks.yaml'
-	search_tool = SerperDevTool()
-	scrape_tool = ScrapeWebsiteTool()
+	budget_config = 'config/budget.yaml'
+	search_tool = lazy_tool('search')
+	scrape_tool = lazy_tool('scrape')
+
+	def __init__(self, max_rpm: Optional[int] = None, process: Optional[str] = None):
+		"""Initialize the crew.
+
+		Args:
+			max_rpm (int, optional): Maximum LLM requests per minute for the whole
+				crew, used to share an API rate budget between parallel runs
+			process (str, optional): ``hierarchical`` or ``pipeline``, defaults to
+				``CREW_PROCESS`` or ``hierarchical``
+		"""
+		self.max_rpm = max_rpm
+		self.process = process or os.getenv('CREW_PROCESS', HIERARCHICAL)
+		if self.process not in PROCESSES:
+			raise ValueError(f"CREW_PROCESS must be one of {', '.join(PROCESSES)}, got {self.process!r}")
+		self.budget = None
+		self.task_names: List[str] = []
 
 	@agent
 	def data_analyst_agent(self) -> Agent:
@@ -62,8 +111,8 @@ class FinancialAgentCrew():
 		return Agent(
 			config=self.agents_config['data_analyst_agent'],
 			# tools=[MyCustomTool()], # Example of custom tool, loaded on the beginning of file
-			verbose=True,
-			allow_delegation=True,
+			verbose=agent_verbose(),
+			allow_delegation=self.process == HIERARCHICAL,
 			tools=[self.scrape_tool, self.search_tool]
 		)
 
@@ -80,8 +129,8 @@ class FinancialAgentCrew():
 		"""
 		return Agent(
 			config=self.agents_config['trading_strategy_agent'],
-			verbose=True,
-			allow_delegation=True,
+			verbose=agent_verbose(),
+			allow_delegation=self.process == HIERARCHICAL,
 			tools=[self.scrape_tool, self.search_tool]
 		)
 		
@@ -98,8 +147,8 @@ class FinancialAgentCrew():
 		"""
 		return Agent(
 			config=self.agents_config['execution_agent'],
-			verbose=True,
-			allow_delegation=True,
+			verbose=agent_verbose(),
+			allow_delegation=self.process == HIERARCHICAL,
 			tools=[self.scrape_tool, self.search_tool]
 		)
 	
@@ -116,8 +165,8 @@ class FinancialAgentCrew():
 		"""
 		return Agent(
 			config=self.agents_config['risk_management_agent'],
-			verbose=True,
-			allow_delegation=True,
+			verbose=agent_verbose(),
+			allow_delegation=self.process == HIERARCHICAL,
 			tools=[self.scrape_tool, self.search_tool]
 		)
 	
@@ -184,16 +233,32 @@ class FinancialAgentCrew():
 		"""Create and configure the complete Financial Agent Crew.
 		
 		This method assembles all specialized agents and tasks into a cohesive
-		hierarchical crew for comprehensive financial analysis and trading strategy
-		development, with a manager LLM coordinating the workflow.
+		crew for comprehensive financial analysis and trading strategy development.
+		In hierarchical mode a manager LLM coordinates the workflow; in pipeline
+		mode the tasks run one after another with no manager. Tasks run in the
+		order of their ``depends_on`` declarations, and every kickoff is held to
+		the limits in ``config/budget.yaml``. Each finished task is checkpointed,
+		so ``kickoff(inputs=..., resume=True)`` can pick up after a failed task.
 		
 		Returns:
-			Crew: Configured hierarchical crew with all agents, tasks, and manager LLM
+			Crew: Configured crew with all agents and tasks
+			
+		Raises:
+			TaskGraphError: If ``depends_on`` names an unknown task or forms a cycle
 		"""
-		return Crew(
+		by_name = dict(zip(task_names(self), self.tasks))
+		self.task_names = wire_tasks(by_name, self.tasks_config)
+		tasks = [by_name[name] for name in self.task_names]
+		self.budget = BudgetTracker(
+			load_budget(os.path.join(self.base_directory, self.budget_config), self.agents_config),
+			roles={config['role']: name for name, config in self.agents_config.items()}
+		)
+		return prepare_crew(Crew(
 			agents=self.agents, # Automatically created by the @agent decorator
-			tasks=self.tasks, # Automatically created by the @task decorator
-			verbose=2,
-			process=Process.hierarchical, # In case you wanna use that instead https://docs.crewai.com/how-to/Hierarchical/
-			manager_llm=ChatOpenAI(model="gpt-3.5-turbo",  temperature=0.7)
-		)
\ No newline at end of file
+			tasks=tasks, # Automatically created by the @task decorator
+			verbose=crew_verbosity(),
+			process=Process.hierarchical if self.process == HIERARCHICAL else Process.sequential, # https://docs.crewai.com/how-to/Hierarchical/
+			manager_llm=ChatOpenAI(model="gpt-3.5-turbo",  temperature=0.7) if self.process == HIERARCHICAL else None,
+			max_rpm=self.max_rpm
+		), 'financial_agent', self.task_names, checkpoints=True,
+			wrappers=[functools.partial(apply_budget, tracker=self.budget)])
\ No newline at end of file
@@ -5,6 +5,9 @@ This module provides the main execution function for running the Financial Agent
 which performs comprehensive financial analysis, strategy development, and risk assessment
 for automated trading systems.
 """
+from crew_common.llm_cache import enable_llm_cache
+from crew_common.run_mode import logger
+from crew_common.tool_cache import cache_stats
 from financial_agent.crew import FinancialAgentCrew
 
 def run():
@@ -25,11 +28,21 @@ def run():
     - Strategy: Day Trading
     - News Impact: Considered in analysis
     
+    Search and scrape cache hit/miss statistics and the run's usage against
+    ``config/budget.yaml`` are written to the crew log once the crew finishes.
+
+    Set LLM_CACHE_MODE (auto, record or replay) to record LLM responses to disk
+    and replay them on identical reruns.
+
+    Set CREW_RESUME=1 to skip the tasks an earlier run with the same inputs
+    already finished, for example after ``risk_assessment_task`` timed out.
+
     Returns:
         The result of the crew execution containing analysis, strategies, and recommendations
         
     Raises:
         ValueError: If OPENAI_API_KEY is not properly configured
+        BudgetExceeded: If the run uses up its token, call, cost or time budget
         Exception: If any agent fails during execution
     """
     financial_trading_inputs = {
@@ -39,5 +52,11 @@ def run():
         'trading_strategy_preference': 'Day Trading',
         'news_impact_consideration': True
     }
-    result = FinancialAgentCrew().crew().kickoff(inputs=financial_trading_inputs)
-    return result
+    enable_llm_cache()
+    crew_base = FinancialAgentCrew()
+    crew = crew_base.crew()
+    try:
+        return crew.kickoff(inputs=financial_trading_inputs)
+    finally:
+        logger.info('tool cache stats', extra={'fields': {'event': 'tool_cache_stats', 'caches': cache_stats()}})
+        logger.info('budget usage', extra={'fields': {'event': 'budget_usage', 'usage': crew_base.budget.summary()}})
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+"""Portfolio entry point for running the Financial Agent Crew over many tickers.
+
+Each ticker gets its own crew run in a separate worker process, so one slow
+or crashing analysis cannot stall the others and crewAI's process-wide state
+never leaks between runs. The runs share:
+
+- the search and scrape tool caches, persisted under ``TOOL_CACHE_DIR``
+  (default ``.tool_cache``) so a page fetched for one ticker is reused by the
+  others;
+- one LLM requests-per-minute budget, split evenly between the workers and
+  enforced by crewAI's ``max_rpm`` inside each crew;
+- one wall-clock budget: tickers still running when it expires are stopped
+  and reported as timed out.
+
+The per-ticker risk assessments are merged into one consolidated report.
+
+Example:
+
+    financial_agent_portfolio AAPL MSFT NVDA --workers 3 --rpm 60 --time-budget 900
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+from crew_common.llm_cache import enable_llm_cache
+from crew_common.tool_cache import cache_stats
+from financial_agent.crew import FinancialAgentCrew
+
+DEFAULT_WORKERS = 4
+DEFAULT_CACHE_DIR = '.tool_cache'
+DEFAULT_REPORT = 'portfolio_report.md'
+REPORT_TASK = 'risk_assessment_task'
+DEFAULT_INPUTS = {
+    'initial_capital': '100000',
+    'risk_tolerance': 'Medium',
+    'trading_strategy_preference': 'Day Trading',
+    'news_impact_consideration': True,
+}
+
+
+def parse_tickers(values: List[str]) -> List[str]:
+    """Split comma or space separated tickers, uppercase them and drop duplicates."""
+    tickers = []
+    for value in values:
+        for ticker in value.replace(',', ' ').split():
+            ticker = ticker.strip().upper()
+            if ticker and ticker not in tickers:
+                tickers.append(ticker)
+    return tickers
+
+
+def rpm_share(rpm_budget: Optional[int], workers: int) -> Optional[int]:
+    """Return the requests-per-minute each worker may use out of the global budget."""
+    if not rpm_budget:
+        return None
+    return max(1, rpm_budget // max(1, workers))
+
+
+def analyse_ticker(ticker: str, inputs: dict, max_rpm: Optional[int] = None) -> dict:
+    """Run one crew for ``ticker`` and return its result row.
+
+    Runs inside a worker process. The row carries every task's output keyed
+    by task name so the caller can pick the risk assessment.
+    """
+    started = time.perf_counter()
+    row = {'ticker': ticker}
+    try:
+        enable_llm_cache()
+        crew_base = FinancialAgentCrew(max_rpm=max_rpm)
+        crew = crew_base.crew()
+        row['result'] = str(crew.kickoff(inputs={**inputs, 'stock_selection': ticker}))
+        row['outputs'] = {
+            name: task.output.raw_output
+            for name, task in zip(crew_base.task_names, crew.tasks) if task.output is not None
+        }
+        row['usage'] = crew.usage_metrics or {}
+        row['status'] = 'ok'
+    except Exception as error:
+        # One failing ticker must not take down the rest of the portfolio
+        row['status'] = 'error'
+        row['error'] = f"{type(error).__name__}: {error}"
+    row['cache'] = cache_stats()
+    row['latency_s'] = round(time.perf_counter() - started, 3)
+    return row
+
+
+@contextmanager
+def _environ(**values: str) -> Iterator[None]:
+    """Set environment variables for the duration of the block if they are unset."""
+    added = [name for name in values if name not in os.environ]
+    for name in added:
+        os.environ[name] = values[name]
+    try:
+        yield
+    finally:
+        for name in added:
+            os.environ.pop(name, None)
+
+
+def run_portfolio(
+    tickers: List[str],
+    inputs: Optional[dict] = None,
+    workers: int = DEFAULT_WORKERS,
+    rpm_budget: Optional[int] = None,
+    time_budget: Optional[float] = None,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    worker: Callable[..., dict] = analyse_ticker,
+) -> List[dict]:
+    """Run the crew once per ticker on a process pool.
+
+    Args:
+        tickers: Stock tickers to analyse.
+        inputs: Crew inputs shared by every ticker; ``stock_selection`` is set per ticker.
+        workers: Maximum number of crews running at once.
+        rpm_budget: LLM requests per minute allowed across all workers, or None for no limit.
+        time_budget: Seconds the whole portfolio may take, or None to wait for every ticker.
+        cache_dir: Tool cache directory shared by the workers unless ``TOOL_CACHE_DIR`` is set.
+        worker: Picklable function running one ticker, mainly for tests.
+
+    Returns:
+        list: One result row per ticker, in input order, with status, outputs,
+        latency, token usage and tool cache stats
+    """
+    inputs = {**DEFAULT_INPUTS, **(inputs or {})}
+    workers = max(1, min(workers, len(tickers) or 1))
+    max_rpm = rpm_share(rpm_budget, workers)
+    deadline = time.monotonic() + time_budget if time_budget else None
+    results = []
+
+    # Spawned workers inherit the environment, which is how they find the shared cache
+    with _environ(TOOL_CACHE_DIR=cache_dir):
+        # A fresh process per ticker keeps crewAI's global state out of the next run
+        pool = multiprocessing.get_context('spawn').Pool(workers, maxtasksperchild=1)
+        try:
+            pending = [(ticker, pool.apply_async(worker, (ticker, inputs, max_rpm))) for ticker in tickers]
+            for ticker, pending_result in pending:
+                timeout = max(0.0, deadline - time.monotonic()) if deadline else None
+                try:
+                    results.append(pending_result.get(timeout))
+                except multiprocessing.TimeoutError:
+                    results.append({'ticker': ticker, 'status': 'timeout', 'error': f"exceeded {time_budget}s time budget"})
+                except Exception as error:
+                    results.append({'ticker': ticker, 'status': 'error', 'error': f"{type(error).__name__}: {error}"})
+        finally:
+            # Stops tickers still running past the time budget; finished ones are already collected
+            pool.terminate()
+            pool.join()
+    return results
+
+
+def summarize(results: List[dict]) -> dict:
+    """Aggregate per-ticker rows into portfolio totals."""
+    succeeded = [row for row in results if row['status'] == 'ok']
+    cache_hits: Dict[str, int] = {}
+    for row in succeeded:
+        for name, stats in row.get('cache', {}).items():
+            cache_hits[name] = cache_hits.get(name, 0) + stats['hits']
+    return {
+        'tickers': len(results),
+        'succeeded': len(succeeded),
+        'failed': sum(row['status'] == 'error' for row in results),
+        'timed_out': sum(row['status'] == 'timeout' for row in results),
+        'total_tokens': sum(row['usage'].get('total_tokens', 0) for row in succeeded),
+        'cache_hits': cache_hits,
+    }
+
+
+def consolidated_report(results: List[dict]) -> str:
+    """Merge the per-ticker risk assessments into one markdown report."""
+    lines = [
+        '# Portfolio risk assessment',
+        '',
+        '| Ticker | Status | Latency (s) | Tokens |',
+        '| --- | --- | --- | --- |',
+    ]
+    for row in results:
+        tokens = row.get('usage', {}).get('total_tokens', '-')
+        latency = row.get('latency_s', '-')
+        lines.append(f"| {row['ticker']} | {row['status']} | {latency} | {tokens} |")
+    for row in results:
+        lines += ['', f"## {row['ticker']}", '']
+        if row['status'] == 'ok':
+            lines.append(row.get('outputs', {}).get(REPORT_TASK) or row['result'])
+        else:
+            lines.append(f"_No assessment: {row['error']}_")
+    return '\n'.join(lines) + '\n'
+
+
+def run(argv: Optional[List[str]] = None) -> List[dict]:
+    """Command line entry point for portfolio runs."""
+    parser = argparse.ArgumentParser(description='Run the Financial Agent Crew for several tickers.')
+    parser.add_argument('tickers', nargs='+', help='Tickers to analyse, space or comma separated')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='Concurrent crew runs')
+    parser.add_argument('--rpm', type=int, default=None, help='LLM requests per minute shared by all workers')
+    parser.add_argument('--time-budget', type=float, default=None, help='Seconds the whole portfolio may take')
+    parser.add_argument('--capital', default=DEFAULT_INPUTS['initial_capital'], help='Initial capital per ticker')
+    parser.add_argument('--risk-tolerance', default=DEFAULT_INPUTS['risk_tolerance'], help='Risk tolerance')
+    parser.add_argument('--output', default=DEFAULT_REPORT, help='Consolidated report path')
+    args = parser.parse_args(argv)
+
+    inputs = {'initial_capital': args.capital, 'risk_tolerance': args.risk_tolerance}
+    results = run_portfolio(parse_tickers(args.tickers), inputs, args.workers, args.rpm, args.time_budget)
+
+    with open(args.output, 'w', encoding='utf-8') as handle:
+        handle.write(consolidated_report(results))
+    for row in results:
+        latency = row.get('latency_s')
+        print(f"{row['status']:<7} {latency if latency is not None else '-':>8}s  {row['ticker']}")
+    print(json.dumps(summarize(results)))
+    return results
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,92 @@
+"""Task dependency graph declared with ``depends_on`` in ``tasks.yaml``.
+
+A task lists the tasks whose output it needs::
+
+    execution_planning_task:
+      description: ...
+      depends_on:
+        - data_analysis_task
+        - strategy_development_task
+
+The crew runs its tasks in dependency order and hands every task the
+outputs of its dependencies as ``context``. Tasks that do not depend on
+each other keep their order in the YAML file. Unknown names and cycles are
+rejected when the crew is built, before anything runs.
+"""
+from typing import Dict, List, Mapping, Sequence
+
+from crewai import Task
+
+
+class TaskGraphError(ValueError):
+    """Raised when ``depends_on`` names an unknown task or the tasks form a cycle."""
+
+
+def task_dependencies(tasks_config: Mapping[str, dict]) -> Dict[str, List[str]]:
+    """Read and check the ``depends_on`` list of every task in ``tasks_config``.
+
+    Returns:
+        dict: Task name to the names it depends on, in YAML order
+
+    Raises:
+        TaskGraphError: If a dependency is not a task in ``tasks_config``
+    """
+    dependencies = {}
+    for name, config in tasks_config.items():
+        depends_on = (config or {}).get('depends_on') or []
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        unknown = [dependency for dependency in depends_on if dependency not in tasks_config]
+        if unknown:
+            raise TaskGraphError(f"{name} depends on unknown tasks: {', '.join(unknown)}")
+        dependencies[name] = list(dict.fromkeys(depends_on))
+    return dependencies
+
+
+def _cycle(dependencies: Mapping[str, List[str]], remaining: Sequence[str]) -> List[str]:
+    # Every task left over by the sort depends on another left-over task, so
+    # following first dependencies from any of them must come back round
+    path: List[str] = []
+    name = remaining[0]
+    while name not in path:
+        path.append(name)
+        name = next(dependency for dependency in dependencies[name] if dependency in remaining)
+    return path[path.index(name):] + [name]
+
+
+def topological_order(dependencies: Mapping[str, List[str]]) -> List[str]:
+    """Order tasks so each comes after everything it depends on, keeping YAML order otherwise.
+
+    Raises:
+        TaskGraphError: If the dependencies form a cycle
+    """
+    order: List[str] = []
+    remaining = list(dependencies)
+    while remaining:
+        ready = next((name for name in remaining if all(dependency in order for dependency in dependencies[name])), None)
+        if ready is None:
+            raise TaskGraphError(f"Task dependencies form a cycle: {' -> '.join(_cycle(dependencies, remaining))}")
+        order.append(ready)
+        remaining.remove(ready)
+    return order
+
+
+def wire_tasks(tasks: Mapping[str, Task], tasks_config: Mapping[str, dict]) -> List[str]:
+    """Set each task's ``context`` to its dependencies and return the task names in run order.
+
+    Args:
+        tasks: The crew's tasks by name.
+        tasks_config: The task configuration the tasks were built from.
+
+    Raises:
+        TaskGraphError: If a dependency is unknown or not part of the crew, or the tasks form a cycle
+    """
+    dependencies = task_dependencies(tasks_config)
+    order = [name for name in topological_order(dependencies) if name in tasks]
+    for name in order:
+        missing = [dependency for dependency in dependencies[name] if dependency not in tasks]
+        if missing:
+            raise TaskGraphError(f"{name} depends on tasks that are not in the crew: {', '.join(missing)}")
+        tasks[name].context = [tasks[dependency] for dependency in dependencies[name]] or None
+    # Tasks built without a config entry have no dependencies and run last
+    return order + [name for name in tasks if name not in dependencies]
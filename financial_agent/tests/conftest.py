@@ -0,0 +1,45 @@
+"""Portfolio test workers.
+
+They live here rather than in the test module so spawned worker processes
+can import them without pulling in crewAI.
+"""
+import os
+import time
+
+import pytest
+
+from crew_common import run_mode
+from crew_common.tool_cache import get_tool_cache
+
+
+def cached_worker(ticker, inputs, max_rpm):
+    """Stand-in for analyse_ticker that shares one search result through the tool cache"""
+    cache = get_tool_cache('search')
+    hit, _ = cache.get('search:market outlook')
+    if not hit:
+        cache.set('search:market outlook', 'bullish')
+    return {
+        'ticker': ticker,
+        'status': 'ok',
+        'result': f"{ticker} final",
+        'outputs': {'risk_assessment_task': f"{ticker} risk {inputs['risk_tolerance']} rpm={max_rpm}"},
+        'usage': {'total_tokens': 10},
+        'cache': {'search': {'hits': int(hit)}},
+        'latency_s': 0.1,
+        'pid': os.getpid(),
+    }
+
+
+def slow_worker(ticker, inputs, max_rpm):
+    """Stand-in for analyse_ticker that overruns any short time budget"""
+    if ticker == 'SLOW':
+        time.sleep(30)
+    return cached_worker(ticker, inputs, max_rpm)
+
+
+@pytest.fixture(autouse=True)
+def crew_log_file(tmp_path, monkeypatch):
+    """Write the run-mode log under tmp_path instead of logs/ in the working directory"""
+    monkeypatch.setenv('CREW_LOG_FILE', str(tmp_path / 'crew.log'))
+    yield
+    run_mode.shutdown_logging()
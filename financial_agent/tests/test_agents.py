@@ -1,9 +1,18 @@
 import pytest
 import os
-from unittest.mock import Mock, patch
 from crewai import Agent
+from crew_common import tool_registry
+from crew_common.cached_tool import CachedTool
 from financial_agent.crew import FinancialAgentCrew
-from crewai_tools import ScrapeWebsiteTool, SerperDevTool
+from crewai_tools import BaseTool, ScrapeWebsiteTool, SerperDevTool
+
+
+class StandInTool(BaseTool):
+    name: str = "Stand-in"
+    description: str = "Stands in for the shared search and scrape tools."
+
+    def _run(self, query: str = '') -> str:
+        return ''
 
 
 class TestFinancialAgentCrewAgents:
@@ -39,13 +48,18 @@ class TestFinancialAgentCrewAgents:
         }
         return agent
 
-    @patch('financial_agent.crew.SerperDevTool')
-    @patch('financial_agent.crew.ScrapeWebsiteTool')
-    def test_data_analyst_agent_creation(self, mock_scrape_tool, mock_search_tool, crew_instance):
+    @pytest.fixture
+    def tools(self, monkeypatch):
+        """Register stand-ins for the shared search and scrape tools"""
+        monkeypatch.setattr(tool_registry, '_factories', dict(tool_registry._factories))
+        monkeypatch.setattr(tool_registry, '_tools', {})
+        tools = {'search': StandInTool(name='Search'), 'scrape': StandInTool(name='Scrape')}
+        for name, tool in tools.items():
+            tool_registry.register_tool(name, lambda tool=tool: tool)
+        return tools
+
+    def test_data_analyst_agent_creation(self, tools, crew_instance):
         """Test that data analyst agent is created with correct configuration"""
-        # Mock the tools
-        mock_search_tool.return_value = Mock()
-        mock_scrape_tool.return_value = Mock()
         agent = crew_instance.data_analyst_agent()
         
         assert isinstance(agent, Agent)
@@ -53,13 +67,8 @@ class TestFinancialAgentCrewAgents:
         assert agent.allow_delegation is True
         assert agent.verbose is True
 
-    @patch('financial_agent.crew.SerperDevTool')
-    @patch('financial_agent.crew.ScrapeWebsiteTool')
-    def test_trading_strategy_agent_creation(self, mock_scrape_tool, mock_search_tool, crew_instance):
+    def test_trading_strategy_agent_creation(self, tools, crew_instance):
         """Test that trading strategy agent is created with correct configuration"""
-        mock_search_tool.return_value = Mock()
-        mock_scrape_tool.return_value = Mock()
-        
         agent = crew_instance.trading_strategy_agent()
         
         assert isinstance(agent, Agent)
@@ -67,13 +76,8 @@ class TestFinancialAgentCrewAgents:
         assert agent.allow_delegation is True
         assert agent.verbose is True
 
-    @patch('financial_agent.crew.SerperDevTool')
-    @patch('financial_agent.crew.ScrapeWebsiteTool')
-    def test_execution_agent_creation(self, mock_scrape_tool, mock_search_tool, crew_instance):
+    def test_execution_agent_creation(self, tools, crew_instance):
         """Test that execution agent is created with correct configuration"""
-        mock_search_tool.return_value = Mock()
-        mock_scrape_tool.return_value = Mock()
-        
         agent = crew_instance.execution_agent()
         
         assert isinstance(agent, Agent)
@@ -81,13 +85,8 @@ class TestFinancialAgentCrewAgents:
         assert agent.allow_delegation is True
         assert agent.verbose is True
 
-    @patch('financial_agent.crew.SerperDevTool')
-    @patch('financial_agent.crew.ScrapeWebsiteTool')
-    def test_risk_management_agent_creation(self, mock_scrape_tool, mock_search_tool, crew_instance):
+    def test_risk_management_agent_creation(self, tools, crew_instance):
         """Test that risk management agent is created with correct configuration"""
-        mock_search_tool.return_value = Mock()
-        mock_scrape_tool.return_value = Mock()
-    
         agent = crew_instance.risk_management_agent()
         
         assert isinstance(agent, Agent)
@@ -95,14 +94,8 @@ class TestFinancialAgentCrewAgents:
         assert agent.allow_delegation is True
         assert agent.verbose is True
 
-    @patch('financial_agent.crew.SerperDevTool')
-    @patch('financial_agent.crew.ScrapeWebsiteTool')
-    def test_all_agents_have_same_tools(self, mock_scrape_tool, mock_search_tool, crew_instance):
-        """Test that all agents have the same tools (search and scrape)"""
-        search_instance = SerperDevTool()
-        scrape_instance = ScrapeWebsiteTool()
-        mock_search_tool.return_value = search_instance
-        mock_scrape_tool.return_value = scrape_instance
+    def test_all_agents_have_same_tools(self, tools, crew_instance):
+        """Test that all agents share the same search and scrape tool instances"""
         agents = [
             crew_instance.data_analyst_agent(),
             crew_instance.trading_strategy_agent(),
@@ -110,24 +103,29 @@ class TestFinancialAgentCrewAgents:
             crew_instance.risk_management_agent()
         ]
         
-        # All agents should have the same 2 tools
         for agent in agents:
             assert len(agent.tools) == 2
-            assert search_instance in agent.tools
-            assert scrape_instance in agent.tools
+            assert agent.tools[0] is tools['scrape']
+            assert agent.tools[1] is tools['search']
+
+    def test_registered_tools_are_cached_and_shared(self, monkeypatch, crew_instance):
+        """Test that the registered factories build cached tools once per process"""
+        monkeypatch.setattr(tool_registry, '_tools', {})
+        other = FinancialAgentCrew()
 
+        assert isinstance(crew_instance.search_tool, CachedTool)
+        assert isinstance(crew_instance.search_tool.tool, SerperDevTool)
+        assert isinstance(crew_instance.scrape_tool.tool, ScrapeWebsiteTool)
+        assert other.search_tool is crew_instance.search_tool
+        assert other.scrape_tool is crew_instance.scrape_tool
 
     def test_tools_initialization(self, crew_instance):
         """Test that tools are properly initialized at class level"""
         assert hasattr(crew_instance, 'search_tool')
         assert hasattr(crew_instance, 'scrape_tool')
 
-    @patch('financial_agent.crew.SerperDevTool')
-    @patch('financial_agent.crew.ScrapeWebsiteTool')
-    def test_agent_delegation_settings(self, mock_scrape_tool, mock_search_tool, crew_instance):
+    def test_agent_delegation_settings(self, tools, crew_instance):
         """Test that all agents have delegation enabled"""
-        mock_search_tool.return_value = Mock()
-        mock_scrape_tool.return_value = Mock()
         agents = [
             crew_instance.data_analyst_agent(),
             crew_instance.trading_strategy_agent(),
@@ -139,13 +137,8 @@ class TestFinancialAgentCrewAgents:
         for agent in agents:
             assert agent.allow_delegation is True
 
-    @patch('financial_agent.crew.SerperDevTool')
-    @patch('financial_agent.crew.ScrapeWebsiteTool')
-    def test_agent_verbose_settings(self, mock_scrape_tool, mock_search_tool, crew_instance):
+    def test_agent_verbose_settings(self, tools, crew_instance):
         """Test that all agents have verbose mode enabled"""
-        mock_search_tool.return_value = Mock()
-        mock_scrape_tool.return_value = Mock()
-        
         agents = [
             crew_instance.data_analyst_agent(),
             crew_instance.trading_strategy_agent(),
@@ -157,13 +150,8 @@ class TestFinancialAgentCrewAgents:
         for agent in agents:
             assert agent.verbose is True
 
-    @patch('financial_agent.crew.SerperDevTool')
-    @patch('financial_agent.crew.ScrapeWebsiteTool')
-    def test_agent_error_handling(self, mock_scrape_tool, mock_search_tool, crew_instance):
+    def test_agent_error_handling(self, tools, crew_instance):
         """Test agent creation with missing configuration"""
-        mock_search_tool.return_value = Mock()
-        mock_scrape_tool.return_value = Mock()
-        
         # Test with empty config
         crew_instance.agents_config = {}
         
@@ -0,0 +1,170 @@
+import os
+import time
+
+import pytest
+from crewai import Agent, Crew, Task
+from crewai_tools import BaseTool
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from financial_agent.budget import (
+    Budget, BudgetExceeded, BudgetTracker, Limits, apply_budget, load_budget,
+)
+
+TOOL_CALL = 'Thought: look it up\nAction: Echo\nAction Input: {"text": "hi"}'
+FINISH = 'Thought: done\nFinal Answer: all done'
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', 'src', 'financial_agent', 'config')
+
+
+class UsageChatModel(FakeListChatModel):
+    """Fake chat model that does not stream and reports token usage the way ChatOpenAI does"""
+
+    model: str = 'gpt-4'
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        result = super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        result.llm_output = {'token_usage': {'total_tokens': 100}}
+        return result
+
+    def _combine_llm_outputs(self, llm_outputs):
+        return {'token_usage': {'total_tokens': sum(output['token_usage']['total_tokens'] for output in llm_outputs)}}
+
+    def stream(self, input, config=None, *, stop=None, **kwargs):
+        yield self.invoke(input, config=config, stop=stop, **kwargs)
+
+    @property
+    def _identifying_params(self):
+        return {'model': self.model}
+
+
+class Echo(BaseTool):
+    name: str = "Echo"
+    description: str = "Echo the text back"
+
+    def _run(self, text: str) -> str:
+        return f"echo {text}"
+
+
+class SlowEcho(Echo):
+    def _run(self, text: str) -> str:
+        time.sleep(0.5)
+        return f"echo {text}"
+
+
+def fallback(model, llm):
+    return UsageChatModel(responses=[FINISH], model=model)
+
+
+def build_crew(budget, responses, tools=(Echo(),), roles=None):
+    agent = Agent(role='Data Analyst', goal='g', backstory='b', llm=UsageChatModel(responses=responses), tools=list(tools))
+    tasks = [Task(description='Analyse the data', expected_output='notes', agent=agent)]
+    tracker = BudgetTracker(budget, roles={'Data Analyst': 'data_analyst_agent'} if roles is None else roles,
+                            fallback_llm=fallback)
+    return apply_budget(Crew(agents=[agent], tasks=tasks), tracker), tracker, agent
+
+
+class TestBudget:
+    """Test suite for per-run budget enforcement"""
+
+    def test_shipped_budget_loads(self):
+        """Test that config/budget.yaml names only agents from agents.yaml"""
+        agents = ['data_analyst_agent', 'trading_strategy_agent', 'execution_agent', 'risk_management_agent']
+        budget = load_budget(os.path.join(CONFIG_DIR, 'budget.yaml'), dict.fromkeys(agents))
+
+        assert set(budget.agents) == {'manager', *agents}
+        assert budget.fallback_model == 'gpt-3.5-turbo'
+        assert budget.price('gpt-4-0613') == 0.045
+        assert budget.price('gpt-4-turbo-preview') == 0.02
+
+    @pytest.mark.parametrize('config', [
+        {'run': {'max_tokenz': 10}},
+        {'run': {'max_tokens': 0}},
+        {'agents': {'trader': {'max_tokens': 10}}},
+        {'agents': {'manager': {'max_seconds': 10}}},
+        {'degrade_at': 1.5},
+        {'degrade': {'fallback': 'gpt-3.5-turbo'}},
+    ])
+    def test_invalid_budgets_are_rejected(self, config):
+        """Test that unknown settings, agents and out-of-range limits fail at load time"""
+        with pytest.raises(ValueError):
+            Budget.from_dict(config, ['data_analyst_agent'])
+
+    def test_run_call_limit_aborts_the_kickoff(self):
+        """Test that the call after the last allowed one raises BudgetExceeded"""
+        crew, tracker, _ = build_crew(Budget(run=Limits(max_llm_calls=2), degrade_at=None), [TOOL_CALL] * 5)
+
+        with pytest.raises(BudgetExceeded) as error:
+            crew.kickoff()
+
+        summary = tracker.summary()
+        assert error.value.scope == 'run' and error.value.limit == 'max_llm_calls'
+        assert summary['run']['llm_calls'] == 2
+        assert summary['agents']['data_analyst_agent'] == {'tokens': 200, 'llm_calls': 2, 'cached_calls': 0, 'cost': 0}
+        assert summary['exceeded'] == ['run']
+
+    def test_agent_token_limit_aborts_that_agent(self):
+        """Test that an agent's own token budget stops it and costs are priced by model"""
+        budget = Budget(agents={'data_analyst_agent': Limits(max_tokens=250)}, degrade_at=None, prices={'gpt-4': 0.05})
+        crew, tracker, _ = build_crew(budget, [TOOL_CALL] * 5)
+
+        with pytest.raises(BudgetExceeded) as error:
+            crew.kickoff()
+
+        summary = tracker.summary()
+        assert error.value.scope == 'data_analyst_agent'
+        assert summary['agents']['data_analyst_agent']['tokens'] == 300
+        assert summary['run']['cost'] == 0.015
+
+    def test_degrading_switches_model_and_stops_delegation(self):
+        """Test that crossing degrade_at swaps in the fallback model and restores it after the kickoff"""
+        helper = Agent(role='Helper', goal='g', backstory='b', llm=UsageChatModel(responses=[FINISH]))
+        analyst = Agent(role='Data Analyst', goal='g', backstory='b', llm=UsageChatModel(responses=[TOOL_CALL, FINISH]),
+                        tools=[Echo()], allow_delegation=True)
+        first = Task(description='Analyse the data', expected_output='notes', agent=analyst)
+        second = Task(description='Summarise the analysis', expected_output='summary', agent=analyst)
+        budget = Budget(agents={'data_analyst_agent': Limits(max_llm_calls=10)}, degrade_at=0.2,
+                        fallback_model='gpt-3.5-turbo', prices={'gpt-3.5-turbo': 1.0})
+        tracker = BudgetTracker(budget, roles={'Data Analyst': 'data_analyst_agent'}, fallback_llm=fallback)
+        crew = apply_budget(Crew(agents=[analyst, helper], tasks=[first, second]), tracker)
+        original = analyst.llm
+
+        result = crew.kickoff()
+
+        assert result == 'all done'
+        summary = tracker.summary()
+        assert summary['degraded'] == ['data_analyst_agent']
+        # Two calls on the original model, then the second task's one call on the priced fallback
+        assert summary['agents']['data_analyst_agent']['llm_calls'] == 3
+        assert summary['agents']['data_analyst_agent']['cost'] == 0.1
+        assert any(tool.name == 'Delegate work to co-worker' for tool in first.tools)
+        assert not any(tool.name == 'Delegate work to co-worker' for tool in second.tools)
+        assert analyst.llm is original and analyst.allow_delegation is True
+
+    def test_wall_clock_limit(self):
+        """Test that the run stops once it has been going for max_seconds"""
+        crew, tracker, _ = build_crew(Budget(run=Limits(max_seconds=0.3), degrade_at=None), [TOOL_CALL] * 5,
+                                      tools=[SlowEcho()])
+
+        with pytest.raises(BudgetExceeded) as error:
+            crew.kickoff()
+
+        assert error.value.limit == 'max_seconds'
+        assert tracker.summary()['run']['llm_calls'] == 1
+
+    def test_elapsed_stops_when_the_kickoff_returns(self):
+        """Test that the summary reports the kickoff's duration however long after it is read"""
+        crew, tracker, _ = build_crew(Budget(), [FINISH])
+
+        crew.kickoff()
+        elapsed = tracker.summary()['run']['elapsed_s']
+        time.sleep(0.2)
+
+        assert tracker.summary()['run']['elapsed_s'] == elapsed < 0.2
+
+    def test_usage_resets_between_kickoffs(self):
+        """Test that every kickoff starts with a fresh budget"""
+        crew, tracker, _ = build_crew(Budget(run=Limits(max_llm_calls=3)), [TOOL_CALL, FINISH])
+
+        crew.kickoff()
+        crew.kickoff()
+
+        assert tracker.summary()['run']['llm_calls'] == 2
@@ -0,0 +1,186 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from crewai import Process
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from crew_common import run_mode
+from crew_common.checkpoint import CheckpointStore
+from financial_agent import main
+from financial_agent.crew import FinancialAgentCrew
+
+RUN_ORDER = ['data_analysis_task', 'strategy_development_task', 'execution_planning_task', 'risk_assessment_task']
+INPUTS = {'stock_selection': 'AAPL', 'risk_tolerance': 'Medium', 'trading_strategy_preference': 'Day Trading'}
+
+
+class RecordingChatModel(FakeListChatModel):
+    """Fake chat model answering at once and keeping every prompt it was sent"""
+
+    prompts: list = []
+
+    def _call(self, messages, stop=None, run_manager=None, **kwargs):
+        self.prompts.append(messages[-1].content)
+        return super()._call(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    def stream(self, input, config=None, *, stop=None, **kwargs):
+        yield self.invoke(input, config=config, stop=stop, **kwargs)
+
+
+class ScriptedChatModel(FakeListChatModel):
+    """Fake chat model keeping every prompt it was sent, optionally timing out instead of answering"""
+
+    prompts: list = []
+    timeout: bool = False
+
+    def _call(self, messages, stop=None, run_manager=None, **kwargs):
+        if self.timeout:
+            raise TimeoutError('LLM request timed out')
+        self.prompts.append(messages[-1].content)
+        return super()._call(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    def stream(self, input, config=None, *, stop=None, **kwargs):
+        yield self.invoke(input, config=config, stop=stop, **kwargs)
+
+
+def pipeline_crew(prompts, failing_role=None):
+    crew = FinancialAgentCrew(process='pipeline').crew()
+    for agent in crew.agents:
+        role = agent.role.strip()
+        agent.llm = ScriptedChatModel(responses=[f"Thought: done\nFinal Answer: {role} report"], prompts=prompts,
+                                      timeout=role == failing_role)
+    return crew
+
+
+class TestFinancialAgentCrewProcess:
+    """Test suite for the hierarchical and pipeline processes"""
+
+    @pytest.fixture(autouse=True)
+    def api_key(self, monkeypatch, tmp_path):
+        monkeypatch.setenv('OPENAI_API_KEY', 'test')
+        monkeypatch.setenv('CREW_CHECKPOINT_DIR', str(tmp_path / 'checkpoints'))
+        monkeypatch.delenv('CREW_PROCESS', raising=False)
+
+    def test_hierarchical_is_the_default(self):
+        """Test that the default crew keeps its manager LLM and delegating agents, with tasks in dependency order"""
+        crew_base = FinancialAgentCrew()
+        crew = crew_base.crew()
+        by_name = dict(zip(crew_base.task_names, crew.tasks))
+
+        assert crew.process == Process.hierarchical
+        assert crew.manager_llm is not None
+        assert all(agent.allow_delegation for agent in crew.agents)
+        assert crew_base.task_names == RUN_ORDER
+        assert by_name['strategy_development_task'].context == [by_name['data_analysis_task']]
+
+    def test_pipeline_orders_tasks_by_dependency(self, monkeypatch):
+        """Test that pipeline mode runs sequentially in dependency order with context wired in"""
+        monkeypatch.setenv('CREW_PROCESS', 'pipeline')
+        crew_base = FinancialAgentCrew()
+        crew = crew_base.crew()
+        by_name = dict(zip(crew_base.task_names, crew.tasks))
+
+        assert crew.process == Process.sequential
+        assert crew.manager_llm is None
+        assert not any(agent.allow_delegation for agent in crew.agents)
+        assert crew_base.task_names == RUN_ORDER
+        assert by_name['data_analysis_task'].context is None
+        assert by_name['risk_assessment_task'].context == [
+            by_name['strategy_development_task'], by_name['execution_planning_task']]
+
+    def test_pipeline_passes_dependency_outputs(self):
+        """Test that each pipeline task is prompted with the outputs of the tasks it depends on"""
+        crew_base = FinancialAgentCrew(process='pipeline')
+        crew = crew_base.crew()
+        prompts = []
+        for agent in crew.agents:
+            answer = f"{agent.role.strip()} report"
+            agent.llm = RecordingChatModel(responses=[f"Thought: done\nFinal Answer: {answer}"], prompts=prompts)
+
+        crew.kickoff(inputs={'stock_selection': 'AAPL', 'risk_tolerance': 'Medium',
+                             'trading_strategy_preference': 'Day Trading'})
+
+        assert len(prompts) == 4
+        assert 'Data Analyst report' in prompts[1]
+        assert 'Trading Strategy Developer report' in prompts[3]
+        assert 'Trade Advisor report' in prompts[3]
+        assert 'Data Analyst report' not in prompts[3]
+
+    def test_unknown_process_is_rejected(self):
+        """Test that an unknown CREW_PROCESS fails when the crew is built"""
+        with pytest.raises(ValueError):
+            FinancialAgentCrew(process='parallel')
+
+
+class TestRun:
+    """Test suite for the command line entry point"""
+
+    def test_stats_and_budget_usage_go_to_the_log(self, monkeypatch, tmp_path, capsys):
+        """Test that cache statistics and budget usage are logged rather than printed"""
+        log_file = tmp_path / 'crew.log'
+        monkeypatch.setenv('CREW_LOG_FILE', str(log_file))
+        run_mode.shutdown_logging()
+        run_mode.configure_logging()
+        try:
+            with patch.object(main, 'FinancialAgentCrew') as crew_class, patch.object(main, 'enable_llm_cache'):
+                crew_class.return_value.budget.summary.return_value = {'run': {'tokens': 10}}
+                main.run()
+            run_mode.flush_logging()
+        finally:
+            run_mode.shutdown_logging()
+
+        records = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert capsys.readouterr().out == ''
+        assert [record['event'] for record in records] == ['tool_cache_stats', 'budget_usage']
+        assert records[1]['usage'] == {'run': {'tokens': 10}}
+
+
+class TestResume:
+    """Test suite for resuming a failed crew run from its checkpoints"""
+
+    @pytest.fixture(autouse=True)
+    def environment(self, monkeypatch, tmp_path):
+        monkeypatch.setenv('OPENAI_API_KEY', 'test')
+        monkeypatch.setenv('CREW_CHECKPOINT_DIR', str(tmp_path / 'checkpoints'))
+        monkeypatch.delenv('CREW_PROCESS', raising=False)
+        monkeypatch.delenv('CREW_RESUME', raising=False)
+
+    def test_resume_skips_completed_tasks_and_feeds_their_outputs(self):
+        """Test that a late failure is retried with only the failed task calling its LLM"""
+        first_prompts = []
+        with pytest.raises(TimeoutError):
+            pipeline_crew(first_prompts, failing_role='Risk Advisor').kickoff(inputs=INPUTS)
+        assert len(first_prompts) == 3
+
+        prompts = []
+        crew = pipeline_crew(prompts)
+        result = crew.kickoff(inputs=INPUTS, resume=True)
+
+        assert crew.resumed_tasks == ['data_analysis_task', 'strategy_development_task', 'execution_planning_task']
+        assert len(prompts) == 1
+        assert 'Trading Strategy Developer report' in prompts[0] and 'Trade Advisor report' in prompts[0]
+        assert result == 'Risk Advisor report'
+
+    def test_without_resume_every_task_runs_again(self):
+        """Test that checkpoints are only used when resuming, and only for the same inputs"""
+        pipeline_crew([]).kickoff(inputs=INPUTS)
+
+        rerun = []
+        pipeline_crew(rerun).kickoff(inputs=INPUTS)
+        other_stock = []
+        crew = pipeline_crew(other_stock)
+        crew.kickoff(inputs=dict(INPUTS, stock_selection='MSFT'), resume=True)
+
+        assert len(rerun) == 4
+        assert len(other_stock) == 4 and crew.resumed_tasks == []
+
+    def test_resume_from_environment(self, monkeypatch):
+        """Test that CREW_RESUME=1 resumes a kickoff that does not ask for it"""
+        pipeline_crew([]).kickoff(inputs=INPUTS)
+        monkeypatch.setenv('CREW_RESUME', '1')
+
+        prompts = []
+        crew = pipeline_crew(prompts)
+        crew.kickoff(inputs=INPUTS)
+
+        assert prompts == [] and len(crew.resumed_tasks) == 4
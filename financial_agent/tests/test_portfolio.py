@@ -0,0 +1,86 @@
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from financial_agent import portfolio
+from conftest import cached_worker, slow_worker
+
+
+class TestPortfolio:
+    """Test suite for the multi-ticker portfolio runner"""
+
+    @pytest.fixture(autouse=True)
+    def set_dummy_openai_key(self, monkeypatch):
+        monkeypatch.setenv('OPENAI_API_KEY', 'test')
+        monkeypatch.delenv('TOOL_CACHE_DIR', raising=False)
+
+    def test_parse_tickers(self):
+        """Test that tickers are split, uppercased and deduplicated"""
+        assert portfolio.parse_tickers(['aapl,msft', 'NVDA AAPL']) == ['AAPL', 'MSFT', 'NVDA']
+
+    def test_rate_budget_is_split_between_workers(self):
+        """Test that each worker gets its share of the global requests-per-minute budget"""
+        assert portfolio.rpm_share(60, 4) == 15
+        assert portfolio.rpm_share(2, 4) == 1
+        assert portfolio.rpm_share(None, 4) is None
+
+    def test_workers_share_the_tool_cache(self, tmp_path):
+        """Test that separate worker processes reuse each other's cached tool results"""
+        results = portfolio.run_portfolio(
+            ['AAPL', 'MSFT'], {'risk_tolerance': 'Low'}, workers=1, rpm_budget=30,
+            cache_dir=str(tmp_path), worker=cached_worker,
+        )
+
+        assert [row['ticker'] for row in results] == ['AAPL', 'MSFT']
+        assert results[0]['pid'] != results[1]['pid']
+        assert [row['cache']['search']['hits'] for row in results] == [0, 1]
+        assert results[0]['outputs']['risk_assessment_task'] == 'AAPL risk Low rpm=30'
+        assert 'TOOL_CACHE_DIR' not in os.environ
+
+    def test_time_budget_stops_slow_tickers(self, tmp_path):
+        """Test that a ticker still running at the deadline is reported as timed out"""
+        started = time.monotonic()
+        results = portfolio.run_portfolio(
+            ['AAPL', 'SLOW'], workers=2, time_budget=5, cache_dir=str(tmp_path), worker=slow_worker,
+        )
+
+        assert time.monotonic() - started < 10
+        assert [row['status'] for row in results] == ['ok', 'timeout']
+        assert portfolio.summarize(results)['timed_out'] == 1
+
+    def test_analyse_ticker_collects_task_outputs(self):
+        """Test that every task output is returned under its task name"""
+        tasks = [SimpleNamespace(output=SimpleNamespace(raw_output=f"output {i}")) for i in range(4)]
+        crew = MagicMock(tasks=tasks, usage_metrics={'total_tokens': 42})
+        crew.kickoff.return_value = 'final'
+        crew_class = MagicMock()
+        crew_class.return_value.crew.return_value = crew
+        crew_class.return_value.task_names = [
+            'strategy_development_task', 'execution_planning_task', 'risk_assessment_task', 'data_analysis_task']
+
+        with patch('financial_agent.portfolio.FinancialAgentCrew', crew_class), \
+                patch('financial_agent.portfolio.enable_llm_cache'):
+            row = portfolio.analyse_ticker('AAPL', {'risk_tolerance': 'Low'}, max_rpm=10)
+
+        crew_class.assert_called_once_with(max_rpm=10)
+        assert crew.kickoff.call_args.kwargs['inputs']['stock_selection'] == 'AAPL'
+        assert row['status'] == 'ok'
+        assert row['outputs']['risk_assessment_task'] == 'output 2'
+        assert row['usage']['total_tokens'] == 42
+
+    def test_consolidated_report_merges_assessments(self):
+        """Test that the report lists every ticker with its risk assessment or failure"""
+        results = [
+            {'ticker': 'AAPL', 'status': 'ok', 'result': 'final', 'outputs': {'risk_assessment_task': 'AAPL is low risk'},
+             'usage': {'total_tokens': 10}, 'latency_s': 1.5},
+            {'ticker': 'SLOW', 'status': 'timeout', 'error': 'exceeded 60s time budget'},
+        ]
+
+        report = portfolio.consolidated_report(results)
+
+        assert '| AAPL | ok | 1.5 | 10 |' in report
+        assert 'AAPL is low risk' in report
+        assert '_No assessment: exceeded 60s time budget_' in report
@@ -0,0 +1,53 @@
+import os
+
+import pytest
+import yaml
+from crewai import Task
+
+from financial_agent.task_graph import TaskGraphError, task_dependencies, topological_order, wire_tasks
+
+TASKS_YAML = os.path.join(os.path.dirname(__file__), '..', 'src', 'financial_agent', 'config', 'tasks.yaml')
+
+
+def config(**depends_on):
+    return {name: {'description': name, 'expected_output': 'e', 'depends_on': deps} for name, deps in depends_on.items()}
+
+
+class TestTaskGraph:
+    """Test suite for the depends_on task graph"""
+
+    def test_shipped_tasks_run_data_analysis_first(self):
+        """Test that tasks.yaml puts data analysis before everything that needs it"""
+        with open(TASKS_YAML, encoding='utf-8') as handle:
+            tasks_config = yaml.safe_load(handle)
+
+        assert topological_order(task_dependencies(tasks_config)) == [
+            'data_analysis_task', 'strategy_development_task', 'execution_planning_task', 'risk_assessment_task']
+
+    def test_independent_tasks_keep_yaml_order(self):
+        """Test that the sort only moves tasks that have to wait"""
+        dependencies = task_dependencies(config(report=['b', 'a'], b=None, c=[], a='c'))
+
+        assert dependencies['a'] == ['c']
+        assert topological_order(dependencies) == ['b', 'c', 'a', 'report']
+
+    @pytest.mark.parametrize('depends_on, message', [
+        ({'a': ['b'], 'b': ['c'], 'c': ['a']}, 'a -> b -> c -> a'),
+        ({'a': ['a']}, 'a -> a'),
+        ({'a': ['missing']}, 'unknown tasks: missing'),
+    ])
+    def test_invalid_graphs_are_rejected(self, depends_on, message):
+        """Test that cycles and unknown dependencies fail before any task runs"""
+        with pytest.raises(TaskGraphError, match=message):
+            topological_order(task_dependencies(config(**depends_on)))
+
+    def test_wire_tasks_sets_context(self):
+        """Test that every task gets its dependencies as context, in declaration order"""
+        tasks_config = config(summary=['first', 'second'], second=['first'], first=[])
+        tasks = {name: Task(description=name, expected_output='e') for name in tasks_config}
+
+        order = wire_tasks(tasks, tasks_config)
+
+        assert order == ['first', 'second', 'summary']
+        assert tasks['first'].context is None
+        assert tasks['summary'].context == [tasks['first'], tasks['second']]
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""Pages per second and text handed to the LLM: ScrapeWebsiteTool versus Scraper.
+
+Starts a local HTTP server that answers every ``/job/<n>`` path with a job
+posting wrapped in navigation, banners and footers, after ``latency``
+seconds. The same pages are read one at a time with crewai's
+``ScrapeWebsiteTool`` and in one batch with :class:`Scraper`.
+
+Run from the project root:
+
+    python benchmarks/bench_scraper.py [pages] [latency]
+"""
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from crewai_tools import ScrapeWebsiteTool
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from jobsearch_crew.tools.scraper import Scraper  # noqa: E402
+
+NAVIGATION = ''.join(f'<li><a href="/section/{index}">Section {index}</a></li>' for index in range(40))
+PAGE = f"""<html><head><title>Job {{number}}</title><style>body {{{{ margin: 0 }}}}</style>
+<script>window.analytics = {{{{}}}};</script></head><body>
+<header><a href="/">Jobs board</a><form><input name="q"></form></header>
+<nav class="main-menu"><ul>{NAVIGATION}</ul></nav>
+<div class="cookie-consent">We use cookies to improve your experience. Accept all?</div>
+<main><article>
+  <h1>Senior Go Engineer #{{number}}</h1>
+  <p>We are hiring an engineer to build event pipelines with Go, Kafka and Kubernetes.</p>
+  <ul><li>5+ years of Go</li><li>Distributed systems</li><li>Remote friendly</li></ul>
+</article></main>
+<aside class="related-jobs"><ul>{NAVIGATION}</ul></aside>
+<footer><p>Copyright Jobs board. Terms. Privacy. Contact.</p><ul>{NAVIGATION}</ul></footer>
+</body></html>"""
+
+
+class StubJobBoardHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path == '/robots.txt':
+            self._send(404, b'', 'text/plain')
+            return
+        time.sleep(self.server.latency)
+        self._send(200, PAGE.format(number=self.path.rsplit('/', 1)[-1]).encode(), 'text/html; charset=utf-8')
+
+    def _send(self, status, payload, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def report(label: str, pages: int, seconds: float, chars: int) -> None:
+    print(f"{label:<20} {pages / seconds:8.1f} pages/s  {seconds:6.2f} s  "
+          f"{chars / pages:8.0f} chars/page sent to the LLM")
+
+
+def main(pages: int = 40, latency: float = 0.1) -> None:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubJobBoardHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_address[1]}/job/{index}" for index in range(pages)]
+
+    print(f"{pages} pages, {latency * 1000:.0f} ms server latency")
+    started = time.perf_counter()
+    chars = sum(len(ScrapeWebsiteTool()._run(website_url=url)) for url in urls)
+    report('ScrapeWebsiteTool', pages, time.perf_counter() - started, chars)
+
+    scraper = Scraper()
+    results = scraper.scrape(urls)
+    assert all(result.ok for result in results)
+    report(f"Scraper ({scraper.per_host} per host)", pages, scraper.stats.seconds, scraper.stats.chars_returned)
+
+    scraper = Scraper(max_concurrency=16, per_host=16)
+    scraper.scrape(urls)
+    report('Scraper (16 per host)', pages, scraper.stats.seconds, scraper.stats.chars_returned)
+
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == '__main__':
+    main(*(int(arg) if index == 0 else float(arg) for index, arg in enumerate(sys.argv[1:])))
@@ -1,86 +1,138 @@
+import functools
 import os
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai_tools import (
   FileReadTool,
-  ScrapeWebsiteTool,
-  MDXSearchTool,
   SerperDevTool
 )
 
+from crew_common.cached_tool import cached_factory
+from crew_common.prepare import prepare_crew, task_names
+from crew_common.run_mode import agent_verbose, crew_verbosity
+from crew_common.tool_cache import get_tool_cache
+from crew_common.tool_registry import lazy_tool, register_tool
+from jobsearch_crew.dag import enable_concurrent_tasks, standalone
+from jobsearch_crew.tools.github_profile_tool import GitHubProfileTool
+from jobsearch_crew.tools.resume_search_tool import ResumeSearchTool
+from jobsearch_crew.tools.scrape_tool import ScrapeWebsitesTool
+
 # Uncomment the following line to use an example of a custom tool
 # from jobsearch_crew.tools.custom_tool import MyCustomTool
 
 # Check our tools documentations for more information on how to use them
 # from crewai_tools import SerperDevTool
 
+RESUME_PATH = './resume/riyadennis.md'
+
+# Tools are only built when the first agent needs them and are then shared
+# by every crew in the process.
+register_tool('search', cached_factory(SerperDevTool, 'search', ttl=3600))
+# Pages are fetched concurrently, stripped to their main text and cached one by one
+register_tool('scrape', lambda: ScrapeWebsitesTool(cache=get_tool_cache('scrape', ttl=6 * 3600)))
+# Reads a whole GitHub profile from the API in one call, revalidating cached responses by ETag
+register_tool('github_profile', GitHubProfileTool)
+register_tool('read_resume', functools.partial(FileReadTool, file_path=RESUME_PATH))
+# Loads the resume's embeddings from a local index and only embeds chunks that changed
+register_tool('semantic_search_resume', functools.partial(ResumeSearchTool, document=RESUME_PATH))
+
+def built_once(method):
+	"""Build an agent, task or the crew once per crew instance.
+
+	Tasks pull their upstream tasks into ``context`` by calling them again, so
+	without this every call would build a new agent and task, and ``context``
+	would point at copies that never run instead of the tasks in ``self.tasks``.
+	Calling ``crew()`` again returns the same crew rather than wrapping its
+	tasks a second time.
+	"""
+	@functools.wraps(method)
+	def wrapper(self):
+		built = self.__dict__.setdefault('_built', {})
+		if method.__name__ not in built:
+			built[method.__name__] = method(self)
+		return built[method.__name__]
+	return wrapper
+
 @CrewBase
 class JobsearchCrewCrew():
-	"""JobsearchCrew crew"""
-	def __init__(self):
+	"""JobsearchCrew crew
+
+	With ``concurrent_tasks`` enabled, tasks that later tasks only consume
+	through ``context`` run in the background, so the job posting research
+	and the profile compilation overlap instead of running back to back.
+	"""
+	search_tool = lazy_tool('search')
+	scrape_tool = lazy_tool('scrape')
+	github_profile_tool = lazy_tool('github_profile')
+	read_resume = lazy_tool('read_resume')
+	semantic_search_resume = lazy_tool('semantic_search_resume')
+
+	def __init__(self, concurrent_tasks: bool = True):
 		if os.getenv('OPENAI_API_KEY', '') == '':
 			raise ValueError("OPENAI_API_KEY is not set")
 		self.agents_config = 'config/agents.yaml'
 		self.tasks_config = 'config/tasks.yaml'
-		self.search_tool = SerperDevTool()
-		self.scrape_tool = ScrapeWebsiteTool()
-		self.read_resume = FileReadTool(file_path='./resume/riyadennis.md')
-		self.semantic_search_resume = MDXSearchTool(mdx='./resume/riyadennis.md')
+		self.concurrent_tasks = concurrent_tasks
 
 	@agent
+	@built_once
 	def researcher(self) -> Agent:
 		return Agent(
 			config=self.agents_config['researcher'],
 			tools=[self.scrape_tool, self.search_tool],
 			# tools=[MyCustomTool()], # Example of custom tool, loaded on the beginning of file
-			verbose=True
+			verbose=agent_verbose()
 		)
 
 	@agent
+	@built_once
 	def profiler(self) -> Agent:
 		return Agent(
 			config=self.agents_config['profiler'],
-			tools=[self.scrape_tool, self.search_tool, 
+			tools=[self.github_profile_tool, self.scrape_tool, self.search_tool, 
 		  	self.read_resume, self.semantic_search_resume],
-			verbose=True
+			verbose=agent_verbose()
 		)
 	
 	@agent
+	@built_once
 	def resume_strategist(self) -> Agent:
 		return Agent(
 			config=self.agents_config['resume_strategist'],
 			tools=[self.scrape_tool, self.search_tool, 
 		  	self.read_resume, self.semantic_search_resume],
-			verbose=True
+			verbose=agent_verbose()
 		)
 	
 	@agent
+	@built_once
 	def interview_preparer(self) -> Agent:
 		return Agent(
 			config=self.agents_config['interview_preparer'],
 			tools=[self.scrape_tool, self.search_tool, 
 		  	self.read_resume, self.semantic_search_resume],
-			verbose=True
+			verbose=agent_verbose()
 		)	
 
 	@task
+	@built_once
 	def research_task(self) -> Task:
-		return Task(
+		return standalone(Task(
 			config=self.tasks_config['research_task'],
-			agent=self.researcher(),
-			sync_execution=True,
-			context=[]
-		)
+			agent=self.researcher()
+		))
 
 	@task
+	@built_once
 	def profile_task(self) -> Task:
-		return Task(
+		# Profiles the candidate only, so it never sees the job posting research
+		return standalone(Task(
 			config=self.tasks_config['profile_task'],
-			agent=self.profiler(),
-			sync_execution=True
-		)
+			agent=self.profiler()
+		))
 
 	@task
+	@built_once
 	def resume_strategy_task(self) -> Task:
 		return Task(
 			config=self.tasks_config['resume_strategy_task'],
@@ -90,6 +142,7 @@ class JobsearchCrewCrew():
 		)
 	
 	@task
+	@built_once
 	def interview_preparation_task(self) -> Task:
 		return Task(
 			config=self.tasks_config['interview_preparation_task'],
@@ -99,12 +152,21 @@ class JobsearchCrewCrew():
 		)
 	
 	@crew
+	@built_once
 	def crew(self) -> Crew:
-		"""Creates the JobsearchCrew crew"""
-		return Crew(
+		"""Creates the JobsearchCrew crew
+
+		Each finished task is checkpointed, so ``kickoff(inputs=..., resume=True)``
+		picks up after a failed task instead of redoing the research.
+		"""
+		crew = prepare_crew(Crew(
 			agents=self.agents, # Automatically created by the @agent decorator
 			tasks=self.tasks, # Automatically created by the @task decorator
 			process=Process.sequential,
-			verbose=2,
+			verbose=crew_verbosity(),
 			# process=Process.hierarchical, # In case you wanna use that instead https://docs.crewai.com/how-to/Hierarchical/
-		)
\ No newline at end of file
+		), 'jobsearch_crew', task_names(self), checkpoints=True)
+		if self.concurrent_tasks:
+			# Last, so the checkpoint and trace wrappers run on the background threads
+			enable_concurrent_tasks(crew.tasks)
+		return crew
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""Run independent tasks of a sequential crew concurrently.
+
+crewai runs a task with ``async_execution=True`` on its own thread and makes
+every later task that lists it in ``context`` wait for it before starting.
+:func:`enable_concurrent_tasks` uses that to turn a sequential task list into
+a DAG execution: each task that a later task consumes through ``context`` is
+started in the background, so independent tasks overlap and the crew only
+blocks where a ``context`` dependency exists.
+
+crewai drops any exception raised on a background task's thread, so the
+consumers would run without its output. :func:`enable_concurrent_tasks`
+keeps the error on the task and raises it from the first consumer that
+waits for it, failing the kickoff before any downstream task runs. Call it
+after the crew's other task wrappers, so they all run inside the thread.
+
+In a sequential crew a task with no ``context`` is handed the previous
+synchronous task's output, and crewai treats ``context=[]`` the same as no
+``context`` at all. A task that needs no input from the tasks before it is
+marked with :func:`standalone`, so it gets no context in either mode.
+"""
+import functools
+from typing import Any, List, Sequence
+
+
+def standalone(task: Any) -> Any:
+    """Stop ``task`` receiving the previous task's output as implicit context.
+
+    Returns:
+        The same task, so a ``@task`` method can ``return standalone(Task(...))``
+    """
+    execute = task.execute
+
+    @functools.wraps(execute)
+    def execute_standalone(agent=None, context=None, tools=None):
+        return execute(agent=agent, context=None, tools=tools)
+    object.__setattr__(task, 'execute', execute_standalone)
+    object.__setattr__(task, 'standalone', True)
+    return task
+
+
+def takes_previous_output(task: Any) -> bool:
+    """Return whether a sequential crew hands ``task`` the previous task's output."""
+    return not task.context and not getattr(task, 'standalone', False)
+
+
+def concurrent_candidates(tasks: Sequence) -> List:
+    """Return the tasks that can safely run in the background.
+
+    A task qualifies when:
+
+    - a later task consumes it through ``context`` and therefore waits for it;
+    - every later task lists its ``context`` or is :func:`standalone`,
+      because otherwise it implicitly receives the previous synchronous
+      task's output, which changes once earlier tasks run in the background;
+    - no other task uses the same agent, since one agent executor must not
+      work on two tasks at once.
+    """
+    candidates = []
+    for index, task in enumerate(tasks):
+        later = tasks[index + 1:]
+        if not any(task is dependency for other in later for dependency in other.context or []):
+            continue
+        if any(takes_previous_output(other) for other in later):
+            continue
+        if any(other.agent is task.agent for other in tasks if other is not task):
+            continue
+        candidates.append(task)
+    return candidates
+
+
+def _keep_background_error(task: Any) -> None:
+    """Store the exception of ``task``'s background thread on ``task.background_error``."""
+    execute = task._execute
+
+    @functools.wraps(execute)
+    def execute_in_background(agent, task, context, tools):
+        object.__setattr__(task, 'background_error', None)
+        try:
+            return execute(agent, task, context, tools)
+        except Exception as error:
+            object.__setattr__(task, 'background_error', error)
+    object.__setattr__(task, '_execute', execute_in_background)
+
+
+def _raise_background_errors(task: Any) -> None:
+    """Make ``task`` wait for its background dependencies and raise the first one's error."""
+    execute = task.execute
+
+    @functools.wraps(execute)
+    def execute_after_dependencies(agent=None, context=None, tools=None):
+        for dependency in task.context or []:
+            if dependency.async_execution and dependency.thread is not None:
+                dependency.thread.join()
+            error = getattr(dependency, 'background_error', None)
+            if error is not None:
+                raise error
+        return execute(agent=agent, context=context, tools=tools)
+    object.__setattr__(task, 'execute', execute_after_dependencies)
+
+
+def enable_concurrent_tasks(tasks: Sequence) -> List:
+    """Mark every safe task for background execution and return them.
+
+    Errors raised in the background fail the kickoff at the first task that
+    consumes the failed one.
+    """
+    candidates = concurrent_candidates(tasks)
+    for task in candidates:
+        task.async_execution = True
+        _keep_background_error(task)
+    for task in tasks:
+        if any(dependency is candidate for dependency in task.context or [] for candidate in candidates):
+            _raise_background_errors(task)
+    return candidates
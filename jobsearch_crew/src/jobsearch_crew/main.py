@@ -1,4 +1,6 @@
 #!/usr/bin/env python
+from crew_common.run_mode import logger
+from crew_common.tool_cache import cache_stats
 from jobsearch_crew.crew import JobsearchCrewCrew
 
 
@@ -15,4 +17,5 @@ def run():
         'github_url': 'https://github.com/riyadennis',
         'personal_writeup': personalWriteUp,
     }
-    JobsearchCrewCrew().crew().kickoff(inputs=inputs)
\ No newline at end of file
+    JobsearchCrewCrew().crew().kickoff(inputs=inputs)
+    logger.info('tool cache stats', extra={'fields': {'event': 'tool_cache_stats', 'caches': cache_stats()}})
\ No newline at end of file
@@ -0,0 +1,343 @@
+"""Collect a GitHub profile in one pass and reduce it to a ranked digest.
+
+:class:`GitHubClient` gathers everything the profiler needs about a user
+over one aiohttp session, with at most ``max_concurrency`` requests in
+flight:
+
+- the user, the first page of their repositories and their recent public
+  events are requested together; the ``Link`` header of the first page
+  gives the page count, and the remaining pages are fetched at once;
+- the language breakdown of the highest ranked repositories is fetched in
+  one concurrent batch.
+
+Every response is kept on disk with its ``ETag`` and revalidated with
+``If-None-Match``, so a repeat run costs one ``304 Not Modified`` per
+request and does not use up the API rate limit. If the API refuses a
+request because of rate limiting or a server error, the cached copy is used.
+
+:func:`profile_digest` turns the result into a short Markdown summary with
+ranked repositories, languages and recent activity.
+
+``GITHUB_API_URL`` points the client at another API, such as GitHub
+Enterprise or a local stub. ``GITHUB_TOKEN`` authenticates requests, and
+``GITHUB_CACHE_DIR`` (default ``.github_cache``) holds the cache.
+"""
+import asyncio
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import aiohttp
+
+DEFAULT_API_URL = 'https://api.github.com'
+DEFAULT_CACHE_DIR = '.github_cache'
+USER_AGENT = 'jobsearch-crew/0.1'
+PER_PAGE = 100
+ACTIVITY_DAYS = 90
+GITHUB_URL = re.compile(r'^(?:https?://)?(?:www\.)?github\.com/([^/?#]+)', re.IGNORECASE)
+USERNAME = re.compile(r'^[a-z\d](?:[a-z\d]|-(?=[a-z\d])){0,38}$', re.IGNORECASE)
+EVENT_LABELS = {
+    'PushEvent': 'pushes',
+    'PullRequestEvent': 'pull requests',
+    'PullRequestReviewEvent': 'reviews',
+    'IssuesEvent': 'issues',
+    'IssueCommentEvent': 'comments',
+    'CreateEvent': 'branches and repositories created',
+    'ReleaseEvent': 'releases',
+}
+
+
+class GitHubError(RuntimeError):
+    """Raised when a profile cannot be collected from the GitHub API."""
+
+
+def parse_username(github_url: str) -> str:
+    """Return the username in a GitHub profile URL, ``@name`` or bare name.
+
+    Raises:
+        GitHubError: If no valid username can be found
+    """
+    value = github_url.strip()
+    match = GITHUB_URL.match(value)
+    username = match.group(1) if match else value.lstrip('@').strip('/')
+    if not USERNAME.match(username):
+        raise GitHubError(f"{github_url!r} is not a GitHub profile URL or username")
+    return username
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _last_page(link: Optional[str]) -> int:
+    match = re.search(r'[?&]page=(\d+)[^>]*>;\s*rel="last"', link or '')
+    return int(match.group(1)) if match else 1
+
+
+class ETagCache:
+    """API responses on disk, one JSON file per URL, with the ETag to revalidate them.
+
+    Args:
+        directory: Directory holding the entries, created on first write.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json")
+
+    def get(self, url: str) -> Optional[dict]:
+        """Return ``{'etag', 'link', 'body'}`` stored for ``url``, or ``None``."""
+        try:
+            with open(self._path(url), encoding='utf-8') as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, url: str, etag: str, link: Optional[str], body: Any) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a torn entry
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(handle, 'w', encoding='utf-8') as temp_file:
+            json.dump({'url': url, 'etag': etag, 'link': link, 'body': body}, temp_file)
+        os.replace(temp_path, self._path(url))
+
+
+@dataclass
+class GitHubProfile:
+    """Everything collected about one GitHub user."""
+
+    user: dict
+    repositories: List[dict] = field(default_factory=list)
+    events: List[dict] = field(default_factory=list)
+    languages: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+
+@dataclass
+class GitHubStats:
+    """Requests made by one :class:`GitHubClient`."""
+
+    requests: int = 0
+    not_modified: int = 0
+    stale: int = 0
+
+
+def repository_score(repository: dict, now: Optional[datetime] = None) -> float:
+    """Rank a repository by stars, forks and how recently it was pushed to.
+
+    Stars and forks count on a log scale, so one popular project does not
+    push everything else out. Recent activity adds up to 3 points, fading
+    linearly to nothing over two years. Archived repositories count for half.
+    """
+    now = now or datetime.now(timezone.utc)
+    pushed = _parse_time(repository.get('pushed_at'))
+    age_days = (now - pushed).days if pushed else 730
+    recency = max(0.0, 1 - age_days / 730)
+    score = 2 * math.log1p(repository.get('stargazers_count', 0)) + math.log1p(repository.get('forks_count', 0)) + 3 * recency
+    return score / 2 if repository.get('archived') else score
+
+
+def rank_repositories(repositories: List[dict], now: Optional[datetime] = None) -> List[dict]:
+    """Return the user's own repositories, best first; forks of other projects are left out."""
+    owned = [repository for repository in repositories if not repository.get('fork')]
+    return sorted(owned, key=lambda repository: (-repository_score(repository, now), repository['name'].lower()))
+
+
+class GitHubClient:
+    """Collect a user's profile, repositories, languages and activity concurrently.
+
+    Args:
+        api_url: Base URL of the GitHub REST API.
+        token: Token sent as ``Authorization: Bearer``.
+        cache_dir: Directory of the ETag cache; ``''`` turns caching off.
+        max_concurrency: Requests in flight at once.
+        timeout: Seconds allowed for each request.
+        max_pages: Pages of 100 repositories read at most.
+        language_repos: How many of the top ranked repositories get a language breakdown.
+    """
+
+    def __init__(
+        self,
+        api_url: Optional[str] = None,
+        token: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        max_concurrency: int = 8,
+        timeout: float = 15.0,
+        max_pages: int = 10,
+        language_repos: int = 10,
+    ):
+        self.api_url = (api_url or os.getenv('GITHUB_API_URL') or DEFAULT_API_URL).rstrip('/')
+        self.token = token if token is not None else os.getenv('GITHUB_TOKEN', '')
+        cache_dir = cache_dir if cache_dir is not None else os.getenv('GITHUB_CACHE_DIR', DEFAULT_CACHE_DIR)
+        self.cache = ETagCache(cache_dir) if cache_dir else None
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self.language_repos = language_repos
+        self.stats = GitHubStats()
+
+    def collect(self, username: str) -> GitHubProfile:
+        """Fetch the profile of ``username``."""
+        return asyncio.run(self.fetch_profile(username))
+
+    async def fetch_profile(self, username: str) -> GitHubProfile:
+        """Coroutine behind :meth:`collect`, for callers already running an event loop."""
+        headers = {'Accept': 'application/vnd.github+json', 'User-Agent': USER_AGENT}
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+        slots = asyncio.Semaphore(self.max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+            async def get(path: str, **params) -> Tuple[Any, Optional[str]]:
+                async with slots:
+                    return await self._get(session, path, params)
+
+            repos_path = f"/users/{username}/repos"
+            repos_params = {'per_page': PER_PAGE, 'sort': 'pushed', 'type': 'owner'}
+            first = await asyncio.gather(
+                get(f"/users/{username}"),
+                get(repos_path, page=1, **repos_params),
+                get(f"/users/{username}/events/public", per_page=PER_PAGE),
+                return_exceptions=True,
+            )
+            # Report the user request's failure first, it explains the others
+            for outcome in first:
+                if isinstance(outcome, BaseException):
+                    raise outcome
+            (user, _), (first_page, link), (events, _) = first
+            pages = range(2, min(_last_page(link), self.max_pages) + 1)
+            rest = await asyncio.gather(*(get(repos_path, page=page, **repos_params) for page in pages))
+            repositories = list(first_page) + [repository for body, _ in rest for repository in body]
+
+            top = rank_repositories(repositories)[:self.language_repos]
+            breakdowns = await asyncio.gather(
+                *(get(f"/repos/{repository['full_name']}/languages") for repository in top), return_exceptions=True)
+        # A missing language breakdown only thins the digest, so it is left out rather than failing the profile
+        for outcome in breakdowns:
+            if isinstance(outcome, BaseException) and not isinstance(outcome, GitHubError):
+                raise outcome
+        languages = {repository['full_name']: outcome[0] for repository, outcome in zip(top, breakdowns)
+                     if not isinstance(outcome, GitHubError)}
+        return GitHubProfile(user=user, repositories=repositories, events=list(events), languages=languages)
+
+    async def _get(self, session: aiohttp.ClientSession, path: str, params: dict) -> Tuple[Any, Optional[str]]:
+        url = f"{self.api_url}{path}"
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        cached = self.cache.get(url) if self.cache is not None else None
+        headers = {'If-None-Match': cached['etag']} if cached else {}
+        self.stats.requests += 1
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and cached:
+                    self.stats.not_modified += 1
+                    return cached['body'], cached['link']
+                if response.status == 404:
+                    raise GitHubError(f"{path} was not found")
+                if response.status >= 400:
+                    if cached and (response.status in (403, 429) or response.status >= 500):
+                        self.stats.stale += 1
+                        return cached['body'], cached['link']
+                    detail = 'rate limit exceeded' if response.headers.get('X-RateLimit-Remaining') == '0' else f"HTTP {response.status}"
+                    raise GitHubError(f"{path} failed: {detail}")
+                body = await response.json(content_type=None)
+                link = response.headers.get('Link')
+                etag = response.headers.get('ETag')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            if cached:
+                self.stats.stale += 1
+                return cached['body'], cached['link']
+            raise GitHubError(f"{path} failed: {type(error).__name__} {error}".strip()) from error
+        if etag and self.cache is not None:
+            self.cache.set(url, etag, link, body)
+        return body, link
+
+
+def _languages(profile: GitHubProfile, ranked: List[dict]) -> List[Tuple[str, float]]:
+    totals: Counter = Counter()
+    for breakdown in profile.languages.values():
+        totals.update(breakdown)
+    if not totals:
+        # No breakdowns fetched: fall back to each repository's main language
+        totals.update(repository['language'] for repository in ranked if repository.get('language'))
+    total = sum(totals.values())
+    return [(language, amount / total) for language, amount in totals.most_common()] if total else []
+
+
+def _activity(events: List[dict], now: datetime) -> List[str]:
+    recent = [event for event in events
+              if (created := _parse_time(event.get('created_at'))) and (now - created).days <= ACTIVITY_DAYS]
+    if not recent:
+        return [f"No public activity in the last {ACTIVITY_DAYS} days."]
+    kinds = Counter(EVENT_LABELS.get(event.get('type'), 'other events') for event in recent)
+    repositories = Counter(event.get('repo', {}).get('name', '?') for event in recent)
+    return [
+        f"{len(recent)} public events in the last {ACTIVITY_DAYS} days: "
+        + ', '.join(f"{count} {kind}" for kind, count in kinds.most_common()),
+        'Most active in: ' + ', '.join(f"{name} ({count})" for name, count in repositories.most_common(5)),
+    ]
+
+
+def profile_digest(profile: GitHubProfile, top: int = 8, now: Optional[datetime] = None) -> str:
+    """Summarise ``profile`` as compact Markdown for an agent.
+
+    Args:
+        profile: What :class:`GitHubClient` collected.
+        top: How many ranked repositories to list.
+        now: The time recency and activity are measured from.
+    """
+    now = now or datetime.now(timezone.utc)
+    user = profile.user
+    ranked = rank_repositories(profile.repositories, now)
+    login = user.get('login', '')
+    lines = [f"# GitHub profile: {user.get('name') or login} (@{login})"]
+    details = [f"{label}: {' '.join(str(user[key]).split())}"
+               for label, key in (('Bio', 'bio'), ('Company', 'company'), ('Location', 'location'), ('Blog', 'blog'))
+               if user.get(key)]
+    if details:
+        lines.append(' | '.join(details))
+    joined = _parse_time(user.get('created_at'))
+    forks = len(profile.repositories) - len(ranked)
+    lines.append(
+        f"{len(profile.repositories)} public repositories ({len(ranked)} own, {forks} forks), "
+        f"{sum(repository.get('stargazers_count', 0) for repository in ranked)} stars received, "
+        f"{user.get('followers', 0)} followers" + (f", on GitHub since {joined.year}" if joined else '')
+    )
+
+    languages = _languages(profile, ranked)
+    if languages:
+        lines += ['', '## Languages', ', '.join(f"{language} {share:.0%}" for language, share in languages[:8])]
+
+    lines += ['', '## Top repositories']
+    for index, repository in enumerate(ranked[:top], start=1):
+        facts = [repository.get('language') or 'no language', f"{repository.get('stargazers_count', 0)} stars"]
+        if repository.get('forks_count'):
+            facts.append(f"{repository['forks_count']} forks")
+        pushed = _parse_time(repository.get('pushed_at'))
+        if pushed:
+            facts.append(f"pushed {pushed.date().isoformat()}")
+        if repository.get('archived'):
+            facts.append('archived')
+        entry = f"{index}. {repository['name']} ({', '.join(facts)})"
+        description = ' '.join((repository.get('description') or '').split())
+        if description:
+            entry += f" - {description[:160]}"
+        if repository.get('topics'):
+            entry += f" [topics: {', '.join(repository['topics'][:6])}]"
+        lines.append(entry)
+    if not ranked:
+        lines.append('No public repositories of their own.')
+
+    lines += ['', '## Recent activity', *_activity(profile.events, now)]
+    return '\n'.join(lines)
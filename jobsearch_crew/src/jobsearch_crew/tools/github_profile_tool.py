@@ -0,0 +1,46 @@
+from typing import Any, Optional, Type
+
+from crewai_tools import BaseTool
+from pydantic.v1 import BaseModel, Field
+
+from crew_common.tracing import annotate
+from jobsearch_crew.tools.github_profile import GitHubClient, GitHubError, parse_username, profile_digest
+
+
+class GitHubProfileToolSchema(BaseModel):
+    """Input for GitHubProfileTool."""
+
+    github_url: str = Field(..., description="Mandatory GitHub profile URL or username")
+
+
+class GitHubProfileTool(BaseTool):
+    """Collect a whole GitHub profile in one call and return a ranked digest.
+
+    Replaces walking the profile page by page with the scrape and search
+    tools: a :class:`GitHubClient` fetches the user, all repositories, their
+    languages and recent activity from the API concurrently, and the agent
+    gets a short summary with the best repositories first.
+    """
+    name: str = "Collect GitHub profile"
+    description: str = (
+        "A tool that collects a GitHub user's profile, top repositories, languages, stars and recent "
+        "activity in a single call and returns a ranked summary."
+    )
+    args_schema: Type[BaseModel] = GitHubProfileToolSchema
+    client: Any = None
+
+    def __init__(self, client: Optional[GitHubClient] = None, **kwargs):
+        super().__init__(client=client or GitHubClient(), **kwargs)
+
+    def _run(self, github_url: str, **kwargs: Any) -> Any:
+        try:
+            username = parse_username(github_url)
+            before = (self.client.stats.requests, self.client.stats.not_modified)
+            profile = self.client.collect(username)
+        except GitHubError as error:
+            return f"Could not collect the GitHub profile: {error}"
+        annotate(**{
+            'github.requests': self.client.stats.requests - before[0],
+            'github.not_modified': self.client.stats.not_modified - before[1],
+        })
+        return profile_digest(profile)
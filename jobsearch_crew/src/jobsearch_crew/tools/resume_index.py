@@ -0,0 +1,136 @@
+"""Persistent, content-addressed embedding index for resume documents.
+
+The resume is split into markdown-aware chunks and every chunk is keyed by
+the SHA-256 of its text. The index file keeps each chunk's embedding next to
+that hash, so syncing it against the document only embeds chunks whose text
+is new; unchanged chunks are reused and removed ones are dropped. When the
+document has not changed, opening the index is a local JSON load with no
+embedding calls at all.
+
+Embeddings come from any object with LangChain's ``embed_documents`` and
+``embed_query`` methods. Vectors are stored per embedding model, so switching
+models re-embeds the whole document.
+"""
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+INDEX_VERSION = 1
+DEFAULT_CHUNK_CHARS = 1200
+
+
+def chunk_markdown(text: str, max_chars: int = DEFAULT_CHUNK_CHARS) -> List[str]:
+    """Split markdown into chunks of whole paragraphs that never straddle a heading.
+
+    Editing one section therefore only changes the chunks of that section.
+    """
+    chunks = []
+    for section in re.split(r'\n(?=#{1,6}\s)', text):
+        current = ''
+        for paragraph in re.split(r'\n\s*\n', section):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            if current and len(current) + len(paragraph) + 2 > max_chars:
+                chunks.append(current)
+                current = ''
+            current = f"{current}\n\n{paragraph}" if current else paragraph
+        if current:
+            chunks.append(current)
+    return chunks
+
+
+def chunk_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def embedding_model_name(embeddings: Any) -> str:
+    """Return a stable name for an embeddings client, used to invalidate stored vectors."""
+    model = getattr(embeddings, 'model', None) or getattr(embeddings, 'model_name', None)
+    return str(model or type(embeddings).__name__)
+
+
+def _cosine(left: List[float], right: List[float]) -> float:
+    dot = sum(a * b for a, b in zip(left, right))
+    norm = math.sqrt(sum(a * a for a in left)) * math.sqrt(sum(b * b for b in right))
+    return dot / norm if norm else 0.0
+
+
+class ResumeIndex:
+    """Chunk embeddings for one document, persisted as a JSON file.
+
+    Args:
+        path: Index file location; created on the first sync.
+        model: Name of the embedding model the stored vectors belong to.
+    """
+
+    def __init__(self, path: str, model: str):
+        self.path = path
+        self.model = model
+        self.chunks: List[dict] = []
+        self.last_sync: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding='utf-8') as handle:
+                stored = json.load(handle)
+        except (OSError, ValueError):
+            return
+        if stored.get('version') == INDEX_VERSION and stored.get('model') == self.model:
+            self.chunks = stored['chunks']
+
+    def _save(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        payload = {'version': INDEX_VERSION, 'model': self.model, 'chunks': self.chunks}
+        # Write to a temporary file first so a crash never leaves a torn index behind
+        handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(handle, 'w', encoding='utf-8') as temp_file:
+            json.dump(payload, temp_file)
+        os.replace(temp_path, self.path)
+
+    def sync(self, texts: List[str], embeddings: Any) -> Dict[str, int]:
+        """Make the index match ``texts``, embedding only chunks it has not seen.
+
+        Returns:
+            dict: How many chunks were reused, embedded and removed
+        """
+        with self._lock:
+            stored = {chunk['hash']: chunk for chunk in self.chunks}
+            hashes = [chunk_hash(text) for text in texts]
+            missing = {digest: text for digest, text in zip(hashes, texts) if digest not in stored}
+            if missing:
+                vectors = embeddings.embed_documents(list(missing.values()))
+                for (digest, text), vector in zip(missing.items(), vectors):
+                    stored[digest] = {'hash': digest, 'text': text, 'vector': list(vector)}
+            chunks = [stored[digest] for digest in dict.fromkeys(hashes)]
+            removed = len({chunk['hash'] for chunk in self.chunks} - set(hashes))
+            changed = [chunk['hash'] for chunk in chunks] != [chunk['hash'] for chunk in self.chunks]
+            self.chunks = chunks
+            if changed or not os.path.exists(self.path):
+                self._save()
+            self.last_sync = {
+                'reused': len(set(hashes)) - len(missing),
+                'embedded': len(missing),
+                'removed': removed,
+            }
+            return self.last_sync
+
+    def search(self, query_vector: List[float], k: int = 3) -> List[Tuple[float, str]]:
+        """Return the ``k`` chunks most similar to ``query_vector`` as ``(score, text)`` pairs."""
+        scored = [(_cosine(query_vector, chunk['vector']), chunk['text']) for chunk in self.chunks]
+        return sorted(scored, key=lambda item: item[0], reverse=True)[:k]
+
+
+def default_index_path(document: str, index_dir: Optional[str] = None) -> str:
+    """Return the index file for ``document`` inside ``RESUME_INDEX_DIR`` (default ``.resume_index``)."""
+    index_dir = index_dir or os.getenv('RESUME_INDEX_DIR', '.resume_index')
+    name = os.path.splitext(os.path.basename(document))[0]
+    return os.path.join(index_dir, f"{name}.json")
@@ -0,0 +1,62 @@
+import functools
+from typing import Any, Optional, Type
+
+from crewai_tools import BaseTool
+from pydantic.v1 import BaseModel, Field
+
+from jobsearch_crew.tools.resume_index import (
+    ResumeIndex,
+    chunk_markdown,
+    default_index_path,
+    embedding_model_name,
+)
+
+DEFAULT_MAX_QUERIES = 256
+
+
+class ResumeSearchToolSchema(BaseModel):
+    """Input for ResumeSearchTool."""
+
+    search_query: str = Field(..., description="Mandatory search query you want to use to search the resume's content")
+
+
+class ResumeSearchTool(BaseTool):
+    """Semantic search over a resume backed by a persistent ResumeIndex.
+
+    A drop-in replacement for ``MDXSearchTool(mdx=...)``: construction syncs
+    the on-disk index with the document, which only calls the embedding model
+    for chunks that changed since the last run. The vectors of the last
+    ``max_queries`` distinct queries are kept, so an agent repeating a search
+    does not pay for another embedding call.
+    """
+    name: str = "Search the resume's content"
+    description: str = "A tool that can be used to semantic search a query from the resume's content."
+    args_schema: Type[BaseModel] = ResumeSearchToolSchema
+    document: str
+    index: Any = None
+    embeddings: Any = None
+    top_k: int = 3
+    max_queries: int = DEFAULT_MAX_QUERIES
+    embed_query: Any = None
+
+    def __init__(self, document: str, index_path: Optional[str] = None, embeddings: Any = None,
+                 max_queries: int = DEFAULT_MAX_QUERIES, **kwargs):
+        if embeddings is None:
+            from langchain_openai import OpenAIEmbeddings
+            embeddings = OpenAIEmbeddings()
+        index = ResumeIndex(index_path or default_index_path(document), embedding_model_name(embeddings))
+        with open(document, encoding='utf-8') as handle:
+            index.sync(chunk_markdown(handle.read()), embeddings)
+        super().__init__(
+            document=document,
+            index=index,
+            embeddings=embeddings,
+            max_queries=max_queries,
+            embed_query=functools.lru_cache(maxsize=max_queries)(embeddings.embed_query),
+            description=f"A tool that can be used to semantic search a query the {document} resume's content.",
+            **kwargs
+        )
+
+    def _run(self, search_query: str, **kwargs: Any) -> Any:
+        matches = self.index.search(self.embed_query(search_query), k=self.top_k)
+        return "Relevant Content:\n" + "\n\n".join(text for _, text in matches)
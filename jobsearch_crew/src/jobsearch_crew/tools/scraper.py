@@ -0,0 +1,254 @@
+"""Concurrent, polite web page fetching with boilerplate stripping.
+
+:class:`Scraper` fetches a batch of URLs at once over one aiohttp session:
+
+- at most ``max_concurrency`` requests in flight, and at most ``per_host``
+  to any one host;
+- each host's ``robots.txt`` is read once per batch; disallowed pages are
+  skipped and its ``Crawl-delay`` spaces out requests to that host. As in
+  :meth:`urllib.robotparser.RobotFileParser.read`, a 401 or 403 for
+  ``robots.txt`` disallows the whole host and any other error allows it;
+- every request has a timeout and a response size cap;
+- a page whose charset Python does not know is decoded as utf-8.
+
+Each page is reduced to its main content: scripts, styles, navigation,
+headers, footers, sidebars and cookie banners are dropped, the ``<main>`` or
+``<article>`` element is preferred when there is one, and the remaining text
+is collapsed and truncated to ``max_chars``. Agents get that compact text
+instead of every string on the page.
+
+Defaults can be changed with ``SCRAPE_MAX_CONCURRENCY``, ``SCRAPE_PER_HOST``,
+``SCRAPE_TIMEOUT`` and ``SCRAPE_MAX_CHARS``.
+"""
+import asyncio
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import aiohttp
+from bs4 import BeautifulSoup, NavigableString
+
+USER_AGENT = 'jobsearch-crew/0.1 (+https://crewai.com)'
+MAX_RESPONSE_BYTES = 2 * 1024 * 1024
+DROP_TAGS = ('script', 'style', 'noscript', 'template', 'svg', 'iframe', 'form', 'nav', 'header', 'footer', 'aside')
+BLOCK_TAGS = ('p', 'div', 'section', 'article', 'main', 'li', 'ul', 'ol', 'dl', 'dt', 'dd', 'tr', 'table', 'br',
+              'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'pre', 'blockquote')
+DROP_ROLES = ('navigation', 'banner', 'contentinfo', 'complementary', 'search')
+BOILERPLATE = re.compile(
+    r'(^|[-_ ])(nav|navbar|menu|breadcrumbs?|sidebar|footer|header|cookies?|consent|banner|'
+    r'subscribe|newsletter|share|social|related|promo|advert|ads?)([-_ ]|$)', re.IGNORECASE)
+
+
+def _setting(name: str, default: float) -> float:
+    return type(default)(os.getenv(name, default))
+
+
+@dataclass
+class ScrapeResult:
+    """One fetched page, or why it could not be fetched."""
+
+    url: str
+    status: Optional[int] = None
+    title: str = ''
+    text: str = ''
+    bytes_fetched: int = 0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class ScrapeStats:
+    """Totals for the batches fetched by one :class:`Scraper`."""
+
+    pages: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+    bytes_fetched: int = 0
+    chars_returned: int = 0
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.seconds if self.seconds else 0.0
+
+
+def _is_boilerplate(tag) -> bool:
+    if tag.get('role') in DROP_ROLES or tag.get('aria-hidden') == 'true':
+        return True
+    names = ' '.join([*(tag.get('class') or []), tag.get('id') or ''])
+    return bool(names) and BOILERPLATE.search(names) is not None
+
+
+def extract_main_text(html: str, max_chars: Optional[int] = None) -> Tuple[str, str]:
+    """Return the title and the main readable text of an HTML page.
+
+    Args:
+        html: The page source.
+        max_chars: Truncate the text to this many characters.
+
+    Returns:
+        tuple: ``(title, text)`` with one line per block of text
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    title = ' '.join(soup.title.get_text().split()) if soup.title else ''
+    for tag in soup(DROP_TAGS):
+        tag.decompose()
+    for tag in soup.find_all(True):
+        # Tags inside an already dropped block are decomposed with it
+        if not tag.decomposed and _is_boilerplate(tag):
+            tag.decompose()
+    candidates = soup.find_all(['main', 'article']) + soup.find_all(attrs={'role': 'main'})
+    root = max(candidates, key=lambda tag: len(tag.get_text(strip=True)), default=None) or soup.body or soup
+    # Line breaks in the source are just spaces; only block elements start a new line
+    for string in root.find_all(string=True):
+        if type(string) is NavigableString:
+            string.replace_with(re.sub(r'\s+', ' ', string))
+    for tag in root.find_all(BLOCK_TAGS):
+        tag.insert_before('\n')
+        tag.insert_after('\n')
+    lines = []
+    for line in root.get_text().splitlines():
+        line = ' '.join(line.split())
+        if line and (not lines or lines[-1] != line):
+            lines.append(line)
+    text = '\n'.join(lines)
+    if max_chars is not None and len(text) > max_chars:
+        text = text[:max_chars].rstrip() + ' ...'
+    return title, text
+
+
+class _Host:
+    """Per-host concurrency limit, robots rules and request spacing for one batch."""
+
+    def __init__(self, per_host: int):
+        self.slots = asyncio.Semaphore(per_host)
+        self.robots: Optional[asyncio.Task] = None
+        self.spacing = asyncio.Lock()
+        self.last_request = 0.0
+
+
+class Scraper:
+    """Fetch many pages concurrently with per-host limits and robots.txt politeness.
+
+    Args:
+        max_concurrency: Requests in flight across all hosts.
+        per_host: Requests in flight to a single host.
+        timeout: Seconds allowed for each request.
+        max_chars: Characters of main text kept per page.
+        respect_robots: Skip pages disallowed by robots.txt and honour its Crawl-delay.
+        user_agent: User agent sent with every request and matched against robots.txt.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        per_host: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_chars: Optional[int] = None,
+        respect_robots: bool = True,
+        user_agent: str = USER_AGENT,
+    ):
+        self.max_concurrency = max_concurrency or _setting('SCRAPE_MAX_CONCURRENCY', 8)
+        self.per_host = per_host or _setting('SCRAPE_PER_HOST', 2)
+        self.timeout = timeout or _setting('SCRAPE_TIMEOUT', 15.0)
+        self.max_chars = max_chars or _setting('SCRAPE_MAX_CHARS', 8000)
+        self.respect_robots = respect_robots
+        self.user_agent = user_agent
+        self.stats = ScrapeStats()
+
+    def scrape(self, urls: Sequence[str]) -> List[ScrapeResult]:
+        """Fetch ``urls`` and return one result per URL, in the same order."""
+        return asyncio.run(self.fetch_all(urls))
+
+    async def fetch_all(self, urls: Sequence[str]) -> List[ScrapeResult]:
+        """Coroutine behind :meth:`scrape`, for callers already running an event loop."""
+        started = time.perf_counter()
+        slots = asyncio.Semaphore(self.max_concurrency)
+        hosts: Dict[str, _Host] = {}
+        headers = {'User-Agent': self.user_agent, 'Accept': 'text/html,application/xhtml+xml,text/plain;q=0.9,*/*;q=0.5'}
+        async with aiohttp.ClientSession(headers=headers, timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
+            results = await asyncio.gather(*(self._fetch(session, url, slots, hosts) for url in urls))
+        self.stats.seconds += time.perf_counter() - started
+        for result in results:
+            self.stats.pages += result.ok
+            self.stats.failed += not result.ok
+            self.stats.bytes_fetched += result.bytes_fetched
+            self.stats.chars_returned += len(result.text)
+        return list(results)
+
+    async def _robots(self, session: aiohttp.ClientSession, origin: str) -> Optional[RobotFileParser]:
+        try:
+            async with session.get(f"{origin}/robots.txt") as response:
+                if response.status in (401, 403):
+                    parser = RobotFileParser()
+                    parser.disallow_all = True
+                    return parser
+                if response.status >= 400:
+                    return None
+                body = await response.text(errors='replace')
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+        parser = RobotFileParser()
+        parser.parse(body.splitlines())
+        return parser
+
+    async def _wait_turn(self, host: _Host, robots: Optional[RobotFileParser]) -> None:
+        delay = robots.crawl_delay(self.user_agent) if robots is not None else None
+        if not delay:
+            return
+        async with host.spacing:
+            wait = host.last_request + float(delay) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            host.last_request = time.monotonic()
+
+    async def _fetch(self, session: aiohttp.ClientSession, url: str, slots: asyncio.Semaphore,
+                     hosts: Dict[str, _Host]) -> ScrapeResult:
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.netloc:
+            return ScrapeResult(url, error='not an http(s) URL')
+        host = hosts.setdefault(parts.netloc.lower(), _Host(self.per_host))
+        robots = None
+        if self.respect_robots:
+            # Every page on a host waits for the one robots.txt request
+            if host.robots is None:
+                host.robots = asyncio.ensure_future(self._robots(session, f"{parts.scheme}://{parts.netloc}"))
+            robots = await host.robots
+            if robots is not None and not robots.can_fetch(self.user_agent, url):
+                return ScrapeResult(url, error='disallowed by robots.txt')
+        async with slots, host.slots:
+            await self._wait_turn(host, robots)
+            try:
+                async with session.get(url) as response:
+                    body = await response.content.read(MAX_RESPONSE_BYTES)
+                    charset = response.charset or 'utf-8'
+                    content_type = response.content_type
+                    status = response.status
+            except asyncio.TimeoutError:
+                return ScrapeResult(url, error=f"timed out after {self.timeout:g}s")
+            except aiohttp.ClientError as error:
+                return ScrapeResult(url, error=f"{type(error).__name__}: {error}")
+        result = ScrapeResult(url, status=status, bytes_fetched=len(body))
+        if status >= 400:
+            result.error = f"HTTP {status}"
+            return result
+        try:
+            document = body.decode(charset, errors='replace')
+        except LookupError:
+            # Servers do send made-up charset labels; most pages are utf-8 anyway
+            document = body.decode('utf-8', errors='replace')
+        if content_type == 'text/plain':
+            result.text = document[:self.max_chars]
+        elif 'html' in content_type or content_type in ('', 'application/octet-stream'):
+            # Parsing is CPU bound, keep it off the event loop so other downloads carry on
+            result.title, result.text = await asyncio.get_running_loop().run_in_executor(
+                None, extract_main_text, document, self.max_chars)
+        else:
+            result.error = f"unsupported content type {content_type}"
+        return result
@@ -167,7 +167,7 @@ class TestJobsearchCrewAgents:
     @patch('jobsearch_crew.crew.SerperDevTool')
     @patch('jobsearch_crew.crew.ScrapeWebsiteTool')
     def test_mdx_search_tool_configuration(self, mock_scrape_tool, mock_search_tool, crew_instance):
-        """Test that MDXSearchTool is configured with correct file path"""
+        """Test that the resume search tool is configured with correct file path"""
         assert hasattr(crew_instance, 'semantic_search_resume')
 
     @patch('jobsearch_crew.crew.SerperDevTool')
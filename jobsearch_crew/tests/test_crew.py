@@ -0,0 +1,214 @@
+import json
+import os
+import time
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+from crewai import Agent
+from crewai_tools import BaseTool
+
+from crew_common import run_mode, tool_registry
+from crew_common.checkpoint import inputs_key
+from jobsearch_crew import main
+from jobsearch_crew.crew import JobsearchCrewCrew
+
+INPUTS = {
+    'job_posting_url': 'https://example.com/job',
+    'github_url': 'https://github.com/example',
+    'personal_writeup': 'Backend engineer',
+}
+
+
+class ResumeTool(BaseTool):
+    name: str = "Read resume"
+    description: str = "Stands in for the resume file and search tools."
+
+    def _run(self, query: str = '') -> str:
+        return 'resume'
+
+
+class TestJobsearchCrewWiring:
+    """Test suite for how the crew builds and runs its tasks"""
+
+    @pytest.fixture
+    def crew_instance(self, monkeypatch, tmp_path):
+        """Create a crew whose resume tools never touch the file system or embeddings"""
+        os.environ['OPENAI_API_KEY'] = 'test'
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / 'resume').mkdir()
+        instance = JobsearchCrewCrew()
+        instance.read_resume = ResumeTool()
+        instance.semantic_search_resume = ResumeTool()
+        return instance
+
+    def test_tools_are_built_on_first_use(self, monkeypatch):
+        """Test that constructing the crew builds no tools and crews share the ones they build"""
+        monkeypatch.setattr(tool_registry, '_tools', {})
+        os.environ['OPENAI_API_KEY'] = 'test'
+
+        first, second = JobsearchCrewCrew(), JobsearchCrewCrew()
+
+        assert tool_registry.built_tools() == []
+        assert first.search_tool is second.search_tool
+        assert tool_registry.built_tools() == ['search']
+
+    def test_agents_and_tasks_are_built_once(self, crew_instance):
+        """Test that repeated calls return the instances registered on the crew"""
+        crew = crew_instance.crew()
+        research, profile, strategy, interview = crew.tasks
+
+        assert crew_instance.researcher() is crew_instance.researcher()
+        assert research.agent is crew_instance.researcher()
+        assert strategy.context[0] is research
+        assert strategy.context[1] is profile
+        assert all(left is right for left, right in zip(interview.context, [research, profile, strategy]))
+        assert len(crew.agents) == 4
+
+    @pytest.mark.parametrize('concurrent_tasks', [True, False])
+    def test_crew_is_built_once(self, crew_instance, monkeypatch, tmp_path, concurrent_tasks):
+        """Test that calling crew() again returns the same crew, whose tasks are wrapped only once"""
+        monkeypatch.setenv('CREW_TRACE_FILE', str(tmp_path / 'trace.jsonl'))
+        crew_instance.concurrent_tasks = concurrent_tasks
+        crew = crew_instance.crew()
+
+        assert crew_instance.crew() is crew
+        with patch.object(Agent, 'execute_task', lambda agent, task, context=None, tools=None: 'done'):
+            crew.kickoff(inputs=INPUTS)
+
+        with open(tmp_path / 'trace.jsonl', encoding='utf-8') as handle:
+            spans = [json.loads(line) for line in handle]
+        traced = Counter(span['attributes']['task.description'] for span in spans if span['name'] == 'task')
+        assert len(traced) == 4 and set(traced.values()) == {1}
+
+    @pytest.mark.parametrize('concurrent_tasks', [True, False])
+    def test_each_task_executes_once_per_kickoff(self, crew_instance, concurrent_tasks):
+        """Test that upstream tasks are not executed again for the tasks that consume them"""
+        executions = Counter()
+
+        def execute_task(agent, task, context=None, tools=None):
+            executions[task.description] += 1
+            return f"output of {agent.role}"
+
+        crew_instance.concurrent_tasks = concurrent_tasks
+        crew = crew_instance.crew()
+        with patch.object(Agent, 'execute_task', execute_task):
+            crew.kickoff(inputs=INPUTS)
+
+        assert len(executions) == 4
+        assert set(executions.values()) == {1}
+
+    @pytest.mark.parametrize('concurrent_tasks', [True, False])
+    def test_profile_never_sees_the_job_research(self, crew_instance, concurrent_tasks):
+        """Test that the profile gets the same, empty context whether or not tasks run in the background"""
+        contexts = {}
+
+        def execute_task(agent, task, context=None, tools=None):
+            contexts[agent.role.strip()] = context
+            return f"output of {agent.role.strip()}"
+
+        crew_instance.concurrent_tasks = concurrent_tasks
+        crew = crew_instance.crew()
+        with patch.object(Agent, 'execute_task', execute_task):
+            crew.kickoff(inputs=INPUTS)
+
+        assert not contexts['Personal Profiler for Engineers']
+        assert contexts['Resume Strategist for Engineers'] == 'output of Tech Job Researcher\noutput of Personal Profiler for Engineers'
+
+    @pytest.mark.parametrize('concurrent_tasks', [True, False])
+    def test_failed_research_fails_the_kickoff(self, crew_instance, concurrent_tasks):
+        """Test that a failing researcher stops the kickoff before the resume and interview tasks, in either mode"""
+        executions = []
+
+        def execute_task(agent, task, context=None, tools=None):
+            if agent.role.strip() == 'Tech Job Researcher':
+                raise TimeoutError('LLM request timed out')
+            executions.append(agent.role.strip())
+            return f"output of {agent.role.strip()}"
+
+        crew_instance.concurrent_tasks = concurrent_tasks
+        crew = crew_instance.crew()
+        with patch.object(Agent, 'execute_task', execute_task):
+            with pytest.raises(TimeoutError):
+                crew.kickoff(inputs=INPUTS)
+
+        assert 'Resume Strategist for Engineers' not in executions
+        assert 'Engineering Interview Preparer' not in executions
+
+    @pytest.mark.parametrize('concurrent_tasks', [True, False])
+    def test_resume_reruns_only_the_failed_task(self, crew_instance, concurrent_tasks):
+        """Test that a resumed kickoff skips finished tasks and passes on their saved outputs"""
+        executions = []
+
+        def execute_task(agent, task, context=None, tools=None):
+            executions.append((agent.role.strip(), context))
+            if agent.role.strip() == 'Engineering Interview Preparer' and len(executions) <= 4:
+                raise TimeoutError('LLM request timed out')
+            return f"output of {agent.role.strip()}"
+
+        crew_instance.concurrent_tasks = concurrent_tasks
+        crew = crew_instance.crew()
+        with patch.object(Agent, 'execute_task', execute_task):
+            with pytest.raises(TimeoutError):
+                crew.kickoff(inputs=INPUTS)
+            result = crew.kickoff(inputs=INPUTS, resume=True)
+
+        assert len(executions) == 5
+        role, context = executions[-1]
+        assert role == 'Engineering Interview Preparer'
+        assert 'output of Tech Job Researcher' in context and 'output of Resume Strategist for Engineers' in context
+        # Background tasks may finish resuming in either order
+        assert sorted(crew.resumed_tasks) == ['profile_task', 'research_task', 'resume_strategy_task']
+        assert result == 'output of Engineering Interview Preparer'
+
+
+    def test_failed_background_task_leaves_no_checkpoints(self, crew_instance):
+        """Test that a run whose background research failed saves nothing a resumed run could reuse"""
+        calls = []
+        outage = [True]
+
+        def execute_task(agent, task, context=None, tools=None):
+            role = agent.role.strip()
+            calls.append((role, context))
+            if role == 'Tech Job Researcher' and outage[0]:
+                raise TimeoutError('LLM request timed out')
+            if role == 'Personal Profiler for Engineers':
+                time.sleep(0.2)
+            return f"output of {role}"
+
+        crew = crew_instance.crew()
+        with patch.object(Agent, 'execute_task', execute_task):
+            with pytest.raises(TimeoutError):
+                crew.kickoff(inputs=INPUTS)
+            crew.tasks[1].thread.join()
+            assert crew.checkpoint_store.completed('jobsearch_crew', inputs_key(INPUTS)) == []
+
+            calls.clear()
+            outage[0] = False
+            crew.kickoff(inputs=INPUTS, resume=True)
+
+        assert crew.resumed_tasks == []
+        strategy_context = dict(calls)['Resume Strategist for Engineers']
+        assert 'output of Tech Job Researcher' in strategy_context
+
+
+class TestRun:
+    """Test suite for the command line entry point"""
+
+    def test_tool_cache_stats_go_to_the_log(self, monkeypatch, tmp_path, capsys):
+        """Test that cache statistics are logged rather than printed"""
+        log_file = tmp_path / 'crew.log'
+        monkeypatch.setenv('CREW_LOG_FILE', str(log_file))
+        run_mode.shutdown_logging()
+        run_mode.configure_logging()
+        try:
+            with patch.object(main, 'JobsearchCrewCrew'):
+                main.run()
+            run_mode.flush_logging()
+        finally:
+            run_mode.shutdown_logging()
+
+        records = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert capsys.readouterr().out == ''
+        assert [record['event'] for record in records] == ['tool_cache_stats']
+        assert isinstance(records[0]['caches'], dict)
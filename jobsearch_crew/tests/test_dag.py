@@ -0,0 +1,151 @@
+import os
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from crewai import Agent, Crew, Process, Task
+
+from jobsearch_crew.dag import concurrent_candidates, enable_concurrent_tasks, standalone
+
+
+def fake_task(name, agent=None, context=None, alone=False):
+    return SimpleNamespace(name=name, agent=agent or object(), context=context, async_execution=False, standalone=alone,
+                           thread=None, execute=lambda **kwargs: name, _execute=lambda *args: name)
+
+
+class TestConcurrentCandidates:
+    """Test suite for picking tasks that may run in the background"""
+
+    def test_jobsearch_shape(self):
+        """Test that the two independent upstream tasks run in the background"""
+        research = fake_task('research', alone=True)
+        profile = fake_task('profile', alone=True)
+        strategy = fake_task('strategy', context=[research, profile])
+        interview = fake_task('interview', context=[research, profile, strategy])
+
+        names = [task.name for task in concurrent_candidates([research, profile, strategy, interview])]
+
+        assert names == ['research', 'profile', 'strategy']
+
+    def test_implicit_context_keeps_tasks_sequential(self):
+        """Test that a later task relying on the previous output blocks background runs, even with context=[]"""
+        for implicit in [None, []]:
+            research = fake_task('research', alone=True)
+            profile = fake_task('profile', context=implicit)
+            strategy = fake_task('strategy', context=[research, profile])
+
+            assert [task.name for task in concurrent_candidates([research, profile, strategy])] == ['profile']
+
+    def test_unconsumed_and_last_tasks_stay_synchronous(self):
+        """Test that tasks nobody waits for are never sent to the background"""
+        first = fake_task('first', alone=True)
+        last = fake_task('last', alone=True)
+
+        assert concurrent_candidates([first, last]) == []
+
+    def test_shared_agent_stays_synchronous(self):
+        """Test that two tasks of the same agent are not run concurrently"""
+        agent = object()
+        first = fake_task('first', agent=agent, alone=True)
+        second = fake_task('second', agent=agent, alone=True)
+        final = fake_task('final', context=[first, second])
+
+        assert concurrent_candidates([first, second, final]) == []
+
+    def test_enable_marks_tasks_async(self):
+        """Test that enable_concurrent_tasks flips async_execution"""
+        first = fake_task('first', alone=True)
+        final = fake_task('final', context=[first])
+
+        enable_concurrent_tasks([first, final])
+
+        assert first.async_execution is True
+        assert final.async_execution is False
+
+
+class TestConcurrentKickoff:
+    """Test suite for running a crew with background tasks"""
+
+    @pytest.fixture(autouse=True)
+    def set_dummy_openai_key(self):
+        os.environ['OPENAI_API_KEY'] = 'test'
+
+    def test_independent_tasks_overlap(self):
+        """Test that independent tasks run at the same time and their outputs reach the consumer"""
+        running = []
+        peak = []
+        lock = threading.Lock()
+        contexts = {}
+
+        def execute_task(agent, task, context=None, tools=None):
+            with lock:
+                running.append(task.description)
+                peak.append(len(running))
+            time.sleep(0.2)
+            with lock:
+                running.remove(task.description)
+            contexts[task.description] = context
+            return f"output of {task.description}"
+
+        agents = [Agent(role=f"role {i}", goal='goal', backstory='backstory') for i in range(3)]
+        research = standalone(Task(description='research', expected_output='out', agent=agents[0]))
+        profile = standalone(Task(description='profile', expected_output='out', agent=agents[1]))
+        strategy = Task(description='strategy', expected_output='out', agent=agents[2], context=[research, profile])
+        tasks = [research, profile, strategy]
+        enable_concurrent_tasks(tasks)
+
+        with patch.object(Agent, 'execute_task', execute_task):
+            Crew(agents=agents, tasks=tasks, process=Process.sequential).kickoff()
+
+        assert max(peak) == 2
+        assert contexts['strategy'] == 'output of research\noutput of profile'
+
+    @pytest.mark.parametrize('concurrent', [True, False])
+    def test_standalone_tasks_get_no_context_in_either_mode(self, concurrent):
+        """Test that a standalone task never sees the previous task's output, sequential or not"""
+        contexts = {}
+
+        def execute_task(agent, task, context=None, tools=None):
+            contexts[task.description] = context
+            return f"output of {task.description}"
+
+        agents = [Agent(role=f"role {i}", goal='goal', backstory='backstory') for i in range(3)]
+        research = standalone(Task(description='research', expected_output='out', agent=agents[0]))
+        profile = standalone(Task(description='profile', expected_output='out', agent=agents[1]))
+        strategy = Task(description='strategy', expected_output='out', agent=agents[2], context=[research, profile])
+        tasks = [research, profile, strategy]
+        if concurrent:
+            enable_concurrent_tasks(tasks)
+
+        with patch.object(Agent, 'execute_task', execute_task):
+            Crew(agents=agents, tasks=tasks, process=Process.sequential).kickoff()
+
+        assert not contexts['profile']
+        assert contexts['strategy'] == 'output of research\noutput of profile'
+
+    @pytest.mark.parametrize('failing', ['research', 'profile'])
+    def test_background_errors_fail_the_kickoff(self, failing):
+        """Test that an exception on a background thread fails the kickoff before its consumers run"""
+        executed = []
+
+        def execute_task(agent, task, context=None, tools=None):
+            if task.description == failing:
+                raise TimeoutError('LLM request timed out')
+            executed.append(task.description)
+            return f"output of {task.description}"
+
+        agents = [Agent(role=f"role {i}", goal='goal', backstory='backstory') for i in range(4)]
+        research = standalone(Task(description='research', expected_output='out', agent=agents[0]))
+        profile = standalone(Task(description='profile', expected_output='out', agent=agents[1]))
+        strategy = Task(description='strategy', expected_output='out', agent=agents[2], context=[research, profile])
+        interview = Task(description='interview', expected_output='out', agent=agents[3], context=[research, strategy])
+        tasks = [research, profile, strategy, interview]
+        enable_concurrent_tasks(tasks)
+
+        with patch.object(Agent, 'execute_task', execute_task):
+            with pytest.raises(TimeoutError):
+                Crew(agents=agents, tasks=tasks, process=Process.sequential).kickoff()
+
+        assert 'strategy' not in executed and 'interview' not in executed
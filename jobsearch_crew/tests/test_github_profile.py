@@ -0,0 +1,249 @@
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from jobsearch_crew.tools.github_profile import (
+    GitHubClient, GitHubError, GitHubProfile, parse_username, profile_digest, rank_repositories)
+from jobsearch_crew.tools.github_profile_tool import GitHubProfileTool
+
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+def repo(name, stars=0, forks=0, pushed='2024-05-20T10:00:00Z', language='Go', fork=False, **extra):
+    return {'name': name, 'full_name': f"octo/{name}", 'stargazers_count': stars, 'forks_count': forks,
+            'pushed_at': pushed, 'language': language, 'fork': fork, 'description': f"{name} project", **extra}
+
+
+USER = {'login': 'octo', 'name': 'Octo Cat', 'bio': 'Backend   engineer', 'location': 'London',
+        'followers': 12, 'created_at': '2012-03-01T00:00:00Z'}
+REPO_PAGES = [
+    [repo('kafka-go', stars=40, forks=6, topics=['kafka', 'go']), repo('dotfiles', language='Shell')],
+    [repo('old-tool', stars=60, pushed='2019-01-01T00:00:00Z', language='Python', archived=True),
+     repo('upstream', stars=900, fork=True)],
+    [repo('crewai-agents', stars=5, language='Python')],
+]
+EVENTS = [
+    {'type': 'PushEvent', 'repo': {'name': 'octo/kafka-go'}, 'created_at': '2024-05-30T00:00:00Z'},
+    {'type': 'PushEvent', 'repo': {'name': 'octo/kafka-go'}, 'created_at': '2024-05-10T00:00:00Z'},
+    {'type': 'PullRequestEvent', 'repo': {'name': 'other/lib'}, 'created_at': '2024-04-01T00:00:00Z'},
+    {'type': 'PushEvent', 'repo': {'name': 'octo/dotfiles'}, 'created_at': '2023-01-01T00:00:00Z'},
+]
+LANGUAGES = {'kafka-go': {'Go': 9000, 'Shell': 1000}, 'crewai-agents': {'Python': 5000},
+             'dotfiles': {'Shell': 500}, 'old-tool': {'Python': 4000}}
+
+
+class FakeGitHub(ThreadingHTTPServer):
+    """Local stand-in for the GitHub REST API, recording every request"""
+
+    daemon_threads = True
+
+    def __init__(self, delay=0.0):
+        super().__init__(('127.0.0.1', 0), FakeGitHubHandler)
+        self.delay = delay
+        self.rate_limited = False
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.requests = []
+
+    @property
+    def base(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        server = self.server
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        with server.lock:
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        try:
+            time.sleep(server.delay)
+            body, link = self._route(parts.path, int(query.get('page', ['1'])[0]))
+        finally:
+            with server.lock:
+                server.active -= 1
+        if server.rate_limited:
+            status, payload = 403, b'{"message": "API rate limit exceeded"}'
+        elif body is None:
+            status, payload = 404, b'{"message": "Not Found"}'
+        else:
+            payload = json.dumps(body).encode('utf-8')
+            etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+            status = 304 if self.headers.get('If-None-Match') == etag else 200
+        with server.lock:
+            server.requests.append((self.path, status))
+        self.send_response(status)
+        if status == 403:
+            self.send_header('X-RateLimit-Remaining', '0')
+        if status in (200, 304):
+            self.send_header('ETag', etag)
+        if link:
+            self.send_header('Link', link)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload) if status != 304 else 0))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(payload)
+
+    def _route(self, path, page):
+        if path == '/users/octo':
+            return USER, None
+        if path == '/users/octo/repos':
+            last = f'<{self.server.base}/users/octo/repos?page={len(REPO_PAGES)}>; rel="last"'
+            return REPO_PAGES[page - 1], last
+        if path == '/users/octo/events/public':
+            return EVENTS, None
+        if path.startswith('/repos/octo/') and path.endswith('/languages'):
+            return LANGUAGES.get(path.split('/')[3]), None
+        return None, None
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def github():
+    servers = []
+
+    def start(**kwargs):
+        instance = FakeGitHub(**kwargs)
+        threading.Thread(target=instance.serve_forever, daemon=True).start()
+        servers.append(instance)
+        return instance
+    yield start
+    for instance in servers:
+        instance.shutdown()
+        instance.server_close()
+
+
+class TestParseUsername:
+    """Test suite for reading the username from the task input"""
+
+    @pytest.mark.parametrize('value', ['https://github.com/octo', 'github.com/octo/', 'https://www.github.com/octo?tab=repositories',
+                                       '@octo', 'octo'])
+    def test_accepts_urls_and_names(self, value):
+        """Test that profile URLs, @names and bare names all give the username"""
+        assert parse_username(value) == 'octo'
+
+    def test_rejects_other_urls(self):
+        """Test that a URL that is not a GitHub profile is rejected"""
+        with pytest.raises(GitHubError):
+            parse_username('https://gitlab.com/octo')
+
+
+class TestGitHubClient:
+    """Test suite for collecting a profile from a fake GitHub API"""
+
+    def test_fetches_every_page_concurrently(self, github, tmp_path):
+        """Test that the first requests overlap, later pages follow the Link header and languages cover the top repos"""
+        api = github(delay=0.2)
+        client = GitHubClient(api_url=api.base, cache_dir=str(tmp_path), language_repos=2)
+
+        started = time.perf_counter()
+        profile = client.collect('octo')
+        elapsed = time.perf_counter() - started
+
+        assert profile.user['login'] == 'octo'
+        assert [repository['name'] for repository in profile.repositories] == [
+            'kafka-go', 'dotfiles', 'old-tool', 'upstream', 'crewai-agents']
+        assert len(profile.languages) == 2 and 'octo/kafka-go' in profile.languages
+        assert len(api.requests) == 7 and api.peak >= 3
+        # Three rounds (first requests, remaining pages, languages) instead of seven sequential calls
+        assert elapsed < 5 * 0.2
+
+    def test_failed_language_breakdowns_are_left_out(self, github, tmp_path, monkeypatch):
+        """Test that a repository whose languages cannot be read is dropped instead of failing the profile"""
+        monkeypatch.delitem(LANGUAGES, 'kafka-go')
+        api = github()
+
+        profile = GitHubClient(api_url=api.base, cache_dir=str(tmp_path), language_repos=2).collect('octo')
+
+        assert profile.user['login'] == 'octo'
+        assert len(profile.languages) == 1 and 'octo/kafka-go' not in profile.languages
+
+    def test_revalidates_cached_responses_by_etag(self, github, tmp_path):
+        """Test that a later client sends If-None-Match and rebuilds the same profile from 304 responses"""
+        api = github()
+        first = GitHubClient(api_url=api.base, cache_dir=str(tmp_path)).collect('octo')
+        api.requests.clear()
+
+        client = GitHubClient(api_url=api.base, cache_dir=str(tmp_path))
+        second = client.collect('octo')
+
+        assert second == first
+        assert {status for _, status in api.requests} == {304}
+        assert client.stats.not_modified == client.stats.requests == len(api.requests)
+
+    def test_falls_back_to_cache_when_rate_limited(self, github, tmp_path):
+        """Test that a rate limited API serves the cached copy, and fails without one"""
+        api = github()
+        first = GitHubClient(api_url=api.base, cache_dir=str(tmp_path)).collect('octo')
+        api.rate_limited = True
+
+        client = GitHubClient(api_url=api.base, cache_dir=str(tmp_path))
+
+        assert client.collect('octo') == first
+        assert client.stats.stale == client.stats.requests
+        with pytest.raises(GitHubError, match='rate limit exceeded'):
+            GitHubClient(api_url=api.base, cache_dir='').collect('octo')
+
+
+class TestProfileDigest:
+    """Test suite for the ranked digest given to the agent"""
+
+    def test_ranks_own_repositories_by_stars_and_recency(self):
+        """Test that forks are dropped and an archived, stale project ranks below active ones"""
+        ranked = rank_repositories([repository for page in REPO_PAGES for repository in page], NOW)
+
+        assert [repository['name'] for repository in ranked] == ['kafka-go', 'crewai-agents', 'old-tool', 'dotfiles']
+
+    def test_summarises_profile_languages_and_activity(self):
+        """Test that the digest lists the profile, language shares, top repositories and recent activity"""
+        profile = GitHubProfile(
+            user=USER, repositories=[repository for page in REPO_PAGES for repository in page], events=EVENTS,
+            languages={'octo/kafka-go': LANGUAGES['kafka-go'], 'octo/crewai-agents': LANGUAGES['crewai-agents']})
+
+        digest = profile_digest(profile, top=2, now=NOW)
+
+        assert digest.splitlines()[:3] == [
+            '# GitHub profile: Octo Cat (@octo)',
+            'Bio: Backend engineer | Location: London',
+            '5 public repositories (4 own, 1 forks), 105 stars received, 12 followers, on GitHub since 2012',
+        ]
+        assert '## Languages\nGo 60%, Python 33%, Shell 7%' in digest
+        assert ('1. kafka-go (Go, 40 stars, 6 forks, pushed 2024-05-20) - kafka-go project [topics: kafka, go]\n'
+                '2. crewai-agents (Python, 5 stars, pushed 2024-05-20) - crewai-agents project\n\n') in digest
+        assert digest.endswith('3 public events in the last 90 days: 2 pushes, 1 pull requests\n'
+                               'Most active in: octo/kafka-go (2), other/lib (1)')
+
+
+class TestGitHubProfileTool:
+    """Test suite for the agent-facing GitHub profile tool"""
+
+    def test_returns_digest_in_one_call(self, github, tmp_path):
+        """Test that one tool call returns the digest for a profile URL"""
+        api = github()
+        tool = GitHubProfileTool(client=GitHubClient(api_url=api.base, cache_dir=str(tmp_path)))
+
+        digest = tool._run(github_url='https://github.com/octo')
+
+        assert digest.startswith('# GitHub profile: Octo Cat (@octo)')
+        assert '1. kafka-go' in digest
+
+    def test_reports_unknown_users(self, github, tmp_path):
+        """Test that a missing user comes back as a message for the agent rather than an exception"""
+        api = github()
+        tool = GitHubProfileTool(client=GitHubClient(api_url=api.base, cache_dir=str(tmp_path)))
+
+        assert tool._run(github_url='https://github.com/nobody') == (
+            'Could not collect the GitHub profile: /users/nobody was not found')
@@ -0,0 +1,110 @@
+import json
+
+import pytest
+
+from jobsearch_crew.tools.resume_index import ResumeIndex, chunk_markdown
+from jobsearch_crew.tools.resume_search_tool import ResumeSearchTool
+
+RESUME = """# Jane Doe
+
+Backend engineer.
+
+## Experience
+
+Built Go microservices and Kafka pipelines.
+
+## Skills
+
+Python, Go, Kubernetes.
+"""
+
+VOCABULARY = ['go', 'kafka', 'python', 'kubernetes', 'engineer', 'jane']
+
+
+class FakeEmbeddings:
+    """Bag-of-words embeddings that record every text sent to the model"""
+    model = 'fake-embedding'
+
+    def __init__(self):
+        self.embedded = []
+        self.queries = []
+
+    def _vector(self, text):
+        words = text.lower().replace(',', ' ').replace('.', ' ').split()
+        return [float(words.count(term)) for term in VOCABULARY]
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        self.queries.append(text)
+        return self._vector(text)
+
+
+class TestResumeIndex:
+    """Test suite for the persistent resume embedding index"""
+
+    @pytest.fixture
+    def resume(self, tmp_path):
+        path = tmp_path / 'resume.md'
+        path.write_text(RESUME)
+        return path
+
+    def test_chunks_follow_headings(self):
+        """Test that chunks never straddle a heading"""
+        assert chunk_markdown(RESUME) == [
+            '# Jane Doe\n\nBackend engineer.',
+            '## Experience\n\nBuilt Go microservices and Kafka pipelines.',
+            '## Skills\n\nPython, Go, Kubernetes.',
+        ]
+
+    def test_unchanged_resume_is_not_embedded_again(self, resume, tmp_path):
+        """Test that a second startup loads the index without calling the embedding model"""
+        index_path = str(tmp_path / 'index' / 'resume.json')
+        ResumeSearchTool(document=str(resume), index_path=index_path, embeddings=FakeEmbeddings())
+
+        embeddings = FakeEmbeddings()
+        tool = ResumeSearchTool(document=str(resume), index_path=index_path, embeddings=embeddings)
+
+        assert embeddings.embedded == []
+        assert tool.index.last_sync == {'reused': 3, 'embedded': 0, 'removed': 0}
+
+    def test_only_changed_chunks_are_embedded(self, resume, tmp_path):
+        """Test that editing one section re-embeds only that section's chunk"""
+        index_path = str(tmp_path / 'resume.json')
+        ResumeSearchTool(document=str(resume), index_path=index_path, embeddings=FakeEmbeddings())
+        resume.write_text(RESUME.replace('Python, Go, Kubernetes.', 'Python, Kubernetes.'))
+
+        embeddings = FakeEmbeddings()
+        tool = ResumeSearchTool(document=str(resume), index_path=index_path, embeddings=embeddings)
+
+        assert embeddings.embedded == ['## Skills\n\nPython, Kubernetes.']
+        assert tool.index.last_sync == {'reused': 2, 'embedded': 1, 'removed': 1}
+        assert len(json.loads(open(index_path).read())['chunks']) == 3
+
+    def test_model_change_rebuilds_the_index(self, resume, tmp_path):
+        """Test that vectors from another embedding model are not reused"""
+        index_path = str(tmp_path / 'resume.json')
+        ResumeSearchTool(document=str(resume), index_path=index_path, embeddings=FakeEmbeddings())
+
+        assert ResumeIndex(index_path, model='other-model').chunks == []
+
+    def test_search_returns_the_closest_chunk(self, resume, tmp_path):
+        """Test that a query is answered with the most similar chunk first"""
+        tool = ResumeSearchTool(document=str(resume), index_path=str(tmp_path / 'resume.json'),
+                                embeddings=FakeEmbeddings(), top_k=1)
+
+        assert tool._run(search_query='kafka') == 'Relevant Content:\n## Experience\n\nBuilt Go microservices and Kafka pipelines.'
+
+    def test_query_vectors_are_memoised_up_to_a_limit(self, resume, tmp_path):
+        """Test that repeated queries reuse their vector and the least recently used one is dropped"""
+        embeddings = FakeEmbeddings()
+        tool = ResumeSearchTool(document=str(resume), index_path=str(tmp_path / 'resume.json'),
+                                embeddings=embeddings, max_queries=2)
+
+        for query in ['kafka', 'go', 'kafka', 'python', 'kafka', 'go']:
+            tool._run(search_query=query)
+
+        assert embeddings.queries == ['kafka', 'go', 'python', 'go']
+        assert tool.embed_query.cache_info().currsize == 2
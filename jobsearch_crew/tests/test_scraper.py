@@ -0,0 +1,203 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from crew_common.tool_cache import ToolResultCache
+from jobsearch_crew.tools.scrape_tool import ScrapeWebsitesTool
+from jobsearch_crew.tools.scraper import Scraper, extract_main_text
+
+JOB_POSTING = """<html><head><title>Senior Go Engineer</title><script>track()</script></head>
+<body>
+  <header><a href="/">Jobs</a></header>
+  <nav class="site-nav"><a href="/a">About</a><a href="/b">Careers</a></nav>
+  <div id="cookie-banner">We use cookies</div>
+  <main>
+    <h1>Senior Go Engineer</h1>
+    <p>Build   Kafka pipelines
+       in Go.</p>
+    <ul><li>5 years of Go</li><li>Kubernetes</li></ul>
+  </main>
+  <aside class="related-jobs">Other jobs</aside>
+  <footer>Copyright</footer>
+</body></html>"""
+
+ROBOTS = "User-agent: *\nDisallow: /private\n"
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """Local HTTP server serving fixture pages and recording how it was used"""
+
+    daemon_threads = True
+
+    def __init__(self, delay=0.0, robots=ROBOTS, robots_status=200):
+        super().__init__(('127.0.0.1', 0), FixtureHandler)
+        self.delay = delay
+        self.robots = robots
+        self.robots_status = robots_status
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.paths = []
+
+    def handle_error(self, request, client_address):
+        # Clients that time out hang up on purpose
+        pass
+
+    @property
+    def base(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+            server.paths.append(self.path)
+        try:
+            if self.path == '/robots.txt':
+                self._send(server.robots_status, server.robots, 'text/plain')
+                return
+            time.sleep(server.delay if self.path != '/slow' else 2)
+            if self.path == '/missing':
+                self._send(404, 'gone', 'text/html')
+            elif self.path == '/unknown-charset':
+                self._send(200, JOB_POSTING, 'text/html', charset='x-no-such-charset')
+            else:
+                self._send(200, JOB_POSTING.replace('Senior Go Engineer', f"Job {self.path}", 1), 'text/html')
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _send(self, status, body, content_type, charset='utf-8'):
+        payload = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', f"{content_type}; charset={charset}")
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    servers = []
+
+    def start(**kwargs):
+        instance = FixtureServer(**kwargs)
+        threading.Thread(target=instance.serve_forever, daemon=True).start()
+        servers.append(instance)
+        return instance
+    yield start
+    for instance in servers:
+        instance.shutdown()
+        instance.server_close()
+
+
+class TestExtractMainText:
+    """Test suite for boilerplate stripping"""
+
+    def test_keeps_only_the_main_content(self):
+        """Test that navigation, banners, sidebars and scripts are dropped"""
+        title, text = extract_main_text(JOB_POSTING)
+
+        assert title == 'Senior Go Engineer'
+        assert text == 'Senior Go Engineer\nBuild Kafka pipelines in Go.\n5 years of Go\nKubernetes'
+
+    def test_truncates_long_pages(self):
+        """Test that the text is cut to max_chars"""
+        _, text = extract_main_text(f"<p>{'word ' * 100}</p>", max_chars=20)
+
+        assert text == 'word word word word ...'
+
+
+class TestScraper:
+    """Test suite for concurrent scraping against a local server"""
+
+    def test_fetches_pages_concurrently_within_the_host_limit(self, server):
+        """Test that a batch overlaps requests but never exceeds per_host at once"""
+        site = server(delay=0.2)
+        urls = [f"{site.base}/job/{index}" for index in range(6)]
+        scraper = Scraper(max_concurrency=10, per_host=3)
+
+        started = time.perf_counter()
+        results = scraper.scrape(urls)
+        elapsed = time.perf_counter() - started
+
+        assert [result.url for result in results] == urls
+        assert all(result.ok and result.title == f"Job /job/{index}" for index, result in enumerate(results))
+        assert site.peak == 3
+        assert elapsed < 6 * 0.2
+        assert site.paths.count('/robots.txt') == 1
+        assert scraper.stats.pages == 6 and scraper.stats.chars_returned < scraper.stats.bytes_fetched
+
+    def test_respects_robots_and_reports_failures(self, server):
+        """Test that disallowed, missing and timed out pages come back as errors"""
+        site = server()
+        results = Scraper(timeout=0.5).scrape([
+            f"{site.base}/private/job", f"{site.base}/missing", f"{site.base}/slow", 'ftp://example.com/job',
+        ])
+
+        assert [result.error for result in results] == [
+            'disallowed by robots.txt', 'HTTP 404', 'timed out after 0.5s', 'not an http(s) URL']
+        assert '/private/job' not in site.paths
+
+    def test_unknown_charset_is_decoded_as_utf8(self, server):
+        """Test that a page with a charset Python does not know is still fetched, without failing the batch"""
+        site = server()
+
+        results = Scraper().scrape([f"{site.base}/unknown-charset", f"{site.base}/job"])
+
+        assert all(result.ok for result in results)
+        assert results[0].title == 'Senior Go Engineer'
+
+    @pytest.mark.parametrize('status, allowed', [(401, False), (403, False), (404, True), (500, True)])
+    def test_robots_errors(self, server, status, allowed):
+        """Test that a forbidden robots.txt disallows the host while a missing or broken one allows it"""
+        site = server(robots='no', robots_status=status)
+
+        result = Scraper().scrape([f"{site.base}/job"])[0]
+
+        assert result.ok is allowed
+        assert ('/job' in site.paths) is allowed
+
+    def test_crawl_delay_spaces_out_requests(self, server):
+        """Test that a robots.txt Crawl-delay is honoured between requests to one host"""
+        site = server(robots="User-agent: *\nCrawl-delay: 1\n")
+
+        started = time.perf_counter()
+        Scraper(per_host=4).scrape([f"{site.base}/job/{index}" for index in range(2)])
+
+        assert time.perf_counter() - started >= 1
+
+
+class TestScrapeWebsitesTool:
+    """Test suite for the agent-facing scrape tool"""
+
+    def test_returns_compact_pages_and_caches_each_one(self, server, tmp_path):
+        """Test that pages are formatted for the agent and reused across calls one by one"""
+        site = server()
+        tool = ScrapeWebsitesTool(scraper=Scraper(), cache=ToolResultCache(directory=str(tmp_path)))
+
+        first = tool._run(website_urls=[f"{site.base}/job/1", f"{site.base}/missing"])
+        second = tool._run(website_urls=[f"{site.base}/job/1", f"{site.base}/job/2"])
+
+        assert first.startswith(f"## Job /job/1\nURL: {site.base}/job/1\n\nSenior Go Engineer\nBuild Kafka pipelines in Go.")
+        assert f"## {site.base}/missing\nCould not read this page: HTTP 404" in first
+        assert '## Job /job/2' in second
+        assert [path for path in site.paths if path.startswith('/job')] == ['/job/1', '/job/2']
+
+    def test_url_strings_split_on_whitespace_only(self, server):
+        """Test that a string of URLs keeps the commas inside a URL"""
+        site = server()
+        tool = ScrapeWebsitesTool(scraper=Scraper())
+
+        tool._run(website_urls=f"{site.base}/job/a,b\n{site.base}/job/c")
+
+        assert sorted(path for path in site.paths if path.startswith('/job')) == ['/job/a,b', '/job/c']
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""Size and build time of the board digest versus raw Trello JSON.
+
+Generates a synthetic board shaped like the ``/1/boards/{id}/cards``
+response (labels, attachments and ``commentCard`` actions with full
+``memberCreator`` and ``limits`` blobs), then compares what the data
+collector would receive with and without the digest stage.
+
+Tokens are counted with tiktoken's ``cl100k_base`` when it is available
+locally, otherwise estimated as characters / 4.
+
+Run from the project root:
+
+    python benchmarks/bench_board_digest.py [cards]
+"""
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from project_planning_crew.tools.board_digest import build_digest  # noqa: E402
+
+NOW = datetime(2024, 9, 1, tzinfo=timezone.utc)
+LISTS = {f"list{index:020x}": name for index, name in enumerate(['Backlog', 'TODO', 'In Progress', 'Review', 'Done'])}
+MEMBERS = [
+    {'id': f"member{index:018x}", 'fullName': f"Member {index}", 'username': f"member{index}", 'initials': f"M{index}"}
+    for index in range(8)
+]
+
+
+def trello_date(moment: datetime) -> str:
+    return moment.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+
+def synthetic_card(index: int, rng: random.Random) -> dict:
+    card_id = f"{index:024x}"
+    list_id = rng.choice(list(LISTS))
+    actions = []
+    for comment in range(rng.randint(0, 3)):
+        member = rng.choice(MEMBERS)
+        actions.append({
+            'id': f"{index:016x}{comment:08x}",
+            'idMemberCreator': member['id'],
+            'data': {
+                'text': f"Progress note {comment} on card {index}: waiting for review of the API changes.",
+                'textData': {'emoji': {}},
+                'card': {'id': card_id, 'name': f"Card {index}", 'idShort': index, 'shortLink': f"sl{index:06d}"},
+                'board': {'id': 'board0000000000000000000', 'name': 'Synthetic Board', 'shortLink': 'boardSL1'},
+                'list': {'id': list_id, 'name': LISTS[list_id]},
+            },
+            'appCreator': None,
+            'type': 'commentCard',
+            'date': trello_date(NOW - timedelta(hours=rng.randint(1, 2000))),
+            'limits': {'reactions': {'perAction': {'status': 'ok', 'disableAt': 900, 'warnAt': 720},
+                                     'uniquePerAction': {'status': 'ok', 'disableAt': 17, 'warnAt': 14}}},
+            'memberCreator': dict(member, activityBlocked=False, avatarHash='d5500941ebf808e561f9083504877bca',
+                                  avatarUrl=f"https://trello-members.s3.amazonaws.com/{member['id']}/d5500941ebf808e561f9083504877bca",
+                                  idMemberReferrer=None, nonPublic={}, nonPublicAvailable=True),
+        })
+    due = trello_date(NOW + timedelta(days=rng.randint(-30, 30))) if rng.random() < 0.6 else None
+    return {
+        'id': card_id,
+        'name': f"Card {index}: implement feature {index % 97}",
+        'idList': list_id,
+        'due': due,
+        'dueComplete': rng.random() < 0.2,
+        'dateLastActivity': trello_date(NOW - timedelta(days=rng.randint(0, 60))),
+        'labels': [{'id': 'label00000000000000000001', 'idBoard': 'board0000000000000000000', 'name': 'Urgent',
+                    'color': 'red', 'uses': 12}] if rng.random() < 0.3 else [],
+        'attachments': [],
+        'actions': actions,
+    }
+
+
+def token_counter():
+    """Return a token counting function and its name."""
+    try:
+        import tiktoken
+        encoding = tiktoken.get_encoding('cl100k_base')
+        return (lambda text: len(encoding.encode(text))), 'cl100k_base'
+    except Exception:
+        # The encoding is downloaded on first use, which fails offline
+        return (lambda text: len(text) // 4), 'chars / 4 estimate'
+
+
+def main() -> None:
+    card_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rng = random.Random(42)
+    cards = [synthetic_card(index, rng) for index in range(card_count)]
+
+    timings = []
+    for _ in range(5):
+        started = time.perf_counter()
+        digest_text = json.dumps(build_digest(cards, LISTS, now=NOW))
+        timings.append(time.perf_counter() - started)
+    raw_text = json.dumps(cards)
+
+    count_tokens, counter_name = token_counter()
+    raw_tokens, digest_tokens = count_tokens(raw_text), count_tokens(digest_text)
+    print(f"cards              {card_count}")
+    print(f"token counter      {counter_name}")
+    print(f"raw JSON           {len(raw_text):>10} chars {raw_tokens:>10} tokens")
+    print(f"digest JSON        {len(digest_text):>10} chars {digest_tokens:>10} tokens")
+    print(f"token reduction    {100 * (1 - digest_tokens / raw_tokens):.1f}%")
+    print(f"digest build       median {statistics.median(timings) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
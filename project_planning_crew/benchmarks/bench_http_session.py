@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""Per-call latency of bare ``requests.get`` versus the pooled Trello session.
+
+Starts a local keep-alive HTTP stub that answers like the Trello card
+endpoint and times the same number of calls through both paths.
+
+Run from the project root:
+
+    python benchmarks/bench_http_session.py [calls]
+"""
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from project_planning_crew.tools.http_session import build_session  # noqa: E402
+
+CARD_PAYLOAD = json.dumps({'id': 'card', 'name': 'Benchmark card', 'idList': 'list'}).encode()
+
+
+class StubTrelloHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(CARD_PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(CARD_PAYLOAD)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def time_calls(get, url: str, calls: int) -> list:
+    """Time ``calls`` GET requests and return per-call latencies in milliseconds."""
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        response = get(url, params={'key': 'k', 'token': 't'}, timeout=(3.05, 30))
+        response.content
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(label: str, latencies: list) -> None:
+    print(f"{label:<16} mean {statistics.mean(latencies):7.3f} ms  "
+          f"p50 {statistics.median(latencies):7.3f} ms  "
+          f"max {max(latencies):7.3f} ms")
+
+
+def main(calls: int = 200) -> None:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubTrelloHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/1/cards/card"
+
+    try:
+        print(f"{calls} calls against {url}")
+        report('requests.get', time_calls(requests.get, url, calls))
+        session = build_session()
+        report('pooled session', time_calls(session.get, url, calls))
+        session.close()
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -1,7 +1,9 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from project_planning_crew.tools.board_fetcher_tool import BoardDataFetcherTool
-from project_planning_crew.tools.card_fetcher_tool import CardDataFetcherTool
+from crew_common.prepare import prepare_crew, task_names
+from crew_common.run_mode import agent_verbose, crew_verbosity
+from project_planning_crew.tools.board_fetcher_tool import BoardDataFetcherTool, BoardSummaryFetcherTool, SprintMetricsTool
+from project_planning_crew.tools.card_fetcher_tool import CardBatchDataFetcherTool, CardDataFetcherTool
 
 # Uncommfrom ent the following line to use an example of a custom tool
 # from project_planning_crew.tools.custom_tool import MyCustomTool
@@ -19,17 +21,18 @@ class ProjectPlanningCrewCrew():
 	def data_collector(self) -> Agent:
 		return Agent(
 			config=self.agents_config['data_collector'],
-			tools=[BoardDataFetcherTool(), CardDataFetcherTool()], 
+			tools=[BoardDataFetcherTool(), BoardSummaryFetcherTool(), CardDataFetcherTool(), CardBatchDataFetcherTool()],
 			allow_delegation=False,
-			verbose=True
+			verbose=agent_verbose()
 		)
 
 	@agent
 	def project_analyst(self) -> Agent:
 		return Agent(
 			config=self.agents_config['project_analyst'],
+			tools=[SprintMetricsTool()],
 			allow_delegation=False,
-			verbose=True
+			verbose=agent_verbose()
 		)
 
 	@task
@@ -43,8 +46,7 @@ class ProjectPlanningCrewCrew():
 	def data_analysis_task(self) -> Task:
 		return Task(
 			config=self.tasks_config['data_analysis_task'],
-			agent=self.project_analyst(),
-			output_file='report.md'
+			agent=self.project_analyst()
 		)
 	
 	@task
@@ -57,11 +59,15 @@ class ProjectPlanningCrewCrew():
 
 	@crew
 	def crew(self) -> Crew:
-		"""Creates the ProjectPlanningCrew crew"""
-		return Crew(
+		"""Creates the ProjectPlanningCrew crew
+
+		Every task's output is streamed to ``runs/<run id>/<task name>.md`` as it
+		is generated; only the final report is also published to ``report.md``.
+		"""
+		return prepare_crew(Crew(
 			agents=self.agents, # Automatically created by the @agent decorator
 			tasks=self.tasks, # Automatically created by the @task decorator
 			process=Process.sequential,
-			verbose=2,
+			verbose=crew_verbosity(),
 			# process=Process.hierarchical, # In case you wanna use that instead https://docs.crewai.com/how-to/Hierarchical/
-		)
\ No newline at end of file
+		), 'project_planning_crew', task_names(self), reports=True)
\ No newline at end of file
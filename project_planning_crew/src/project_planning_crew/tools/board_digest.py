@@ -0,0 +1,87 @@
+"""Compact, deterministic digest of raw Trello board data for the agents.
+
+Raw Trello cards carry a lot that no agent reads: avatar URLs, reaction
+limits, ``memberCreator`` blobs, short links and nested board/list stubs on
+every action. :func:`build_digest` projects each card and its comment
+actions onto a small schema, groups the cards by list and computes the
+aggregates (overdue and stale counts) in Python, so the LLM receives a
+fraction of the tokens and no arithmetic to do.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional
+
+from project_planning_crew.tools.board_summary import parse_trello_date
+
+DEFAULT_STALE_DAYS = 14
+
+
+def project_comment(action: dict) -> dict:
+    """Keep the text, author and date of a ``commentCard`` action."""
+    return {
+        'text': action.get('data', {}).get('text'),
+        'author': (action.get('memberCreator') or {}).get('fullName'),
+        'date': action.get('date'),
+    }
+
+
+def project_card(card: dict) -> dict:
+    """Keep the fields of a card the agents reason about, plus its comments."""
+    digest = {
+        'id': card['id'],
+        'name': card.get('name'),
+        'due': card.get('due'),
+        'labels': [label.get('name') or label.get('color') for label in card.get('labels') or []],
+        'lastActivity': card.get('dateLastActivity'),
+    }
+    comments = [project_comment(action) for action in card.get('actions') or [] if action.get('type', 'commentCard') == 'commentCard']
+    if comments:
+        digest['comments'] = comments
+    return digest
+
+
+def build_digest(
+    cards: Iterable[dict],
+    list_names: Optional[Dict[str, str]] = None,
+    now: Optional[datetime] = None,
+    stale_days: int = DEFAULT_STALE_DAYS,
+) -> dict:
+    """Group projected cards by list and count overdue and stale cards.
+
+    Args:
+        cards: Raw Trello cards, optionally with their comment actions under ``actions``.
+        list_names: List ID to name mapping; cards already tagged with ``listName`` do not need it.
+        now: Reference time for overdue and stale checks, defaults to the current UTC time.
+        stale_days: Days without activity after which an open card counts as stale.
+
+    Returns:
+        dict: ``cardCount``, ``commentCount``, ``overdue``, ``stale`` and
+        ``lists``, each list carrying its own counts and cards in board order
+    """
+    now = now or datetime.now(timezone.utc)
+    stale_before = now - timedelta(days=stale_days)
+    list_names = list_names or {}
+    lists: Dict[str, dict] = {}
+    totals = {'cardCount': 0, 'commentCount': 0, 'overdue': 0, 'stale': 0}
+
+    for card in cards:
+        name = card.get('listName') or list_names.get(card.get('idList')) or card.get('idList')
+        group = lists.setdefault(name, {'name': name, 'cardCount': 0, 'commentCount': 0, 'overdue': 0, 'stale': 0, 'cards': []})
+        projected = project_card(card)
+        counts = {'cardCount': 1, 'commentCount': len(projected.get('comments', [])), 'overdue': 0, 'stale': 0}
+
+        due = parse_trello_date(card.get('due'))
+        if due is not None and due < now and not card.get('dueComplete'):
+            projected['overdue'] = True
+            counts['overdue'] = 1
+        last_activity = parse_trello_date(card.get('dateLastActivity'))
+        if last_activity is not None and last_activity < stale_before:
+            projected['stale'] = True
+            counts['stale'] = 1
+
+        for key, value in counts.items():
+            totals[key] += value
+            group[key] += value
+        group['cards'].append(projected)
+
+    return dict(totals, lists=list(lists.values()))
+
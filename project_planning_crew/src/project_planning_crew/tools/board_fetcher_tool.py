@@ -1,36 +1,151 @@
 from crewai_tools import BaseTool
+from typing import Optional, Tuple
 import os
 import json
 import requests
 
+from project_planning_crew.tools.board_digest import build_digest
+from project_planning_crew.tools.board_snapshot import BoardSnapshotStore, sync_board
+from project_planning_crew.tools.board_summary import summarize_board
+from project_planning_crew.tools.http_session import get_session, get_timeout
+from project_planning_crew.tools.sprint_metrics import compute_sprint_metrics
+from project_planning_crew.tools.trello_client import TrelloAPIError, iter_lists
+from project_planning_crew.tools.trello_config import TrelloConfig, TrelloConfigError, resolve_config
+
+# Sample board served when Trello cannot be reached
+FALLBACK_CARDS = [{'id': '66c3bfed69b473b8fe9d922e', 'name': 'Analysis of results from CSV', 'idList': '66c308f676b057fdfbd5fdb3', 'due': None, 'dateLastActivity': '2024-08-19T21:58:05.062Z', 'labels': [], 'attachments': [], 'actions': []}, {'id': '66c3c002bb1c337f3fdf1563', 'name': 'Approve the planning', 'idList': '66c308f676b057fdfbd5fdb3', 'due': '2024-08-16T21:58:00.000Z', 'dateLastActivity': '2024-08-19T21:58:57.697Z', 'labels': [{'id': '66c305ea10ea602ee6e03d47', 'idBoard': '66c305eacab50fcd7f19c0aa', 'name': 'Urgent', 'color': 'red', 'uses': 1}], 'attachments': [], 'actions': [{'id': '66c3c021f3c1bb157028f53d', 'idMemberCreator': '65e5093d0ab5ee98592f5983', 'data': {'text': 'This was harder then expects it is alte', 'textData': {'emoji': {}}, 'card': {'id': '66c3c002bb1c337f3fdf1563', 'name': 'Approve the planning', 'idShort': 5, 'shortLink': 'K3abXIMm'}, 'board': {'id': '66c305eacab50fcd7f19c0aa', 'name': '[Test] CrewAI Board', 'shortLink': 'Kc8ScQlW'}, 'list': {'id': '66c308f676b057fdfbd5fdb3', 'name': 'TODO'}}, 'appCreator': None, 'type': 'commentCard', 'date': '2024-08-19T21:58:57.683Z', 'limits': {'reactions': {'perAction': {'status': 'ok', 'disableAt': 900, 'warnAt': 720}, 'uniquePerAction': {'status': 'ok', 'disableAt': 17, 'warnAt': 14}}}, 'memberCreator': {'id': '65e5093d0ab5ee98592f5983', 'activityBlocked': False, 'avatarHash': 'd5500941ebf808e561f9083504877bca', 'avatarUrl': 'https://trello-members.s3.amazonaws.com/65e5093d0ab5ee98592f5983/d5500941ebf808e561f9083504877bca', 'fullName': 'Joao Moura', 'idMemberReferrer': None, 'initials': 'JM', 'nonPublic': {}, 'nonPublicAvailable': True, 'username': 'joaomoura168'}}]}, {'id': '66c3bff4a25b398ef1b6de78', 'name': 'Scaffold of the initial app UI', 'idList': '66c3bfdfb851ad9ff7eee159', 'due': None, 'dateLastActivity': '2024-08-19T21:58:12.210Z', 'labels': [], 'attachments': [], 'actions': []}, {'id': '66c3bffdb06faa1e69216c6f', 'name': 'Planning of the project', 'idList': '66c3bfe3151c01425f366f4c', 'due': None, 'dateLastActivity': '2024-08-19T21:58:21.081Z', 'labels': [], 'attachments': [], 'actions': []}]
+
+
 class BoardDataFetcherTool(BaseTool):
     name: str = "Trello Board Data Fetcher"
     description: str = "Fetches card data, comments, and activity from a Trello board."
 
-    api_key: str = os.environ['TRELLO_API_KEY']
-    api_token: str = os.environ['TRELLO_API_TOKEN']
-    board_id: str = os.environ['TRELLO_BOARD_ID']
+    # Credentials are resolved on every call (see trello_config), so these
+    # only need setting to pin a tool instance to one tenant.
+    api_key: Optional[str] = None
+    api_token: Optional[str] = None
+    board_id: Optional[str] = None
+    snapshot_path: Optional[str] = None
 
     def _run(self) -> dict:
         """
         Fetch all cards from the specified Trello board.
+
+        When TRELLO_SNAPSHOT_PATH is set, the board is synced incrementally
+        into a local SQLite snapshot and the merged view is served from it.
+
+        The cards are returned as a compact digest grouped by list (see
+        board_digest) rather than as raw Trello JSON. Missing credentials
+        come back as an ``{"error": ...}`` dict.
+        """
+        try:
+            cards, list_names = self._fetch_board()
+        except TrelloConfigError as error:
+            return {"error": str(error)}
+        return self._summarize(cards, list_names)
+
+    def _summarize(self, cards: list, list_names: dict) -> dict:
+        """
+        Reduce the fetched board to what the agent is given.
         """
-        url = f"{os.getenv('DLAI_TRELLO_BASE_URL', 'https://api.trello.com')}/1/boards/{self.board_id}/cards"
+        return build_digest(cards, list_names)
+
+    def _fetch_board(self) -> Tuple[list, dict]:
+        """
+        Return the board's raw cards, with their comment actions, and a list ID to name map.
+
+        Raises:
+            TrelloConfigError: If the Trello credentials or board ID are not configured
+        """
+        config = resolve_config(
+            api_key=self.api_key, api_token=self.api_token, board_id=self.board_id
+        ).require('api_key', 'api_token', 'board_id')
+        snapshot_path = self.snapshot_path if self.snapshot_path is not None else os.getenv('TRELLO_SNAPSHOT_PATH', '')
+        if snapshot_path:
+            cards = self._run_from_snapshot(snapshot_path, config)
+            if cards:
+                return cards, {}
+
+        url = f"{config.base_url}/1/boards/{config.board_id}/cards"
 
         query = {
-            'key': self.api_key,
-            'token': self.api_token,
+            'key': config.api_key,
+            'token': config.api_token,
             'fields': 'name,idList,due,dateLastActivity,labels',
             'attachments': 'true',
             'actions': 'commentCard'
         }
 
-        response = requests.get(url, params=query)
+        try:
+            response = get_session().get(url, params=query, timeout=get_timeout())
+        except requests.RequestException:
+            response = None
 
-        if response.status_code == 200:
-            return response.json()
+        if response is not None and response.status_code == 200:
+            return response.json(), self._list_names(config)
         else:
             # Fallback in case of timeouts or other issues
-            return json.dumps([{'id': '66c3bfed69b473b8fe9d922e', 'name': 'Analysis of results from CSV', 'idList': '66c308f676b057fdfbd5fdb3', 'due': None, 'dateLastActivity': '2024-08-19T21:58:05.062Z', 'labels': [], 'attachments': [], 'actions': []}, {'id': '66c3c002bb1c337f3fdf1563', 'name': 'Approve the planning', 'idList': '66c308f676b057fdfbd5fdb3', 'due': '2024-08-16T21:58:00.000Z', 'dateLastActivity': '2024-08-19T21:58:57.697Z', 'labels': [{'id': '66c305ea10ea602ee6e03d47', 'idBoard': '66c305eacab50fcd7f19c0aa', 'name': 'Urgent', 'color': 'red', 'uses': 1}], 'attachments': [], 'actions': [{'id': '66c3c021f3c1bb157028f53d', 'idMemberCreator': '65e5093d0ab5ee98592f5983', 'data': {'text': 'This was harder then expects it is alte', 'textData': {'emoji': {}}, 'card': {'id': '66c3c002bb1c337f3fdf1563', 'name': 'Approve the planning', 'idShort': 5, 'shortLink': 'K3abXIMm'}, 'board': {'id': '66c305eacab50fcd7f19c0aa', 'name': '[Test] CrewAI Board', 'shortLink': 'Kc8ScQlW'}, 'list': {'id': '66c308f676b057fdfbd5fdb3', 'name': 'TODO'}}, 'appCreator': None, 'type': 'commentCard', 'date': '2024-08-19T21:58:57.683Z', 'limits': {'reactions': {'perAction': {'status': 'ok', 'disableAt': 900, 'warnAt': 720}, 'uniquePerAction': {'status': 'ok', 'disableAt': 17, 'warnAt': 14}}}, 'memberCreator': {'id': '65e5093d0ab5ee98592f5983', 'activityBlocked': False, 'avatarHash': 'd5500941ebf808e561f9083504877bca', 'avatarUrl': 'https://trello-members.s3.amazonaws.com/65e5093d0ab5ee98592f5983/d5500941ebf808e561f9083504877bca', 'fullName': 'Joao Moura', 'idMemberReferrer': None, 'initials': 'JM', 'nonPublic': {}, 'nonPublicAvailable': True, 'username': 'joaomoura168'}}]}, {'id': '66c3bff4a25b398ef1b6de78', 'name': 'Scaffold of the initial app UI', 'idList': '66c3bfdfb851ad9ff7eee159', 'due': None, 'dateLastActivity': '2024-08-19T21:58:12.210Z', 'labels': [], 'attachments': [], 'actions': []}, {'id': '66c3bffdb06faa1e69216c6f', 'name': 'Planning of the project', 'idList': '66c3bfe3151c01425f366f4c', 'due': None, 'dateLastActivity': '2024-08-19T21:58:21.081Z', 'labels': [], 'attachments': [], 'actions': []}])
+            return FALLBACK_CARDS, {}
 
+    def _list_names(self, config: TrelloConfig) -> dict:
+        """
+        Map list IDs to names so the digest can group cards by list name.
+        """
+        try:
+            return {item['id']: item['name'] for item in iter_lists(config.board_id, config.api_key, config.api_token)}
+        except TrelloAPIError:
+            # Group by list ID rather than fail the whole fetch
+            return {}
 
+    def _run_from_snapshot(self, snapshot_path: str, config: TrelloConfig) -> list:
+        """
+        Sync the local snapshot and return every card with its comments.
+        """
+        with BoardSnapshotStore(snapshot_path) as store:
+            try:
+                sync_board(store, config.board_id, config.api_key, config.api_token)
+            except TrelloAPIError:
+                # Serve the last good snapshot while Trello is unavailable
+                pass
+            return store.cards_with_comments(config.board_id)
+
+
+class BoardSummaryFetcherTool(BaseTool):
+    name: str = "Trello Board Summary Fetcher"
+    description: str = (
+        "Pages through a large Trello board and returns a compact summary: card counts, "
+        "overdue counts and a sample of cards per list, plus the most recent comments."
+    )
+
+    api_key: Optional[str] = None
+    api_token: Optional[str] = None
+    board_id: Optional[str] = None
+
+    def _run(self) -> dict:
+        """
+        Stream the board's cards and comments page by page into a summary.
+        """
+        try:
+            config = resolve_config(
+                api_key=self.api_key, api_token=self.api_token, board_id=self.board_id
+            ).require('api_key', 'api_token', 'board_id')
+            return summarize_board(config.board_id, config.api_key, config.api_token)
+        except TrelloConfigError as error:
+            return json.dumps({"error": str(error)})
+        except TrelloAPIError as error:
+            return json.dumps({"error": f"Failed to fetch board summary: {error}"})
+
+
+class SprintMetricsTool(BoardDataFetcherTool):
+    name: str = "Trello Sprint Metrics"
+    description: str = (
+        "Computes sprint metrics for the Trello board in code: cycle time, overdue ratio, "
+        "work in progress per list, comment velocity and stale cards. Use these numbers "
+        "instead of counting or estimating them from card data."
+    )
+
+    def _summarize(self, cards: list, list_names: dict) -> dict:
+        """
+        Return the sprint metrics of the board fetched like the board data fetcher.
+        """
+        return compute_sprint_metrics(cards, list_names)
@@ -0,0 +1,199 @@
+"""Local SQLite snapshot of a Trello board with incremental sync.
+
+The first :func:`sync_board` for a board pages through every card and
+comment and stores them. Later syncs only read the board actions created
+``since`` the stored watermark, re-fetch the cards those actions touched in
+batches, and drop cards that were deleted, archived or moved away. The
+merged view is then served straight from the snapshot.
+"""
+import json
+import sqlite3
+from typing import Iterable, List, Optional
+
+from project_planning_crew.tools.trello_client import (
+    TrelloAPIError,
+    fetch_cards,
+    iter_actions,
+    iter_board_cards,
+    iter_comment_actions,
+    iter_lists,
+)
+
+# Action types that create, change, comment on or remove a card.
+SYNC_ACTION_FILTER = ','.join([
+    'commentCard',
+    'createCard',
+    'copyCard',
+    'updateCard',
+    'deleteCard',
+    'moveCardToBoard',
+    'moveCardFromBoard',
+    'convertToCardFromCheckItem',
+])
+REMOVED_ACTION_TYPES = ('deleteCard', 'moveCardFromBoard')
+SNAPSHOT_CARD_KEYS = ('id', 'name', 'idList', 'listName', 'due', 'dueComplete', 'dateLastActivity', 'labels')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cards (
+    board_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    date_last_activity TEXT,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (board_id, id)
+);
+CREATE TABLE IF NOT EXISTS comments (
+    board_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    card_id TEXT,
+    date TEXT,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (board_id, id)
+);
+CREATE INDEX IF NOT EXISTS comments_by_card ON comments (board_id, card_id);
+CREATE TABLE IF NOT EXISTS sync_state (
+    board_id TEXT PRIMARY KEY,
+    last_action_id TEXT
+);
+"""
+
+
+def _card_id(action: dict) -> Optional[str]:
+    return action.get('data', {}).get('card', {}).get('id')
+
+
+class BoardSnapshotStore:
+    """SQLite-backed store of card and comment snapshots per board.
+
+    Args:
+        path: SQLite database file, created on first use.
+    """
+
+    def __init__(self, path: str):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def watermark(self, board_id: str) -> Optional[str]:
+        """Return the newest action ID already applied to the snapshot."""
+        row = self.connection.execute(
+            'SELECT last_action_id FROM sync_state WHERE board_id = ?', (board_id,)).fetchone()
+        return row[0] if row else None
+
+    def set_watermark(self, board_id: str, action_id: str) -> None:
+        self.connection.execute(
+            'INSERT INTO sync_state (board_id, last_action_id) VALUES (?, ?) '
+            'ON CONFLICT (board_id) DO UPDATE SET last_action_id = excluded.last_action_id',
+            (board_id, action_id))
+
+    def upsert_cards(self, board_id: str, cards: Iterable[dict]) -> None:
+        """Store cards, never replacing a snapshot with older activity."""
+        self.connection.executemany(
+            'INSERT INTO cards (board_id, id, date_last_activity, payload) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT (board_id, id) DO UPDATE SET '
+            'date_last_activity = excluded.date_last_activity, payload = excluded.payload '
+            'WHERE excluded.date_last_activity >= cards.date_last_activity '
+            'OR cards.date_last_activity IS NULL',
+            ((board_id, card['id'], card.get('dateLastActivity'),
+              json.dumps({key: card.get(key) for key in SNAPSHOT_CARD_KEYS})) for card in cards))
+
+    def delete_cards(self, board_id: str, card_ids: Iterable[str]) -> None:
+        """Remove cards and their comments from the snapshot."""
+        rows = [(board_id, card_id) for card_id in card_ids]
+        self.connection.executemany('DELETE FROM cards WHERE board_id = ? AND id = ?', rows)
+        self.connection.executemany('DELETE FROM comments WHERE board_id = ? AND card_id = ?', rows)
+
+    def upsert_comments(self, board_id: str, actions: Iterable[dict]) -> None:
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO comments (board_id, id, card_id, date, payload) VALUES (?, ?, ?, ?, ?)',
+            ((board_id, action['id'], _card_id(action),
+              action.get('date'), json.dumps(action)) for action in actions))
+
+    def commit(self) -> None:
+        self.connection.commit()
+
+    def iter_cards(self, board_id: str):
+        """Yield stored cards in ID order."""
+        for (payload,) in self.connection.execute(
+                'SELECT payload FROM cards WHERE board_id = ? ORDER BY id', (board_id,)):
+            yield json.loads(payload)
+
+    def iter_comments(self, board_id: str):
+        """Yield stored comment actions, newest first."""
+        for (payload,) in self.connection.execute(
+                'SELECT payload FROM comments WHERE board_id = ? ORDER BY date DESC, id DESC', (board_id,)):
+            yield json.loads(payload)
+
+    def cards_with_comments(self, board_id: str) -> List[dict]:
+        """Return the merged view: every card with its comment actions attached."""
+        cards = {card['id']: dict(card, actions=[]) for card in self.iter_cards(board_id)}
+        for action in self.iter_comments(board_id):
+            card = cards.get(_card_id(action))
+            if card is not None:
+                card['actions'].append(action)
+        return list(cards.values())
+
+
+def sync_board(store: BoardSnapshotStore, board_id: str, api_key: str, api_token: str) -> dict:
+    """Bring the snapshot of ``board_id`` up to date.
+
+    Returns:
+        dict: Sync statistics with ``mode`` (``full`` or ``incremental``),
+        the number of ``actions`` read and ``cardsFetched``
+    """
+    watermark = store.watermark(board_id)
+    if watermark is None:
+        return _full_sync(store, board_id, api_key, api_token)
+
+    actions = list(iter_actions(board_id, api_key, api_token, SYNC_ACTION_FILTER, since=watermark))
+    if not actions:
+        return {'mode': 'incremental', 'actions': 0, 'cardsFetched': 0}
+
+    removed = {_card_id(action) for action in actions if action.get('type') in REMOVED_ACTION_TYPES}
+    changed = [card_id for card_id in dict.fromkeys(map(_card_id, actions)) if card_id and card_id not in removed]
+
+    cards = fetch_cards(changed, api_key, api_token) if changed else []
+    list_names = {item['id']: item['name'] for item in iter_lists(board_id, api_key, api_token)} if cards else {}
+    live = []
+    for card in cards:
+        if 'error' in card and not card['error'].startswith('HTTP 404'):
+            # Leave the watermark alone so the next sync retries these cards
+            raise TrelloAPIError(f"Could not refresh card {card['id']}: {card['error']}")
+        if 'error' in card or card.get('closed') or card.get('idList') not in list_names:
+            removed.add(card['id'])
+        else:
+            live.append(dict(card, listName=list_names[card['idList']]))
+
+    store.delete_cards(board_id, removed)
+    store.upsert_cards(board_id, live)
+    store.upsert_comments(board_id, [
+        action for action in actions
+        if action.get('type') == 'commentCard' and _card_id(action) not in removed])
+    store.set_watermark(board_id, actions[0]['id'])
+    store.commit()
+    return {'mode': 'incremental', 'actions': len(actions), 'cardsFetched': len(cards)}
+
+
+def _full_sync(store: BoardSnapshotStore, board_id: str, api_key: str, api_token: str) -> dict:
+    # Read the watermark first so nothing that happens during the full
+    # download is skipped by the next incremental sync.
+    newest = next(iter_actions(board_id, api_key, api_token, SYNC_ACTION_FILTER, page_size=1), None)
+    card_count = 0
+    for card in iter_board_cards(board_id, api_key, api_token):
+        store.upsert_cards(board_id, [card])
+        card_count += 1
+    action_count = 0
+    for action in iter_comment_actions(board_id, api_key, api_token):
+        store.upsert_comments(board_id, [action])
+        action_count += 1
+    if newest is not None:
+        store.set_watermark(board_id, newest['id'])
+    store.commit()
+    return {'mode': 'full', 'actions': action_count, 'cardsFetched': card_count}
@@ -0,0 +1,109 @@
+"""Incremental, memory-bounded summary of a Trello board.
+
+:class:`BoardSummary` consumes cards and comment actions one at a time, as
+yielded by the paged generators in
+:mod:`project_planning_crew.tools.trello_client`, and keeps only per-list
+counters plus a capped sample of cards and the most recent comments. Peak
+memory therefore depends on the caps, not on the size of the board.
+"""
+from datetime import datetime, timezone
+from typing import Optional
+
+from project_planning_crew.tools.trello_client import iter_board_cards, iter_comment_actions
+
+DEFAULT_MAX_CARDS_PER_LIST = 50
+DEFAULT_MAX_COMMENTS = 50
+
+
+def parse_trello_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse a Trello ISO-8601 timestamp such as ``2024-08-16T21:58:00.000Z``."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+class BoardSummary:
+    """Running summary of a board built from streamed cards and comments.
+
+    Args:
+        max_cards_per_list: Cards kept verbatim per list; the rest are only counted.
+        max_comments: Most recent comments kept.
+        now: Reference time for overdue checks, defaults to the current UTC time.
+    """
+
+    def __init__(
+        self,
+        max_cards_per_list: int = DEFAULT_MAX_CARDS_PER_LIST,
+        max_comments: int = DEFAULT_MAX_COMMENTS,
+        now: Optional[datetime] = None,
+    ):
+        self.max_cards_per_list = max_cards_per_list
+        self.max_comments = max_comments
+        self.now = now or datetime.now(timezone.utc)
+        self.lists = {}
+        self.card_count = 0
+        self.comment_count = 0
+        self.comments = []
+
+    def add_card(self, card: dict) -> None:
+        """Fold one card into the per-list counters and card sample."""
+        list_name = card.get('listName') or card.get('idList')
+        summary = self.lists.setdefault(list_name, {'name': list_name, 'cardCount': 0, 'overdue': 0, 'cards': []})
+        summary['cardCount'] += 1
+        self.card_count += 1
+
+        due = parse_trello_date(card.get('due'))
+        if due is not None and due < self.now and not card.get('dueComplete'):
+            summary['overdue'] += 1
+
+        if len(summary['cards']) < self.max_cards_per_list:
+            summary['cards'].append({
+                'id': card['id'],
+                'name': card.get('name'),
+                'due': card.get('due'),
+                'lastActivity': card.get('dateLastActivity'),
+                'labels': [label.get('name') or label.get('color') for label in card.get('labels', [])],
+            })
+
+    def add_comment(self, action: dict) -> None:
+        """Count a ``commentCard`` action, keeping it if it is among the newest."""
+        self.comment_count += 1
+        if len(self.comments) >= self.max_comments:
+            return
+        data = action.get('data', {})
+        self.comments.append({
+            'card': data.get('card', {}).get('name'),
+            'author': action.get('memberCreator', {}).get('fullName'),
+            'date': action.get('date'),
+            'text': data.get('text'),
+        })
+
+    def as_dict(self) -> dict:
+        """Return the summary as plain JSON-serialisable data."""
+        return {
+            'cardCount': self.card_count,
+            'commentCount': self.comment_count,
+            'lists': list(self.lists.values()),
+            'recentComments': self.comments,
+        }
+
+
+def summarize_board(
+    board_id: str,
+    api_key: str,
+    api_token: str,
+    page_size: Optional[int] = None,
+    **summary_options,
+) -> dict:
+    """Page through a whole board and return its compact summary.
+
+    Raises:
+        TrelloAPIError: If any page of cards or actions cannot be fetched
+    """
+    paging = {'page_size': page_size} if page_size else {}
+    summary = BoardSummary(**summary_options)
+    for card in iter_board_cards(board_id, api_key, api_token, **paging):
+        summary.add_card(card)
+    for action in iter_comment_actions(board_id, api_key, api_token, **paging):
+        summary.add_comment(action)
+    return summary.as_dict()
@@ -1,33 +1,48 @@
 from crewai_tools import BaseTool
+from typing import Optional
 import requests
 import os
 import json
 
+from project_planning_crew.tools.http_session import get_session, get_timeout
+from project_planning_crew.tools.trello_client import batch_workers, fetch_cards
+from project_planning_crew.tools.trello_config import TrelloConfigError, resolve_config
+
 class BoardDataFetcherTool(BaseTool):
     name: str = "Trello Board Data Fetcher"
     description: str = "Fetches card data, comments, and activity from a Trello board."
 
-    api_key: str = os.environ['TRELLO_API_KEY']
-    api_token: str = os.environ['TRELLO_API_TOKEN']
-    board_id: str = os.environ['TRELLO_BOARD_ID']
+    api_key: Optional[str] = None
+    api_token: Optional[str] = None
+    board_id: Optional[str] = None
 
     def _run(self) -> dict:
         """
         Fetch all cards from the specified Trello board.
         """
-        url = f"{os.getenv('DLAI_TRELLO_BASE_URL', 'https://api.trello.com')}/1/boards/{self.board_id}/cards"
+        try:
+            config = resolve_config(
+                api_key=self.api_key, api_token=self.api_token, board_id=self.board_id
+            ).require('api_key', 'api_token', 'board_id')
+        except TrelloConfigError as error:
+            return json.dumps({"error": str(error)})
+
+        url = f"{config.base_url}/1/boards/{config.board_id}/cards"
 
         query = {
-            'key': self.api_key,
-            'token': self.api_token,
+            'key': config.api_key,
+            'token': config.api_token,
             'fields': 'name,idList,due,dateLastActivity,labels',
             'attachments': 'true',
             'actions': 'commentCard'
         }
 
-        response = requests.get(url, params=query)
+        try:
+            response = get_session().get(url, params=query, timeout=get_timeout())
+        except requests.RequestException:
+            response = None
 
-        if response.status_code == 200:
+        if response is not None and response.status_code == 200:
             return response.json()
         else:
             # Fallback in case of timeouts or other issues
@@ -38,20 +53,48 @@ class CardDataFetcherTool(BaseTool):
   name: str = "Trello Card Data Fetcher"
   description: str = "Fetches card data from a Trello board."
 
-  api_key: str = os.environ['TRELLO_API_KEY']
-  api_token: str = os.environ['TRELLO_API_TOKEN']
+  api_key: Optional[str] = None
+  api_token: Optional[str] = None
 
   def _run(self, card_id: str) -> dict:
-    url = f"{os.getenv('DLAI_TRELLO_BASE_URL', 'https://api.trello.com')}/1/cards/{card_id}"
+    try:
+      config = resolve_config(api_key=self.api_key, api_token=self.api_token).require('api_key', 'api_token')
+    except TrelloConfigError as error:
+      return json.dumps({"error": str(error)})
+
+    url = f"{config.base_url}/1/cards/{card_id}"
     query = {
-      'key': self.api_key,
-      'token': self.api_token
+      'key': config.api_key,
+      'token': config.api_token
     }
-    response = requests.get(url, params=query)
+    try:
+      response = get_session().get(url, params=query, timeout=get_timeout())
+    except requests.RequestException:
+      response = None
 
-    if response.status_code == 200:
+    if response is not None and response.status_code == 200:
       return response.json()
     else:
       # Fallback in case of timeouts or other issues
       return json.dumps({"error": "Failed to fetch card data, don't try to fetch any trello data anymore"})
 
+
+class CardBatchDataFetcherTool(BaseTool):
+  name: str = "Trello Card Batch Data Fetcher"
+  description: str = (
+    "Fetches data for many Trello cards in a single call. "
+    "Pass every card ID you need as one comma separated list instead of fetching cards one at a time."
+  )
+
+  api_key: Optional[str] = None
+  api_token: Optional[str] = None
+  max_workers: Optional[int] = None
+
+  def _run(self, card_ids: str) -> str:
+    try:
+      config = resolve_config(api_key=self.api_key, api_token=self.api_token).require('api_key', 'api_token')
+    except TrelloConfigError as error:
+      return json.dumps({"error": str(error)})
+
+    max_workers = self.max_workers or batch_workers()
+    return json.dumps(fetch_cards(card_ids, config.api_key, config.api_token, max_workers=max_workers))
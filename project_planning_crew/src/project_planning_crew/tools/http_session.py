@@ -0,0 +1,114 @@
+"""Shared, connection-pooled HTTP session for the Trello tools.
+
+Every Trello tool call used to go through a bare ``requests.get``, paying a
+fresh TCP and TLS handshake each time. This module keeps a single
+process-wide ``requests.Session`` whose adapter pools keep-alive
+connections and retries throttled (429) and transient server (5xx)
+responses with exponential backoff.
+
+The pool and retry behaviour can be tuned through environment variables:
+
+- ``TRELLO_HTTP_POOL_SIZE``: connections kept alive per host (default 10)
+- ``TRELLO_HTTP_CONNECT_TIMEOUT``: connect timeout in seconds (default 3.05)
+- ``TRELLO_HTTP_READ_TIMEOUT``: read timeout in seconds (default 30)
+- ``TRELLO_HTTP_MAX_RETRIES``: retries on 429/5xx and connection errors (default 3)
+- ``TRELLO_HTTP_BACKOFF_FACTOR``: backoff factor between retries (default 0.5)
+"""
+import os
+import threading
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 3.05
+DEFAULT_READ_TIMEOUT = 30.0
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _env_number(name: str, default, cast):
+    """Read a numeric setting from the environment, falling back to ``default``."""
+    value = os.getenv(name, '')
+    if value == '':
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {value!r}")
+
+
+def build_session(
+    pool_size: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    backoff_factor: Optional[float] = None,
+) -> requests.Session:
+    """Build a new pooled session with retry and backoff on 429/5xx.
+
+    Args:
+        pool_size: Number of keep-alive connections kept per host.
+        max_retries: Retries for throttled, failed or unreachable requests.
+        backoff_factor: Exponential backoff factor between retries.
+
+    Returns:
+        requests.Session: Session with pooled adapters mounted for http and https
+    """
+    if pool_size is None:
+        pool_size = _env_number('TRELLO_HTTP_POOL_SIZE', DEFAULT_POOL_SIZE, int)
+    if max_retries is None:
+        max_retries = _env_number('TRELLO_HTTP_MAX_RETRIES', DEFAULT_MAX_RETRIES, int)
+    if backoff_factor is None:
+        backoff_factor = _env_number('TRELLO_HTTP_BACKOFF_FACTOR', DEFAULT_BACKOFF_FACTOR, float)
+
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET']),
+        respect_retry_after_header=True,
+        # Hand the last response back instead of raising, so the tools can
+        # fall back the same way they do for any other non-200 answer.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = build_session()
+    return _session
+
+
+def get_timeout() -> Tuple[float, float]:
+    """Return the ``(connect, read)`` timeout pair used for Trello requests."""
+    return (
+        _env_number('TRELLO_HTTP_CONNECT_TIMEOUT', DEFAULT_CONNECT_TIMEOUT, float),
+        _env_number('TRELLO_HTTP_READ_TIMEOUT', DEFAULT_READ_TIMEOUT, float),
+    )
+
+
+def reset_session() -> None:
+    """Close and drop the shared session so the next call builds a fresh one."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
@@ -0,0 +1,149 @@
+"""Deterministic sprint metrics computed from raw Trello cards.
+
+The cards are turned into a column table once (creation time, last
+activity, due date, list, comment timestamps as NumPy arrays) and every
+metric is a vectorised expression over those columns, so a board with
+thousands of cards is analysed in milliseconds and always gives the same
+numbers for the same data.
+
+Creation times come from the card ID: Trello IDs are MongoDB ObjectIds
+whose first eight hex digits are the creation time in Unix seconds. A card
+counts as done when its list name matches one of ``done_lists``; its cycle
+time is then the span from creation to its last activity.
+"""
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from project_planning_crew.tools.board_summary import parse_trello_date
+
+DEFAULT_DONE_LISTS = ('done', 'complete', 'completed', 'closed')
+DEFAULT_STALE_DAYS = 14
+DEFAULT_WINDOW_DAYS = 7
+STALEST_CARDS = 5
+DAY = 86400.0
+
+
+def _timestamp(value: Optional[str]) -> float:
+    moment = parse_trello_date(value)
+    return moment.timestamp() if moment is not None else np.nan
+
+
+def _created(card_id: str) -> float:
+    try:
+        return float(int(card_id[:8], 16))
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _round(value) -> Optional[float]:
+    value = float(value)
+    return None if np.isnan(value) else round(value, 2)
+
+
+class CardTable:
+    """Column view of a board's cards, one NumPy array per field."""
+
+    def __init__(self, cards: Iterable[dict], list_names: Optional[Dict[str, str]] = None):
+        list_names = list_names or {}
+        names, lists, created, last_activity, due, due_complete, comments = [], [], [], [], [], [], []
+        for card in cards:
+            names.append(card.get('name') or card['id'])
+            lists.append(card.get('listName') or list_names.get(card.get('idList')) or card.get('idList') or '')
+            created.append(_created(card['id']))
+            last_activity.append(_timestamp(card.get('dateLastActivity')))
+            due.append(_timestamp(card.get('due')))
+            due_complete.append(bool(card.get('dueComplete')))
+            comments.extend(
+                _timestamp(action.get('date')) for action in card.get('actions') or []
+                if action.get('type', 'commentCard') == 'commentCard'
+            )
+        self.names = np.array(names, dtype=object)
+        self.lists = np.array(lists, dtype=object)
+        self.created = np.array(created, dtype=float)
+        self.last_activity = np.array(last_activity, dtype=float)
+        self.due = np.array(due, dtype=float)
+        self.due_complete = np.array(due_complete, dtype=bool)
+        self.comment_dates = np.array(comments, dtype=float)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def compute_sprint_metrics(
+    cards: Iterable[dict],
+    list_names: Optional[Dict[str, str]] = None,
+    now: Optional[datetime] = None,
+    done_lists: Sequence[str] = DEFAULT_DONE_LISTS,
+    stale_days: int = DEFAULT_STALE_DAYS,
+    window_days: int = DEFAULT_WINDOW_DAYS,
+) -> dict:
+    """Compute cycle time, overdue ratio, WIP, comment velocity and staleness.
+
+    Args:
+        cards: Raw Trello cards, optionally with their comment actions under ``actions``.
+        list_names: List ID to name mapping for cards without ``listName``.
+        now: Reference time, defaults to the current UTC time.
+        done_lists: Case-insensitive names of the lists that hold finished cards.
+        stale_days: Days without activity after which an open card is stale.
+        window_days: Trailing window for comment velocity.
+
+    Returns:
+        dict: JSON-serialisable metrics; averages are None when there is no data
+    """
+    table = CardTable(cards, list_names)
+    now_ts = (now or datetime.now(timezone.utc)).timestamp()
+    done_names = {name.lower() for name in done_lists}
+    done = np.array([name.lower() in done_names for name in table.lists], dtype=bool)
+    open_cards = ~done
+
+    cycle = (table.last_activity[done] - table.created[done]) / DAY
+    cycle = cycle[~np.isnan(cycle)]
+
+    has_due = ~np.isnan(table.due) & ~table.due_complete & open_cards
+    overdue = has_due & (table.due < now_ts)
+
+    wip_lists, wip_counts = np.unique(table.lists[open_cards].astype(str), return_counts=True)
+
+    recent = table.comment_dates >= now_ts - window_days * DAY
+
+    age = (now_ts - table.last_activity) / DAY
+    open_age = np.where(open_cards & ~np.isnan(age), age, np.nan)
+    stale = open_age > stale_days
+    known_age = ~np.isnan(open_age)
+    stalest = np.argsort(-np.nan_to_num(open_age, nan=-np.inf), kind='stable')[:min(STALEST_CARDS, int(known_age.sum()))]
+
+    return {
+        'cardCount': len(table),
+        'openCards': int(open_cards.sum()),
+        'doneCards': int(done.sum()),
+        'cycleTimeDays': {
+            'count': int(cycle.size),
+            'median': _round(np.median(cycle)) if cycle.size else None,
+            'mean': _round(cycle.mean()) if cycle.size else None,
+            'p85': _round(np.percentile(cycle, 85)) if cycle.size else None,
+        },
+        'overdueCards': int(overdue.sum()),
+        'overdueRatio': _round(overdue.sum() / has_due.sum()) if has_due.any() else None,
+        'wipByList': {name: int(count) for name, count in zip(wip_lists, wip_counts)},
+        'commentVelocity': {
+            'windowDays': window_days,
+            'commentsInWindow': int(recent.sum()),
+            'perDay': _round(recent.sum() / window_days),
+            'perOpenCard': _round(recent.sum() / open_cards.sum()) if open_cards.any() else None,
+        },
+        'staleness': {
+            'thresholdDays': stale_days,
+            'staleCards': int(stale.sum()),
+            'medianDaysSinceActivity': _round(np.median(open_age[known_age])) if known_age.any() else None,
+            'stalest': _stalest(table, open_age, stalest),
+        },
+    }
+
+
+def _stalest(table: CardTable, age: np.ndarray, indexes: np.ndarray) -> List[dict]:
+    return [
+        {'name': table.names[index], 'list': table.lists[index], 'daysSinceActivity': _round(age[index])}
+        for index in indexes
+    ]
@@ -0,0 +1,188 @@
+"""Thin Trello REST helpers shared by the Trello tools.
+
+The helpers here sit on top of the pooled session in
+:mod:`project_planning_crew.tools.http_session` and hold the request logic
+that is more involved than a single GET, such as fetching many cards at
+once through Trello's ``/1/batch`` endpoint or paging through a large
+board without holding it in memory.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional
+
+import requests
+
+from project_planning_crew.tools.http_session import get_session, get_timeout
+from project_planning_crew.tools.trello_config import setting
+
+# Trello's batch endpoint accepts at most ten GET routes per request.
+BATCH_LIMIT = 10
+DEFAULT_BATCH_WORKERS = 4
+# Largest page Trello returns for card and action listings.
+DEFAULT_PAGE_SIZE = 1000
+CARD_FIELDS = 'name,idList,due,dueComplete,dateLastActivity,labels'
+
+
+class TrelloAPIError(Exception):
+    """Raised when a paged Trello request fails and the listing cannot continue."""
+
+
+def base_url() -> str:
+    """Return the Trello API base URL from the bound config, ``DLAI_TRELLO_BASE_URL`` or the config file."""
+    return setting('base_url')
+
+
+def batch_workers() -> int:
+    """Return ``TRELLO_BATCH_WORKERS``, or the default when it is unset or not a positive integer."""
+    try:
+        workers = int(os.getenv('TRELLO_BATCH_WORKERS', DEFAULT_BATCH_WORKERS))
+    except ValueError:
+        return DEFAULT_BATCH_WORKERS
+    return workers if workers > 0 else DEFAULT_BATCH_WORKERS
+
+
+def parse_card_ids(card_ids) -> List[str]:
+    """Normalise card IDs given as a list or a comma/whitespace separated string.
+
+    Duplicates are dropped while keeping the first-seen order.
+    """
+    if isinstance(card_ids, str):
+        card_ids = card_ids.replace(',', ' ').split()
+    seen = {}
+    for card_id in card_ids:
+        card_id = str(card_id).strip()
+        if card_id:
+            seen.setdefault(card_id, None)
+    return list(seen)
+
+
+def _chunks(items: List[str], size: int) -> Iterable[List[str]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _fetch_batch(card_ids: List[str], api_key: str, api_token: str) -> List[dict]:
+    """Fetch up to ``BATCH_LIMIT`` cards with a single ``/1/batch`` request."""
+    query = {
+        'key': api_key,
+        'token': api_token,
+        'urls': ','.join(f"/cards/{card_id}" for card_id in card_ids),
+    }
+    try:
+        response = get_session().get(f"{base_url()}/1/batch", params=query, timeout=get_timeout())
+    except requests.RequestException as error:
+        return [{'id': card_id, 'error': str(error)} for card_id in card_ids]
+
+    if response.status_code != 200:
+        return [{'id': card_id, 'error': f"HTTP {response.status_code}"} for card_id in card_ids]
+
+    cards = []
+    # Each batch entry is keyed by the status code of its own sub-request,
+    # e.g. {"200": {...card...}} or {"404": "could not find the card"}.
+    for card_id, entry in zip(card_ids, response.json()):
+        if '200' in entry:
+            cards.append(entry['200'])
+        else:
+            status, message = next(iter(entry.items()))
+            cards.append({'id': card_id, 'error': f"HTTP {status}: {message}"})
+    return cards
+
+
+def fetch_cards(card_ids, api_key: str, api_token: str, max_workers: int = DEFAULT_BATCH_WORKERS) -> List[dict]:
+    """Fetch many cards in as few round trips as possible.
+
+    Card IDs are split into batches of ``BATCH_LIMIT`` and the batches are
+    sent concurrently over a bounded worker pool.
+
+    Args:
+        card_ids: Card IDs as a list or a comma separated string.
+        api_key: Trello API key.
+        api_token: Trello API token.
+        max_workers: Maximum number of batch requests in flight.
+
+    Returns:
+        list: One card payload per requested ID, in request order. Cards that
+        could not be fetched are returned as ``{'id': ..., 'error': ...}``.
+    """
+    batches = list(_chunks(parse_card_ids(card_ids), BATCH_LIMIT))
+    if not batches:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+        results = executor.map(lambda batch: _fetch_batch(batch, api_key, api_token), batches)
+    return [card for batch in results for card in batch]
+
+
+def _get_json(path: str, params: dict):
+    """GET ``path`` from the Trello API and return the decoded JSON body."""
+    try:
+        response = get_session().get(f"{base_url()}{path}", params=params, timeout=get_timeout())
+    except requests.RequestException as error:
+        raise TrelloAPIError(f"GET {path} failed: {error}") from error
+    if response.status_code != 200:
+        raise TrelloAPIError(f"GET {path} returned HTTP {response.status_code}")
+    return response.json()
+
+
+def iter_lists(board_id: str, api_key: str, api_token: str) -> Iterator[dict]:
+    """Yield the open lists of a board as ``{'id', 'name'}`` dicts."""
+    params = {'key': api_key, 'token': api_token, 'fields': 'name', 'filter': 'open'}
+    yield from _get_json(f"/1/boards/{board_id}/lists", params)
+
+
+def iter_list_cards(list_id: str, api_key: str, api_token: str, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[dict]:
+    """Yield every card in a list, ``page_size`` cards per request.
+
+    Trello IDs grow with creation time, so the smallest ID of a page is the
+    ``before`` cursor for the next one.
+    """
+    params = {'key': api_key, 'token': api_token, 'fields': CARD_FIELDS, 'limit': page_size}
+    while True:
+        page = _get_json(f"/1/lists/{list_id}/cards", params)
+        yield from page
+        if len(page) < page_size:
+            return
+        params = dict(params, before=min(card['id'] for card in page))
+
+
+def iter_board_cards(board_id: str, api_key: str, api_token: str, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[dict]:
+    """Yield every card on a board list by list, tagging each with its list name."""
+    for trello_list in iter_lists(board_id, api_key, api_token):
+        for card in iter_list_cards(trello_list['id'], api_key, api_token, page_size):
+            card['listName'] = trello_list['name']
+            yield card
+
+
+def iter_actions(
+    board_id: str,
+    api_key: str,
+    api_token: str,
+    action_filter: str = 'all',
+    since: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[dict]:
+    """Yield the board's actions matching ``action_filter``, newest first.
+
+    Actions are paged with the ``before`` cursor so long histories are not
+    truncated at Trello's per-request limit. ``since`` (an action ID or ISO
+    date) stops the listing at an earlier point in time.
+    """
+    params = {'key': api_key, 'token': api_token, 'filter': action_filter, 'limit': page_size}
+    if since:
+        params['since'] = since
+    while True:
+        page = _get_json(f"/1/boards/{board_id}/actions", params)
+        yield from page
+        if len(page) < page_size:
+            return
+        params = dict(params, before=page[-1]['id'])
+
+
+def iter_comment_actions(
+    board_id: str,
+    api_key: str,
+    api_token: str,
+    since: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[dict]:
+    """Yield the board's ``commentCard`` actions, newest first."""
+    return iter_actions(board_id, api_key, api_token, 'commentCard', since=since, page_size=page_size)
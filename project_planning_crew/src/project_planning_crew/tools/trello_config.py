@@ -0,0 +1,93 @@
+"""Trello credentials and endpoint, resolved when a tool makes a call.
+
+Nothing here runs at import time, so the crew can be imported, warmed up
+and forked into a worker pool before any credentials exist. Each setting is
+looked up in this order, and the first value found wins:
+
+1. a value injected into the tool (``BoardDataFetcherTool(api_key=...)``);
+2. the config bound to the process with :func:`bind_config`, e.g. by a
+   worker after it has been assigned a tenant;
+3. the environment (``TRELLO_API_KEY``, ``TRELLO_API_TOKEN``,
+   ``TRELLO_BOARD_ID``, ``DLAI_TRELLO_BASE_URL``);
+4. the JSON file named by ``TRELLO_CONFIG_FILE``, with the keys
+   ``api_key``, ``api_token``, ``board_id`` and ``base_url``.
+"""
+import json
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+DEFAULT_BASE_URL = 'https://api.trello.com'
+ENV_VARS = {
+    'api_key': 'TRELLO_API_KEY',
+    'api_token': 'TRELLO_API_TOKEN',
+    'board_id': 'TRELLO_BOARD_ID',
+    'base_url': 'DLAI_TRELLO_BASE_URL',
+}
+
+_bound: Optional['TrelloConfig'] = None
+_file_cache: Dict[Tuple[str, float], dict] = {}
+_lock = threading.Lock()
+
+
+class TrelloConfigError(Exception):
+    """Raised when a Trello setting a tool needs is not configured anywhere."""
+
+
+@dataclass(frozen=True)
+class TrelloConfig:
+    """Trello settings for one tenant; unset fields fall through to the next source."""
+    api_key: Optional[str] = None
+    api_token: Optional[str] = None
+    board_id: Optional[str] = None
+    base_url: Optional[str] = None
+
+    def require(self, *names: str) -> 'TrelloConfig':
+        """Return self, or raise TrelloConfigError naming every missing setting."""
+        missing = [ENV_VARS[name] for name in names if not getattr(self, name)]
+        if missing:
+            raise TrelloConfigError(f"Trello is not configured: set {', '.join(missing)}")
+        return self
+
+
+def bind_config(config: Optional[TrelloConfig]) -> None:
+    """Bind ``config`` to this process, or clear the binding with None."""
+    global _bound
+    _bound = config
+
+
+def _file_settings() -> dict:
+    path = os.getenv('TRELLO_CONFIG_FILE', '')
+    if not path:
+        return {}
+    try:
+        key = (path, os.path.getmtime(path))
+    except OSError:
+        return {}
+    with _lock:
+        if key not in _file_cache:
+            with open(path, encoding='utf-8') as handle:
+                settings = json.load(handle)
+            _file_cache.clear()
+            _file_cache[key] = {name: settings.get(name) for name in ENV_VARS}
+        return _file_cache[key]
+
+
+def setting(name: str, override: Optional[str] = None) -> Optional[str]:
+    """Resolve one setting through the injected, bound, environment and file sources."""
+    if override:
+        return override
+    bound = _bound
+    if bound is not None and getattr(bound, name):
+        return getattr(bound, name)
+    value = os.getenv(ENV_VARS[name]) or _file_settings().get(name)
+    if not value and name == 'base_url':
+        return DEFAULT_BASE_URL
+    return value
+
+
+def resolve_config(**overrides: Optional[str]) -> TrelloConfig:
+    """Return the effective config, with ``overrides`` taking precedence over every source."""
+    return TrelloConfig(**{name: setting(name, overrides.get(name)) for name in ENV_VARS})
+
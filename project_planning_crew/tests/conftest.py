@@ -0,0 +1,77 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from crew_common import run_mode
+from project_planning_crew.tools import http_session
+
+
+class StubTrelloServer:
+    """Local Trello API stand-in.
+
+    Tests register a handler per path with ``route``; a handler receives the
+    parsed query string and returns ``(status, payload)``. Every request is
+    recorded in ``requests`` as ``(path, query)``.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+                stub.requests.append((parsed.path, query))
+                handler = stub.routes.get(parsed.path)
+                status, payload = handler(query) if handler else (404, {'message': 'not found'})
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def route(self, path, handler):
+        self.routes[path] = handler
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def trello_server(monkeypatch):
+    """Start a stub Trello API and point the tools at it"""
+    server = StubTrelloServer()
+    server.start()
+    monkeypatch.setenv('DLAI_TRELLO_BASE_URL', server.url)
+    monkeypatch.setenv('TRELLO_HTTP_MAX_RETRIES', '0')
+    http_session.reset_session()
+    yield server
+    http_session.reset_session()
+    server.stop()
+
+
+@pytest.fixture(autouse=True)
+def crew_log_file(tmp_path, monkeypatch):
+    """Write the run-mode log under tmp_path instead of logs/ in the working directory"""
+    monkeypatch.setenv('CREW_LOG_FILE', str(tmp_path / 'crew.log'))
+    yield
+    run_mode.shutdown_logging()
@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+
+from project_planning_crew.tools.board_digest import build_digest, project_card
+from project_planning_crew.tools.board_fetcher_tool import BoardDataFetcherTool
+
+NOW = datetime(2024, 8, 20, tzinfo=timezone.utc)
+
+COMMENT = {
+    'id': 'a1',
+    'type': 'commentCard',
+    'date': '2024-08-19T21:58:57.683Z',
+    'data': {'text': 'Blocked on review', 'card': {'id': 'c2', 'shortLink': 'K3abXIMm'}, 'board': {'id': 'b1'}},
+    'limits': {'reactions': {'perAction': {'status': 'ok', 'disableAt': 900}}},
+    'memberCreator': {'fullName': 'Joao Moura', 'avatarUrl': 'https://trello-members.s3.amazonaws.com/x'},
+}
+
+CARDS = [
+    {'id': 'c1', 'name': 'Scaffold UI', 'idList': 'l1', 'due': None, 'dateLastActivity': '2024-08-19T00:00:00.000Z',
+     'labels': [], 'attachments': [], 'actions': []},
+    {'id': 'c2', 'name': 'Approve planning', 'idList': 'l2', 'due': '2024-08-16T21:58:00.000Z',
+     'dateLastActivity': '2024-08-19T21:58:57.697Z', 'labels': [{'id': 'x', 'name': 'Urgent', 'color': 'red', 'uses': 1}],
+     'attachments': [], 'actions': [COMMENT]},
+    {'id': 'c3', 'name': 'Old research', 'idList': 'l2', 'due': '2024-07-01T00:00:00.000Z', 'dueComplete': True,
+     'dateLastActivity': '2024-07-01T00:00:00.000Z', 'labels': [], 'attachments': [], 'actions': []},
+]
+
+
+class TestBoardDigest:
+    """Test suite for the compact board digest"""
+
+    def test_card_projection_drops_trello_noise(self):
+        """Test that a card keeps only the compact schema and its comments"""
+        assert project_card(CARDS[1]) == {
+            'id': 'c2',
+            'name': 'Approve planning',
+            'due': '2024-08-16T21:58:00.000Z',
+            'labels': ['Urgent'],
+            'lastActivity': '2024-08-19T21:58:57.697Z',
+            'comments': [{'text': 'Blocked on review', 'author': 'Joao Moura', 'date': '2024-08-19T21:58:57.683Z'}],
+        }
+
+    def test_cards_are_grouped_by_list_with_aggregates(self):
+        """Test that list counts, overdue and stale cards are computed in code"""
+        digest = build_digest(CARDS, {'l1': 'In Progress', 'l2': 'TODO'}, now=NOW)
+
+        assert (digest['cardCount'], digest['commentCount'], digest['overdue'], digest['stale']) == (3, 1, 1, 1)
+        todo = digest['lists'][1]
+        assert [todo['name'], todo['cardCount'], todo['overdue'], todo['stale']] == ['TODO', 2, 1, 1]
+        assert todo['cards'][0]['overdue'] is True
+        assert 'overdue' not in todo['cards'][1]
+
+    def test_digest_is_deterministic(self):
+        """Test that the same board always yields the same digest"""
+        assert build_digest(CARDS, now=NOW) == build_digest(CARDS, now=NOW)
+        assert [group['name'] for group in build_digest(CARDS, now=NOW)['lists']] == ['l1', 'l2']
+
+    def test_board_tool_returns_the_digest(self, trello_server):
+        """Test that the board data fetcher hands the agent a digest instead of raw JSON"""
+        trello_server.route('/1/boards/b1/cards', lambda query: (200, CARDS))
+        trello_server.route('/1/boards/b1/lists', lambda query: (200, [{'id': 'l1', 'name': 'In Progress'}, {'id': 'l2', 'name': 'TODO'}]))
+
+        digest = BoardDataFetcherTool(api_key='k', api_token='t', board_id='b1', snapshot_path='')._run()
+
+        assert [group['name'] for group in digest['lists']] == ['In Progress', 'TODO']
+        assert 'memberCreator' not in str(digest)
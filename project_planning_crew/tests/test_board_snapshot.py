@@ -0,0 +1,131 @@
+import pytest
+
+from project_planning_crew.tools.board_snapshot import BoardSnapshotStore, sync_board
+from project_planning_crew.tools.trello_client import TrelloAPIError
+
+
+class FakeBoard:
+    """Mutable Trello board served through the stub server"""
+
+    def __init__(self, server):
+        self.lists = [{'id': 'todo', 'name': 'TODO'}, {'id': 'done', 'name': 'Done'}]
+        self.cards = {}
+        self.actions = []
+        self.next_action = 0
+        server.route('/1/boards/board/lists', lambda query: (200, self.lists))
+        for trello_list in self.lists:
+            server.route(f"/1/lists/{trello_list['id']}/cards",
+                         lambda query, list_id=trello_list['id']: (200, [
+                             card for card in self.cards.values() if card['idList'] == list_id]))
+        server.route('/1/boards/board/actions', self.serve_actions)
+        server.route('/1/batch', self.serve_batch)
+
+    def act(self, action_type, card_id, text=None):
+        self.next_action += 1
+        action = {'id': f"action{self.next_action:04d}", 'type': action_type,
+                  'date': f"2024-08-{self.next_action:02d}T00:00:00.000Z", 'data': {'card': {'id': card_id}}}
+        if text:
+            action['data']['text'] = text
+        self.actions.append(action)
+        return action
+
+    def put_card(self, card_id, list_id, name, day):
+        self.cards[card_id] = {'id': card_id, 'idList': list_id, 'name': name,
+                               'dateLastActivity': f"2024-08-{day:02d}T00:00:00.000Z"}
+
+    def serve_actions(self, query):
+        types = query['filter'].split(',')
+        actions = [action for action in reversed(self.actions)
+                   if query['filter'] == 'all' or action['type'] in types]
+        if 'since' in query:
+            actions = [action for action in actions if action['id'] > query['since']]
+        return 200, actions[:int(query['limit'])]
+
+    def serve_batch(self, query):
+        entries = []
+        for route in query['urls'].split(','):
+            card = self.cards.get(route.rsplit('/', 1)[-1])
+            entries.append({'200': card} if card else {'404': 'could not find the card'})
+        return 200, entries
+
+
+class TestBoardSnapshot:
+    """Test suite for the incremental Trello board snapshot"""
+
+    @pytest.fixture
+    def board(self, trello_server):
+        board = FakeBoard(trello_server)
+        board.put_card('card1', 'todo', 'Write spec', 1)
+        board.put_card('card2', 'todo', 'Build app', 1)
+        board.act('createCard', 'card1')
+        board.act('createCard', 'card2')
+        board.act('commentCard', 'card1', 'spec is blocked')
+        return board
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        with BoardSnapshotStore(str(tmp_path / 'snapshot.db')) as store:
+            yield store
+
+    def test_first_sync_downloads_everything(self, board, store):
+        """Test that the first sync stores all cards, comments and a watermark"""
+        stats = sync_board(store, 'board', 'key', 'token')
+
+        assert stats == {'mode': 'full', 'actions': 1, 'cardsFetched': 2}
+        assert store.watermark('board') == 'action0003'
+        cards = {card['id']: card for card in store.cards_with_comments('board')}
+        assert cards['card1']['listName'] == 'TODO'
+        assert [action['data']['text'] for action in cards['card1']['actions']] == ['spec is blocked']
+
+    def test_second_sync_only_fetches_changes(self, board, store, trello_server):
+        """Test that an incremental sync only re-fetches touched cards"""
+        sync_board(store, 'board', 'key', 'token')
+        board.put_card('card2', 'done', 'Build app', 5)
+        board.act('updateCard', 'card2')
+        board.act('commentCard', 'card2', 'shipped')
+        trello_server.requests.clear()
+
+        stats = sync_board(store, 'board', 'key', 'token')
+
+        assert stats == {'mode': 'incremental', 'actions': 2, 'cardsFetched': 1}
+        assert trello_server.requests[1][0] == '/1/batch'
+        assert trello_server.requests[1][1]['urls'] == '/cards/card2'
+        assert not any(path.startswith('/1/lists/') for path, _ in trello_server.requests)
+        cards = {card['id']: card for card in store.cards_with_comments('board')}
+        assert cards['card2']['listName'] == 'Done'
+        assert len(cards['card1']['actions']) == 1
+        assert [action['data']['text'] for action in cards['card2']['actions']] == ['shipped']
+        assert store.watermark('board') == 'action0005'
+
+    def test_deleted_cards_are_removed(self, board, store):
+        """Test that deleted cards and their comments leave the snapshot"""
+        sync_board(store, 'board', 'key', 'token')
+        del board.cards['card1']
+        board.act('deleteCard', 'card1')
+
+        sync_board(store, 'board', 'key', 'token')
+
+        assert [card['id'] for card in store.cards_with_comments('board')] == ['card2']
+        assert list(store.iter_comments('board')) == []
+
+    def test_no_changes_makes_one_request(self, board, store, trello_server):
+        """Test that an up-to-date snapshot costs a single actions request"""
+        sync_board(store, 'board', 'key', 'token')
+        trello_server.requests.clear()
+
+        stats = sync_board(store, 'board', 'key', 'token')
+
+        assert stats == {'mode': 'incremental', 'actions': 0, 'cardsFetched': 0}
+        assert len(trello_server.requests) == 1
+
+    def test_failed_refresh_keeps_watermark(self, board, store, trello_server):
+        """Test that a failed card refresh does not advance the watermark"""
+        sync_board(store, 'board', 'key', 'token')
+        board.act('updateCard', 'card2')
+        trello_server.route('/1/batch', lambda query: (500, {'message': 'boom'}))
+
+        with pytest.raises(TrelloAPIError):
+            sync_board(store, 'board', 'key', 'token')
+
+        assert store.watermark('board') == 'action0003'
+        assert len(store.cards_with_comments('board')) == 2
@@ -0,0 +1,90 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from project_planning_crew.tools import trello_client
+from project_planning_crew.tools.board_summary import BoardSummary, summarize_board
+
+NOW = datetime(2024, 8, 20, tzinfo=timezone.utc)
+
+
+def paged(items, query, key='id', newest_first=False):
+    """Serve ``items`` honouring Trello's ``limit`` and ``before`` parameters"""
+    if 'before' in query:
+        items = [item for item in items if item[key] < query['before']]
+    if newest_first:
+        items = sorted(items, key=lambda item: item[key], reverse=True)
+    return 200, items[:int(query['limit'])]
+
+
+def make_board(server, cards_per_list, comments):
+    lists = [{'id': f"list{i}", 'name': f"List {i}"} for i in range(len(cards_per_list))]
+    server.route('/1/boards/board/lists', lambda query: (200, lists))
+    for trello_list, count in zip(lists, cards_per_list):
+        cards = [
+            {'id': f"{trello_list['id']}-card{n:04d}", 'name': f"Card {n}", 'idList': trello_list['id'],
+             'due': '2024-08-01T00:00:00.000Z' if n % 2 else None, 'labels': []}
+            for n in range(count)
+        ]
+        server.route(f"/1/lists/{trello_list['id']}/cards", lambda query, cards=cards: paged(cards, query, newest_first=True))
+    actions = [
+        {'id': f"action{n:04d}", 'date': f"2024-08-{n % 28 + 1:02d}",
+         'data': {'text': f"comment {n}", 'card': {'name': 'Card 0'}},
+         'memberCreator': {'fullName': 'Ada'}}
+        for n in range(comments)
+    ]
+    server.route('/1/boards/board/actions', lambda query: paged(actions, query, newest_first=True))
+
+
+class TestBoardPaging:
+    """Test suite for paged board ingestion"""
+
+    def test_cards_are_paged_per_list(self, trello_server):
+        """Test that every card is yielded once across pages and lists"""
+        make_board(trello_server, [5, 2], 0)
+
+        cards = list(trello_client.iter_board_cards('board', 'key', 'token', page_size=2))
+
+        assert len(cards) == 7
+        assert len({card['id'] for card in cards}) == 7
+        assert {card['listName'] for card in cards} == {'List 0', 'List 1'}
+        list0_calls = [path for path, _ in trello_server.requests if path == '/1/lists/list0/cards']
+        assert len(list0_calls) == 3
+
+    def test_comments_are_paged_with_before_cursor(self, trello_server):
+        """Test that comment actions beyond one page are not truncated"""
+        make_board(trello_server, [], 5)
+
+        actions = list(trello_client.iter_comment_actions('board', 'key', 'token', page_size=2))
+
+        assert [action['id'] for action in actions] == [f"action{n:04d}" for n in range(4, -1, -1)]
+
+    def test_failed_page_raises(self, trello_server):
+        """Test that a failed page stops the listing with a TrelloAPIError"""
+        with pytest.raises(trello_client.TrelloAPIError):
+            list(trello_client.iter_board_cards('missing', 'key', 'token'))
+
+
+class TestBoardSummary:
+    """Test suite for the memory-bounded board summary"""
+
+    def test_summary_is_bounded(self, trello_server):
+        """Test that counts cover the whole board while samples stay capped"""
+        make_board(trello_server, [30, 3], 12)
+
+        summary = summarize_board('board', 'key', 'token', page_size=7,
+                                  max_cards_per_list=5, max_comments=4, now=NOW)
+
+        assert summary['cardCount'] == 33
+        assert summary['commentCount'] == 12
+        assert [len(item['cards']) for item in summary['lists']] == [5, 3]
+        assert [item['overdue'] for item in summary['lists']] == [15, 1]
+        assert [comment['text'] for comment in summary['recentComments']] == [
+            'comment 11', 'comment 10', 'comment 9', 'comment 8']
+
+    def test_completed_cards_are_not_overdue(self):
+        """Test that a past due date marked complete is not counted as overdue"""
+        summary = BoardSummary(now=NOW)
+        summary.add_card({'id': 'a', 'listName': 'Done', 'due': '2024-08-01T00:00:00.000Z', 'dueComplete': True})
+
+        assert summary.as_dict()['lists'][0]['overdue'] == 0
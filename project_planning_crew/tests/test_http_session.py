@@ -0,0 +1,93 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from project_planning_crew.tools import http_session
+
+
+class FlakyTrelloHandler(BaseHTTPRequestHandler):
+    """Stub Trello endpoint that fails a configurable number of times first"""
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    failures = []
+    calls = 0
+
+    def do_GET(self):
+        type(self).calls += 1
+        status = self.failures.pop(0) if self.failures else 200
+        body = b'{"id": "card"}'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpSession:
+    """Test suite for the shared Trello HTTP session"""
+
+    @pytest.fixture
+    def stub_server(self):
+        FlakyTrelloHandler.failures = []
+        FlakyTrelloHandler.calls = 0
+        server = ThreadingHTTPServer(('127.0.0.1', 0), FlakyTrelloHandler)
+        threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+        yield f"http://127.0.0.1:{server.server_port}"
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture(autouse=True)
+    def fresh_session(self):
+        http_session.reset_session()
+        yield
+        http_session.reset_session()
+
+    def test_get_session_is_shared(self):
+        """Test that every caller gets the same pooled session"""
+        assert http_session.get_session() is http_session.get_session()
+
+    def test_pool_size_from_environment(self, monkeypatch):
+        """Test that the pool size is read from TRELLO_HTTP_POOL_SIZE"""
+        monkeypatch.setenv('TRELLO_HTTP_POOL_SIZE', '4')
+        adapter = http_session.get_session().get_adapter('https://api.trello.com')
+
+        assert adapter._pool_maxsize == 4
+
+    def test_invalid_setting_raises(self, monkeypatch):
+        """Test that a non numeric setting is rejected"""
+        monkeypatch.setenv('TRELLO_HTTP_READ_TIMEOUT', 'soon')
+
+        with pytest.raises(ValueError):
+            http_session.get_timeout()
+
+    def test_retries_on_server_errors(self, stub_server):
+        """Test that 429 and 5xx responses are retried until success"""
+        FlakyTrelloHandler.failures = [503, 429]
+        session = http_session.build_session(max_retries=3, backoff_factor=0)
+
+        response = session.get(f"{stub_server}/1/cards/card", timeout=(1, 1))
+
+        assert response.status_code == 200
+        assert FlakyTrelloHandler.calls == 3
+
+    def test_gives_up_after_max_retries(self, stub_server):
+        """Test that the last error response is returned once retries run out"""
+        FlakyTrelloHandler.failures = [500, 500, 500]
+        session = http_session.build_session(max_retries=1, backoff_factor=0)
+
+        response = session.get(f"{stub_server}/1/cards/card", timeout=(1, 1))
+
+        assert response.status_code == 500
+        assert FlakyTrelloHandler.calls == 2
+
+    def test_connection_error_surfaces_as_request_exception(self):
+        """Test that an unreachable host raises a requests exception"""
+        session = http_session.build_session(max_retries=0)
+
+        with pytest.raises(requests.RequestException):
+            session.get('http://127.0.0.1:9/1/cards/card', timeout=(0.2, 0.2))
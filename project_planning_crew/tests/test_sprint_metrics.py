@@ -0,0 +1,91 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from project_planning_crew.tools.board_fetcher_tool import SprintMetricsTool
+from project_planning_crew.tools.sprint_metrics import compute_sprint_metrics
+
+NOW = datetime(2024, 8, 20, tzinfo=timezone.utc)
+
+
+def object_id(created: str) -> str:
+    """Build a Trello card ID whose embedded timestamp is ``created``"""
+    seconds = int(datetime.fromisoformat(created).replace(tzinfo=timezone.utc).timestamp())
+    return f"{seconds:08x}0000000000000000"
+
+
+def comment(date: str) -> dict:
+    return {'type': 'commentCard', 'date': date, 'data': {'text': 'update'}}
+
+
+CARDS = [
+    {'id': object_id('2024-08-01'), 'name': 'Ship login', 'idList': 'done', 'due': '2024-08-05T00:00:00.000Z',
+     'dueComplete': True, 'dateLastActivity': '2024-08-05T00:00:00.000Z', 'actions': [comment('2024-08-04T00:00:00.000Z')]},
+    {'id': object_id('2024-08-02'), 'name': 'Ship signup', 'idList': 'done', 'due': None,
+     'dateLastActivity': '2024-08-12T00:00:00.000Z', 'actions': []},
+    {'id': object_id('2024-08-10'), 'name': 'Payments', 'idList': 'doing', 'due': '2024-08-15T00:00:00.000Z',
+     'dateLastActivity': '2024-08-19T00:00:00.000Z', 'actions': [comment('2024-08-18T00:00:00.000Z'), comment('2024-08-19T00:00:00.000Z')]},
+    {'id': object_id('2024-07-01'), 'name': 'Research', 'idList': 'todo', 'due': '2024-09-01T00:00:00.000Z',
+     'dateLastActivity': '2024-07-20T00:00:00.000Z', 'actions': []},
+    {'id': object_id('2024-08-15'), 'name': 'Docs', 'idList': 'todo', 'due': None,
+     'dateLastActivity': '2024-08-16T00:00:00.000Z', 'actions': []},
+]
+LIST_NAMES = {'done': 'Done', 'doing': 'In Progress', 'todo': 'TODO'}
+
+
+class TestSprintMetrics:
+    """Test suite for the deterministic sprint metrics"""
+
+    def test_metrics_are_computed_from_the_cards(self):
+        """Test that every metric matches the numbers worked out by hand"""
+        metrics = compute_sprint_metrics(CARDS, LIST_NAMES, now=NOW)
+
+        assert metrics['cardCount'] == 5
+        assert (metrics['openCards'], metrics['doneCards']) == (3, 2)
+        assert metrics['cycleTimeDays'] == {'count': 2, 'median': 7.0, 'mean': 7.0, 'p85': 9.1}
+        assert (metrics['overdueCards'], metrics['overdueRatio']) == (1, 0.5)
+        assert metrics['wipByList'] == {'In Progress': 1, 'TODO': 2}
+        assert metrics['commentVelocity'] == {'windowDays': 7, 'commentsInWindow': 2, 'perDay': 0.29, 'perOpenCard': 0.67}
+        assert metrics['staleness']['staleCards'] == 1
+        assert metrics['staleness']['medianDaysSinceActivity'] == 4.0
+        assert metrics['staleness']['stalest'][0] == {'name': 'Research', 'list': 'TODO', 'daysSinceActivity': 31.0}
+
+    def test_results_are_deterministic(self):
+        """Test that the same board always gives the same metrics"""
+        assert compute_sprint_metrics(CARDS, LIST_NAMES, now=NOW) == compute_sprint_metrics(list(CARDS), LIST_NAMES, now=NOW)
+
+    def test_empty_board(self):
+        """Test that an empty board gives zero counts and no averages"""
+        metrics = compute_sprint_metrics([], now=NOW)
+
+        assert metrics['cardCount'] == 0
+        assert metrics['cycleTimeDays']['median'] is None
+        assert metrics['overdueRatio'] is None
+        assert metrics['staleness']['stalest'] == []
+
+    @pytest.mark.parametrize('done_lists, done_cards', [(('done',), 2), (('done', 'in progress'), 3)])
+    def test_done_lists_are_configurable(self, done_lists, done_cards):
+        """Test that the lists holding finished cards can be chosen, ignoring case"""
+        assert compute_sprint_metrics(CARDS, LIST_NAMES, now=NOW, done_lists=done_lists)['doneCards'] == done_cards
+
+    def test_tool_uses_board_list_names(self, trello_server, monkeypatch):
+        """Test that the tool fetches the board and reports WIP by list name"""
+        monkeypatch.setenv('TRELLO_API_KEY', 'key')
+        monkeypatch.setenv('TRELLO_API_TOKEN', 'token')
+        monkeypatch.setenv('TRELLO_BOARD_ID', 'b1')
+        trello_server.route('/1/boards/b1/cards', lambda query: (200, CARDS))
+        trello_server.route('/1/boards/b1/lists', lambda query: (200, [{'id': key, 'name': name} for key, name in LIST_NAMES.items()]))
+
+        metrics = SprintMetricsTool()._run()
+
+        assert metrics['cardCount'] == 5
+        assert metrics['wipByList'] == {'In Progress': 1, 'TODO': 2}
+
+    def test_tool_reports_missing_credentials_as_a_dict(self, monkeypatch):
+        """Test that an unconfigured tool returns its error in the same type as its metrics"""
+        for name in ('TRELLO_API_KEY', 'TRELLO_API_TOKEN', 'TRELLO_BOARD_ID', 'TRELLO_CONFIG_FILE'):
+            monkeypatch.delenv(name, raising=False)
+
+        result = SprintMetricsTool()._run()
+
+        assert isinstance(result, dict) and 'TRELLO_API_KEY' in result['error']
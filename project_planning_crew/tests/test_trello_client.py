@@ -0,0 +1,66 @@
+import pytest
+
+from project_planning_crew.tools import trello_client
+
+
+def batch_handler(query):
+    """Answer a /1/batch request the way Trello does, one entry per route"""
+    entries = []
+    for route in query['urls'].split(','):
+        card_id = route.rsplit('/', 1)[-1]
+        if card_id.startswith('missing'):
+            entries.append({'404': 'could not find the card'})
+        else:
+            entries.append({'200': {'id': card_id, 'name': f"Card {card_id}"}})
+    return 200, entries
+
+
+class TestFetchCards:
+    """Test suite for batched Trello card fetching"""
+
+    def test_parse_card_ids(self):
+        """Test that IDs are split, trimmed and de-duplicated in order"""
+        assert trello_client.parse_card_ids('a, b,,c a') == ['a', 'b', 'c']
+        assert trello_client.parse_card_ids(['x', ' y ', 'x']) == ['x', 'y']
+
+    def test_fetches_in_batches_of_ten(self, trello_server):
+        """Test that 25 cards cost three batch requests and keep their order"""
+        trello_server.route('/1/batch', batch_handler)
+        card_ids = [f"card{i}" for i in range(25)]
+
+        cards = trello_client.fetch_cards(card_ids, 'key', 'token', max_workers=2)
+
+        assert [card['id'] for card in cards] == card_ids
+        assert len(trello_server.requests) == 3
+        assert all(path == '/1/batch' for path, _ in trello_server.requests)
+        assert all(query['key'] == 'key' for _, query in trello_server.requests)
+
+    def test_missing_card_is_reported_per_card(self, trello_server):
+        """Test that a failed sub-request only marks its own card as an error"""
+        trello_server.route('/1/batch', batch_handler)
+
+        cards = trello_client.fetch_cards('card1,missing2', 'key', 'token')
+
+        assert cards[0] == {'id': 'card1', 'name': 'Card card1'}
+        assert cards[1]['id'] == 'missing2'
+        assert '404' in cards[1]['error']
+
+    def test_failed_batch_marks_every_card(self, trello_server):
+        """Test that a failed batch request reports an error for each card"""
+        trello_server.route('/1/batch', lambda query: (401, {'message': 'invalid token'}))
+
+        cards = trello_client.fetch_cards(['a', 'b'], 'key', 'token')
+
+        assert cards == [{'id': 'a', 'error': 'HTTP 401'}, {'id': 'b', 'error': 'HTTP 401'}]
+
+    def test_no_ids_makes_no_requests(self, trello_server):
+        """Test that an empty ID list returns immediately"""
+        assert trello_client.fetch_cards('', 'key', 'token') == []
+        assert trello_server.requests == []
+
+    @pytest.mark.parametrize('value, workers', [('8', 8), ('', 4), ('lots', 4), ('0', 4), ('-2', 4)])
+    def test_batch_workers_setting(self, monkeypatch, value, workers):
+        """Test that TRELLO_BATCH_WORKERS falls back to the default unless it is a positive integer"""
+        monkeypatch.setenv('TRELLO_BATCH_WORKERS', value)
+
+        assert trello_client.batch_workers() == workers
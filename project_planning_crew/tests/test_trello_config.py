@@ -0,0 +1,77 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from project_planning_crew.tools import trello_config
+from project_planning_crew.tools.card_fetcher_tool import CardBatchDataFetcherTool, CardDataFetcherTool
+from project_planning_crew.tools.trello_config import TrelloConfig, bind_config, resolve_config
+
+
+@pytest.fixture(autouse=True)
+def unconfigured(monkeypatch):
+    """Start every test with no Trello settings in the environment or bound to the process"""
+    for name in (*trello_config.ENV_VARS.values(), 'TRELLO_CONFIG_FILE'):
+        monkeypatch.delenv(name, raising=False)
+    bind_config(None)
+    yield
+    bind_config(None)
+
+
+class TestTrelloConfig:
+    """Test suite for call-time Trello configuration"""
+
+    def test_crew_imports_without_credentials(self):
+        """Test that importing the crew no longer needs Trello credentials"""
+        env = {name: value for name, value in os.environ.items() if not name.startswith('TRELLO_')}
+        env.update({'OTEL_SDK_DISABLED': 'true', 'OPENAI_API_KEY': 'test',
+                    'PYTHONPATH': os.pathsep.join(os.path.join(os.path.dirname(__file__), '..', path)
+                                                  for path in ('src', os.path.join('..', 'crew_common', 'src')))})
+        result = subprocess.run([sys.executable, '-c', 'import project_planning_crew.crew'],
+                                env=env, capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+
+    def test_sources_are_searched_in_order(self, monkeypatch, tmp_path):
+        """Test that injected values beat the bound config, which beats the environment and the file"""
+        config_file = tmp_path / 'trello.json'
+        config_file.write_text(json.dumps({'api_key': 'file-key', 'api_token': 'file-token', 'board_id': 'file-board'}))
+        monkeypatch.setenv('TRELLO_CONFIG_FILE', str(config_file))
+        monkeypatch.setenv('TRELLO_API_TOKEN', 'env-token')
+        bind_config(TrelloConfig(board_id='bound-board'))
+
+        config = resolve_config(api_key='injected-key')
+
+        assert config == TrelloConfig(api_key='injected-key', api_token='env-token', board_id='bound-board',
+                                      base_url=trello_config.DEFAULT_BASE_URL)
+
+    def test_missing_settings_are_named(self):
+        """Test that the error lists the environment variables to set"""
+        with pytest.raises(trello_config.TrelloConfigError, match='TRELLO_API_KEY, TRELLO_API_TOKEN'):
+            resolve_config().require('api_key', 'api_token')
+
+    def test_unconfigured_tool_reports_an_error(self):
+        """Test that calling a tool without credentials returns an error instead of raising"""
+        result = json.loads(CardDataFetcherTool()._run(card_id='c1'))
+
+        assert 'TRELLO_API_KEY' in result['error']
+
+    def test_bound_config_reaches_the_api(self, trello_server):
+        """Test that credentials bound after import are sent with the request"""
+        trello_server.route('/1/cards/c1', lambda query: (200, {'id': 'c1'}))
+        bind_config(TrelloConfig(api_key='tenant-key', api_token='tenant-token'))
+
+        assert CardDataFetcherTool()._run(card_id='c1') == {'id': 'c1'}
+        assert trello_server.requests[-1][1] == {'key': 'tenant-key', 'token': 'tenant-token'}
+
+    def test_injected_credentials_pin_a_tool_to_one_tenant(self, trello_server):
+        """Test that credentials passed to a tool override the bound config"""
+        trello_server.route('/1/batch', lambda query: (200, [{'200': {'id': 'c1'}}]))
+        bind_config(TrelloConfig(api_key='bound-key', api_token='bound-token'))
+
+        result = CardBatchDataFetcherTool(api_key='tenant-key', api_token='tenant-token')._run(card_ids='c1')
+
+        assert json.loads(result) == [{'id': 'c1'}]
+        assert trello_server.requests[-1][1]['key'] == 'tenant-key'
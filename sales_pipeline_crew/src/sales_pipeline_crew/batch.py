@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+"""Batch entry point for running the Sales Pipeline Crew over many topics.
+
+Topics are read from a text file (one topic per line), a JSONL file (one
+``{"topic": ...}`` object per line) or stdin, and each topic gets its own
+crew run and its own report file. Runs execute concurrently on a bounded
+worker pool, and a requests-per-minute limit spaces out kickoffs so the
+LLM provider's rate limits are respected.
+
+Example:
+
+    sales_pipeline_crew_batch topics.txt --workers 4 --rate 20 --output-dir reports
+"""
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+from crew_common.llm_cache import enable_llm_cache
+from sales_pipeline_crew.crew import SalesPipelineCrewCrew
+
+DEFAULT_WORKERS = 4
+DEFAULT_OUTPUT_DIR = 'reports'
+
+
+def parse_topics(lines: Iterable[str]) -> Iterator[str]:
+    """Yield topics from plain text or JSONL lines, skipping blanks and ``#`` comments.
+
+    Raises:
+        ValueError: A JSONL line is not valid JSON or has no ``topic`` string; the message names the line.
+    """
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if not line.startswith('{'):
+            yield line
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"line {number}: invalid JSON ({error.msg})") from None
+        if not isinstance(record, dict) or not isinstance(record.get('topic'), str):
+            raise ValueError(f'line {number}: expected an object with a "topic" string')
+        yield record['topic']
+
+
+def read_topics(source: str, stdin: TextIO = sys.stdin) -> List[str]:
+    """Read topics from ``source``, where ``-`` means stdin."""
+    if source == '-':
+        return list(parse_topics(stdin))
+    with open(source, encoding='utf-8') as handle:
+        return list(parse_topics(handle))
+
+
+def report_path(output_dir: str, index: int, topic: str) -> str:
+    """Return a unique, filesystem-safe report path for a topic."""
+    slug = re.sub(r'[^a-z0-9]+', '-', topic.lower()).strip('-')[:60] or 'topic'
+    return str(Path(output_dir) / f"{index:04d}-{slug}.md")
+
+
+class RateLimiter:
+    """Space out calls so at most ``per_minute`` start in any minute.
+
+    Args:
+        per_minute: Allowed starts per minute, or None for no limit.
+    """
+
+    def __init__(self, per_minute: Optional[float] = None):
+        self.interval = 60.0 / per_minute if per_minute else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the caller may start its next call."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def run_topic(topic: str, output_file: str, limiter: RateLimiter) -> dict:
+    """Run one crew for ``topic`` and return its summary row."""
+    limiter.wait()
+    started = time.perf_counter()
+    summary = {'topic': topic, 'report': output_file}
+    try:
+        crew = SalesPipelineCrewCrew(output_file=output_file).crew()
+        crew.kickoff(inputs={'topic': topic})
+        summary['status'] = 'ok'
+        summary['usage'] = crew.usage_metrics or {}
+    except Exception as error:
+        # One failing topic must not take down the rest of the batch
+        summary['status'] = 'error'
+        summary['error'] = f"{type(error).__name__}: {error}"
+    summary['latency_s'] = round(time.perf_counter() - started, 3)
+    return summary
+
+
+def run_batch(
+    topics: Iterable[str],
+    output_dir: str = DEFAULT_OUTPUT_DIR,
+    workers: int = DEFAULT_WORKERS,
+    per_minute: Optional[float] = None,
+) -> List[dict]:
+    """Run the crew once per topic on a bounded worker pool.
+
+    Args:
+        topics: Topics to research.
+        output_dir: Directory that receives one report per topic.
+        workers: Maximum number of crews running at once.
+        per_minute: Maximum crew kickoffs per minute, or None for no limit.
+
+    Returns:
+        list: One summary row per topic, in input order, with status,
+        report path, latency and token usage
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    limiter = RateLimiter(per_minute)
+    jobs = [(topic, report_path(output_dir, index, topic)) for index, topic in enumerate(topics, start=1)]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return list(executor.map(lambda job: run_topic(job[0], job[1], limiter), jobs))
+
+
+def summarize(results: List[dict]) -> dict:
+    """Aggregate per-topic rows into batch totals."""
+    succeeded = [row for row in results if row['status'] == 'ok']
+    latencies = sorted(row['latency_s'] for row in results)
+    return {
+        'topics': len(results),
+        'succeeded': len(succeeded),
+        'failed': len(results) - len(succeeded),
+        'total_tokens': sum(row['usage'].get('total_tokens', 0) for row in succeeded),
+        'max_latency_s': latencies[-1] if latencies else 0.0,
+        'mean_latency_s': round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+    }
+
+
+def run(argv: Optional[List[str]] = None) -> List[dict]:
+    """Command line entry point for batch research runs."""
+    parser = argparse.ArgumentParser(description='Run the Sales Pipeline Crew for many topics.')
+    parser.add_argument('source', help="Text or JSONL file with one topic per line, or '-' for stdin")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='Concurrent crew runs')
+    parser.add_argument('--rate', type=float, default=None, help='Maximum crew kickoffs per minute')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='Directory for per-topic reports')
+    parser.add_argument('--summary', default=None, help='Write per-topic summary rows to this JSONL file')
+    args = parser.parse_args(argv)
+
+    try:
+        topics = read_topics(args.source)
+    except ValueError as error:
+        parser.error(f"{args.source}: {error}")
+
+    enable_llm_cache()
+    results = run_batch(topics, args.output_dir, args.workers, args.rate)
+
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as handle:
+            for row in results:
+                handle.write(json.dumps(row) + '\n')
+    for row in results:
+        tokens = row.get('usage', {}).get('total_tokens', '-')
+        print(f"{row['status']:<5} {row['latency_s']:>8.2f}s {tokens:>8} tokens  {row['topic']}")
+    print(json.dumps(summarize(results)))
+    return results
+
+
+if __name__ == '__main__':
+    run()
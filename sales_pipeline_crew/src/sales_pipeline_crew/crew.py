@@ -10,6 +10,8 @@ The crew consists of two specialized agents:
 """
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
+from crew_common.prepare import prepare_crew, task_names
+from crew_common.run_mode import agent_verbose, crew_verbosity
 
 # Uncomment the following line to use an example of a custom tool
 # from sales_pipeline_crew.tools.custom_tool import MyCustomTool
@@ -28,6 +30,7 @@ class SalesPipelineCrewCrew():
 	Attributes:
 		agents_config (str): Path to agents configuration file with topic templates
 		tasks_config (str): Path to tasks configuration file
+		output_file (str): Path the reporting task writes its markdown report to
 		
 	Note:
 		Agent configurations use {topic} placeholders that can be interpolated
@@ -36,6 +39,9 @@ class SalesPipelineCrewCrew():
 	agents_config = 'config/agents.yaml'
 	tasks_config = 'config/tasks.yaml'
 
+	def __init__(self, output_file: str = 'report.md'):
+		self.output_file = output_file
+
 	@agent
 	def researcher(self) -> Agent:
 		"""Create a senior data researcher agent.
@@ -54,7 +60,7 @@ class SalesPipelineCrewCrew():
 		return Agent(
 			config=self.agents_config['researcher'],
 			# tools=[MyCustomTool()], # Example of custom tool, loaded on the beginning of file
-			verbose=True
+			verbose=agent_verbose()
 		)
 
 	@agent
@@ -74,7 +80,7 @@ class SalesPipelineCrewCrew():
 		"""
 		return Agent(
 			config=self.agents_config['reporting_analyst'],
-			verbose=True
+			verbose=agent_verbose()
 		)
 
 	@task
@@ -97,7 +103,7 @@ class SalesPipelineCrewCrew():
 		"""Create a task for report generation.
 		
 		This task creates detailed reports based on research findings,
-		outputting the results to a markdown file for easy consumption.
+		outputting the results to a markdown file (``output_file``) for easy consumption.
 		
 		Returns:
 			Task: Configured reporting task with markdown file output
@@ -105,7 +111,7 @@ class SalesPipelineCrewCrew():
 		return Task(
 			config=self.tasks_config['reporting_task'],
 			agent=self.reporting_analyst(),
-			output_file='report.md'
+			output_file=self.output_file
 		)
 
 	@crew
@@ -117,11 +123,16 @@ class SalesPipelineCrewCrew():
 		
 		Returns:
 			Crew: Configured sequential crew with researcher and analyst agents
+			
+		Note:
+			Each task's output is streamed to ``runs/<run id>/<task name>.md``
+			while it is generated, and ``output_file`` is replaced atomically
+			once the report is complete.
 		"""
-		return Crew(
+		return prepare_crew(Crew(
 			agents=self.agents, # Automatically created by the @agent decorator
 			tasks=self.tasks, # Automatically created by the @task decorator
 			process=Process.sequential,
-			verbose=2,
+			verbose=crew_verbosity(),
 			# process=Process.hierarchical, # In case you wanna use that instead https://docs.crewai.com/how-to/Hierarchical/
-		)
\ No newline at end of file
+		), 'sales_pipeline_crew', task_names(self), reports=True)
\ No newline at end of file
@@ -5,6 +5,7 @@ This module provides the main execution function for running the Sales Pipeline
 which conducts comprehensive research on specified topics and generates detailed
 analytical reports.
 """
+from crew_common.llm_cache import enable_llm_cache
 from sales_pipeline_crew.crew import SalesPipelineCrewCrew
 
 
@@ -27,6 +28,9 @@ def run():
     Output generated:
     - report.md: Comprehensive research report on the specified topic
     
+    Set LLM_CACHE_MODE (auto, record or replay) to record LLM responses to disk
+    and replay them on identical reruns.
+
     Returns:
         The result of the crew execution containing the research report
         
@@ -39,5 +43,6 @@ def run():
         'topic': 'AI LLMs'
     }
     
+    enable_llm_cache()
     result = SalesPipelineCrewCrew().crew().kickoff(inputs=inputs)
     return result
\ No newline at end of file
@@ -0,0 +1,122 @@
+import io
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sales_pipeline_crew import batch
+
+
+def fake_crew_factory(calls, fail_on=()):
+    """Build a stand-in for SalesPipelineCrewCrew that records its runs"""
+    lock = threading.Lock()
+
+    def factory(output_file):
+        crew = MagicMock()
+
+        def kickoff(inputs):
+            if inputs['topic'] in fail_on:
+                raise RuntimeError('LLM unavailable')
+            with lock:
+                calls.append((inputs['topic'], output_file))
+            crew.usage_metrics = {'total_tokens': 100, 'successful_requests': 2}
+            return 'report'
+
+        crew.kickoff.side_effect = kickoff
+        crew_class = MagicMock()
+        crew_class.crew.return_value = crew
+        return crew_class
+
+    return factory
+
+
+class TestBatchKickoff:
+    """Test suite for the batch topic runner"""
+
+    def test_parse_text_and_jsonl_topics(self):
+        """Test that plain lines and JSONL objects are both accepted"""
+        lines = ['AI LLMs\n', '\n', '# skipped\n', '{"topic": "Robotics"}\n']
+
+        assert list(batch.parse_topics(lines)) == ['AI LLMs', 'Robotics']
+
+    @pytest.mark.parametrize('line, message', [
+        ('{"topic": "Robotics"', 'line 3: invalid JSON'),
+        ('{"name": "Robotics"}', 'line 3: expected an object with a "topic" string'),
+    ])
+    def test_bad_jsonl_line_is_reported_by_number(self, line, message):
+        """Test that a malformed or topic-less JSONL line raises a ValueError naming its line"""
+        with pytest.raises(ValueError, match=message):
+            list(batch.parse_topics(['AI LLMs\n', '\n', line + '\n']))
+
+    def test_read_topics_from_stdin(self):
+        """Test that '-' reads topics from stdin"""
+        assert batch.read_topics('-', stdin=io.StringIO('a\nb\n')) == ['a', 'b']
+
+    def test_report_paths_are_unique_per_topic(self, tmp_path):
+        """Test that topics with the same slug still get separate reports"""
+        first = batch.report_path(str(tmp_path), 1, 'AI / LLMs')
+        second = batch.report_path(str(tmp_path), 2, 'AI LLMs')
+
+        assert first != second
+        assert first.endswith('0001-ai-llms.md')
+
+    def test_each_topic_gets_its_own_report(self, tmp_path):
+        """Test that every topic runs once and writes to its own file"""
+        calls = []
+        with patch('sales_pipeline_crew.batch.SalesPipelineCrewCrew', side_effect=fake_crew_factory(calls)):
+            results = batch.run_batch(['AI LLMs', 'Robotics', 'Quantum'], str(tmp_path), workers=2)
+
+        assert [row['topic'] for row in results] == ['AI LLMs', 'Robotics', 'Quantum']
+        assert all(row['status'] == 'ok' for row in results)
+        assert len({output_file for _, output_file in calls}) == 3
+        assert results[0]['usage']['total_tokens'] == 100
+        assert batch.summarize(results)['total_tokens'] == 300
+
+    def test_failed_topic_does_not_stop_the_batch(self, tmp_path):
+        """Test that a crash is reported for its topic while others complete"""
+        calls = []
+        factory = fake_crew_factory(calls, fail_on={'Robotics'})
+        with patch('sales_pipeline_crew.batch.SalesPipelineCrewCrew', side_effect=factory):
+            results = batch.run_batch(['AI LLMs', 'Robotics'], str(tmp_path))
+
+        assert [row['status'] for row in results] == ['ok', 'error']
+        assert 'LLM unavailable' in results[1]['error']
+        assert batch.summarize(results)['failed'] == 1
+
+    def test_rate_limiter_spaces_calls(self):
+        """Test that the limiter keeps starts at least one interval apart"""
+        limiter = batch.RateLimiter(per_minute=1200)
+        starts = []
+        for _ in range(3):
+            limiter.wait()
+            starts.append(time.monotonic())
+
+        assert starts[2] - starts[0] >= 0.09
+
+    def test_cli_writes_summary(self, tmp_path, capsys):
+        """Test that the command line runner writes a JSONL summary"""
+        topics = tmp_path / 'topics.txt'
+        topics.write_text('AI LLMs\nRobotics\n')
+        summary = tmp_path / 'summary.jsonl'
+        calls = []
+        with patch('sales_pipeline_crew.batch.SalesPipelineCrewCrew', side_effect=fake_crew_factory(calls)):
+            batch.run([str(topics), '--output-dir', str(tmp_path / 'reports'), '--summary', str(summary)])
+
+        rows = [json.loads(line) for line in summary.read_text().splitlines()]
+        assert [row['topic'] for row in rows] == ['AI LLMs', 'Robotics']
+        assert '"succeeded": 2' in capsys.readouterr().out
+
+    def test_cli_rejects_a_bad_topics_file(self, tmp_path, capsys):
+        """Test that the command line fails with a usage error naming the bad line, before any kickoff"""
+        topics = tmp_path / 'topics.jsonl'
+        topics.write_text('{"topic": "AI LLMs"}\n{"title": "Robotics"}\n')
+
+        with patch('sales_pipeline_crew.batch.SalesPipelineCrewCrew') as crew_class:
+            with pytest.raises(SystemExit) as exit_info:
+                batch.run([str(topics)])
+
+        assert exit_info.value.code == 2
+        assert f"{topics}: line 2" in capsys.readouterr().err
+        crew_class.assert_not_called()